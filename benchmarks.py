@@ -0,0 +1,224 @@
+'''
+Benchmarks for both conversion directions, one benchmark per class of input that
+the code handles differently.
+
+    python benchmarks.py                          # run and print the results
+    python benchmarks.py --save baseline.json     # ... and store them as a baseline
+    python benchmarks.py --compare baseline.json  # ... and fail if anything got slower
+    python benchmarks.py --threads 1,2,4,8        # how well conversions scale across threads
+
+Comparisons are only meaningful against a baseline made on the same machine, so no
+baseline is kept in the repo.
+'''
+import argparse
+import json
+import platform
+import sys
+import threading
+import time
+
+import w2n2w
+
+WORD_TO_NUM = {
+    'digits': ['7', '12345', '1000000', '98765432109876'],
+    'word': ['seven', 'nineteen', 'thousand', 'third', 'million'],
+    'magnitudes': [
+        w2n2w.num_to_word(i) for i in (
+            1234, 123456789, 9_876_543_210_123, 10**27 + 463 * 10**12 + 9, 500_000_000_000_000_001
+        )
+    ],
+    'ordinals': ['seventy first', 'one hundred twenty third', 'two thousand and fifth', 'one millionth'],
+    'fractions': ['two thirds', 'three quarters of a million', 'half of a thousand', 'one and a half'],
+    'decimals': ['twenty two point nine one', 'point one', 'three point one four one five nine', '12 point 5'],
+    'negatives': ['negative twelve', 'minus three hundred and six', '-forty two', 'negative two point five'],
+    'huge': ['one million decillion', 'thousand decillion and five', 'nine hundred decillion'],
+    'invalid': ['not a number', 'one point five million', 'five point six point seven', 'point'],
+}
+
+NUM_TO_WORD = {
+    'digits': ['7', '12345', '-98765'],
+    'word': [0, 7, 19, 90, 1000],
+    'magnitudes': [1234, 123456789, 9_876_543_210_123, 10**27 + 463 * 10**12 + 9],
+    'fractions': [0.5, 1 / 3, 0.75, 0.2],
+    'decimals': [1.52, 22.91, 3.14159, 0.001],
+    'negatives': [-12, -306, -0.999, -1234567],
+    'huge': [10**36 + 5, 7**100, 3**1000, 10**66 + 10**33 + 7],
+    'invalid': ['not a num', '100 6', 'one hundred'],
+}
+
+
+def _percentile(samples, fraction):
+    # `samples` must be sorted
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def bench(func, inputs, duration=0.2):
+    '''
+    Calls `func` on each of `inputs` in turn until `duration` seconds have passed.
+
+    Args:
+        func (callable): the function to benchmark
+        inputs (list): the arguments to call it with. Calls that raise ValueError
+            count just like calls that don't
+        duration (float): roughly how long to spend benchmarking
+
+    Returns:
+        dict: 'ops' (calls per second), 'p50' and 'p99' (the latency of a call, in microseconds)
+    '''
+    timer = time.perf_counter
+    samples = []
+    end = timer() + duration
+    while timer() < end:
+        for value in inputs:
+            start = timer()
+            try:
+                func(value)
+            except ValueError:
+                pass
+            samples.append(timer() - start)
+
+    total = sum(samples)
+    samples.sort()
+    return {
+        'ops': len(samples) / total,
+        'p50': _percentile(samples, 0.5) * 1e6,
+        'p99': _percentile(samples, 0.99) * 1e6
+    }
+
+
+def run(duration=0.2, only=None):
+    '''
+    Runs every benchmark.
+
+    Args:
+        duration (float): how long to spend on each benchmark
+        only (str): only run benchmarks whose name contains this
+
+    Returns:
+        dict: maps each benchmark's name, eg: 'word_to_num/ordinals', to its result from `bench`
+    '''
+    w2n2w.disable_cache()
+    results = {}
+    for direction, func, classes in (
+        ('word_to_num', w2n2w.word_to_num, WORD_TO_NUM),
+        ('num_to_word', w2n2w.num_to_word, NUM_TO_WORD)
+    ):
+        for name, inputs in classes.items():
+            name = f'{direction}/{name}'
+            if only and only not in name:
+                continue
+            results[name] = bench(func, inputs, duration)
+    return results
+
+
+def run_threads(thread_counts, duration=0.2):
+    '''
+    Converts the same mix of phrases on more and more threads at once, to see how well the
+    conversions scale. With the GIL they can't run any quicker than on one thread, but on a
+    free-threaded build of Python they should scale with the number of cores.
+
+    Args:
+        thread_counts (list of int): the numbers of threads to try
+        duration (float): how long to spend on each number of threads
+
+    Returns:
+        dict: maps each number of threads to the total conversions per second across all of them
+    '''
+    w2n2w.disable_cache()
+    phrases = [phrase for inputs in WORD_TO_NUM.values() for phrase in inputs]
+    results = {}
+    for count in thread_counts:
+        barrier = threading.Barrier(count + 1)
+        done = [0] * count
+
+        def work(index):
+            barrier.wait()
+            end = time.perf_counter() + duration
+            while time.perf_counter() < end:
+                w2n2w.word_to_num_many(phrases, errors='skip')
+                done[index] += len(phrases)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        results[count] = sum(done) / (time.perf_counter() - start)
+    return results
+
+
+def compare(results, baseline, threshold=0.1):
+    '''
+    Finds the benchmarks that have got slower.
+
+    Args:
+        results (dict): the output of `run`
+        baseline (dict): an earlier output of `run`
+        threshold (float): how much slower a benchmark can get before it counts,
+            as a fraction of the baseline's ops/sec
+
+    Returns:
+        list: (name, baseline ops, current ops) for each benchmark that regressed
+    '''
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]['ops']
+        if result['ops'] < before * (1 - threshold):
+            regressions.append((name, before, result['ops']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark w2n2w')
+    parser.add_argument('-d', '--duration', type=float, default=0.2, help='seconds to spend on each benchmark')
+    parser.add_argument('-k', '--only', help='only run benchmarks whose name contains this')
+    parser.add_argument('--save', metavar='FILE', help='save the results as a baseline')
+    parser.add_argument('--compare', metavar='FILE', help='compare the results against a baseline')
+    parser.add_argument(
+        '-t', '--threshold', type=float, default=0.1,
+        help='fraction of ops/sec a benchmark can lose before it counts as a regression'
+    )
+    parser.add_argument(
+        '--threads', metavar='COUNTS',
+        help='instead of the normal benchmarks, measure how word_to_num scales across this many threads, eg: 1,2,4'
+    )
+    args = parser.parse_args(argv)
+
+    if args.threads:
+        gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+        print(f'Python {platform.python_version()}, GIL {"enabled" if gil else "disabled"}')
+        results = run_threads([int(i) for i in args.threads.split(',')], args.duration)
+        single = results.get(1)
+        print(f'{"threads":<8} {"ops/sec":>12} {"scaling":>8}')
+        for count, ops in results.items():
+            scaling = f'{ops / single:.2f}x' if single else ''
+            print(f'{count:<8} {ops:>12.0f} {scaling:>8}')
+        return 0
+
+    results = run(args.duration, args.only)
+    print(f'{"benchmark":<28} {"ops/sec":>12} {"p50 (us)":>10} {"p99 (us)":>10}')
+    for name, result in results.items():
+        print(f'{name:<28} {result["ops"]:>12.0f} {result["p50"]:>10.2f} {result["p99"]:>10.2f}')
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'python': platform.python_version(), 'results': results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for name, before, after in regressions:
+            print(f'REGRESSION {name}: {before:.0f} -> {after:.0f} ops/sec ({after / before - 1:+.1%})')
+        if regressions:
+            return 1
+        print(f'no regressions beyond {args.threshold:.0%} of {args.compare}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,7 +2,7 @@ from setuptools import setup
 
 setup(
     name='w2n2w',
-    packages=['w2n2w'],
+    packages=['w2n2w', 'w2n2w.locales'],
     version='0.3.1',
     license='MIT',
     description='Convert words to numbers and back again',
@@ -11,6 +11,10 @@ setup(
     url='https://github.com/Crozzers/w2n2w',
     keywords=['numbers', 'convert', 'words'],
     python_requires='>=3.6',
+    extras_require={
+        'numpy': ['numpy'],
+        'pandas': ['numpy', 'pandas']
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
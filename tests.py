@@ -1,5 +1,31 @@
+import asyncio
+import io
+import multiprocessing
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from decimal import Decimal
+from fractions import Fraction
+from unittest import mock
+
 import w2n2w
+import w2n2w.__main__ as cli
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    import pandas
+except ImportError:
+    pandas = None
 
 
 class TestWordToNumber(unittest.TestCase):
@@ -65,6 +91,71 @@ class TestWordToNumber(unittest.TestCase):
         self.assertRaises(TypeError, w2n2w.word_to_num, 112)
 
 
+class TestTryWordToNumber(unittest.TestCase):
+    def test_try(self):
+        self.assertEqual(w2n2w.try_word_to_num('Forty-Two'), 42)
+        self.assertEqual(w2n2w.try_word_to_num('negative 1.5'), -1.5)
+        self.assertIsNone(w2n2w.try_word_to_num('hello'))
+        self.assertIsNone(w2n2w.try_word_to_num('one point x'))
+        self.assertIsNone(w2n2w.try_word_to_num(42))
+        self.assertEqual(w2n2w.try_word_to_num('the quick brown fox', default=-1), -1)
+        self.assertEqual(w2n2w.try_word_to_num('einundzwanzig', locale='de'), 21)
+        # only invalid phrases are turned into `default`, not bugs in the parser
+        with mock.patch.object(w2n2w.Word2Number, 'evaluate_tokens', side_effect=TypeError('bug')):
+            self.assertRaises(TypeError, w2n2w.try_word_to_num, 'forty two')
+
+    def test_is_number_phrase(self):
+        for phrase in ('seven', 'the twenty', '12', '+5', 'inf', 'a half', 'x-twenty', 'two.5'):
+            self.assertTrue(w2n2w.is_number_phrase(phrase), phrase)
+        for phrase in ('', 'hello', 'company', 'for', '12 34', 'negative', 'one point x', None):
+            self.assertFalse(w2n2w.is_number_phrase(phrase), phrase)
+        self.assertTrue(w2n2w.is_number_phrase('undzwanzig', locale='de'))
+        self.assertFalse(w2n2w.is_number_phrase('hallo', locale='de'))
+
+
+class TestFuzzy(unittest.TestCase):
+    def test_fuzzy(self):
+        self.assertEqual(w2n2w.word_to_num('Fourty-Two thousnad and ninty', max_edits=1), 42090)
+        self.assertEqual(w2n2w.word_to_num('minus sevn', max_edits=1), -7)
+        self.assertEqual(w2n2w.word_to_num('fortieth'), w2n2w.word_to_num('fourtieth'))
+        self.assertEqual(w2n2w.num_to_word(0.025), 'one fortieth')
+        self.assertRaises(ValueError, w2n2w.word_to_num, 'fourty')
+        # short words and words that are too far away are left alone
+        self.assertEqual(w2n2w.word_to_num('five for you', max_edits=1), 5)
+        self.assertIsNone(w2n2w.try_word_to_num('fourtyy', max_edits=1))
+        self.assertEqual(w2n2w.try_word_to_num('fourtyy', max_edits=2), 40)
+        self.assertTrue(w2n2w.is_number_phrase('thre hundrd', max_edits=1))
+        self.assertEqual(
+            w2n2w.word_to_num_many(['fourty', 'Ninty-Nine', 'hello'], errors='default', max_edits=1), [40, 99, None]
+        )
+        self.assertEqual(w2n2w.word_to_num('zwanzik', locale='de', max_edits=1), 20)
+        self.assertEqual(w2n2w.word_to_num('dreiundzwanzig', locale='de', max_edits=1), 23)
+        self.assertRaises(ValueError, w2n2w.word_to_num, 'fourty', max_edits=-1)
+
+    def test_ordinary_words(self):
+        # words are only corrected next to number words, or on their own
+        self.assertEqual(w2n2w.word_to_num('night shift one', max_edits=1), 1)
+        self.assertEqual(w2n2w.word_to_num('tree houses one', max_edits=1), 1)
+        self.assertRaises(ValueError, w2n2w.word_to_num, 'hello fourty', max_edits=1)
+        self.assertEqual(w2n2w.word_to_num('night', max_edits=1), 8)
+        self.assertEqual(w2n2w.word_to_num('one tree', max_edits=1), 4)
+        self.assertEqual(w2n2w.word_to_num('one tree'), 1)
+        self.assertEqual(w2n2w.word_to_num('fourty thousnad', max_edits=1), 40000)
+        self.assertEqual(w2n2w.word_to_num('5 thousnad', max_edits=1), 5000)
+
+    def test_index(self):
+        index = w2n2w.FuzzyIndex(['ninety', 'ninth', 'thousand'], max_edits=2)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.closest('ninety'), 'ninety')
+        # ties go to the word that came first
+        self.assertEqual(index.closest('ninty'), 'ninety')
+        self.assertEqual(index.closest('thousnad'), 'thousand')
+        self.assertEqual(index.closest('thosnad'), 'thousand')
+        self.assertIsNone(index.closest('nin'))
+        self.assertIsNone(index.closest('hello'))
+        self.assertRaises(ValueError, w2n2w.FuzzyIndex, ['one'], 0)
+
+
 class TestNumberToWord(unittest.TestCase):
     def test_positives(self):
         self.assertEqual(w2n2w.num_to_word(2_003_984), "two million three thousand nine hundred and eighty four")
@@ -117,6 +208,912 @@ class TestNumberToWord(unittest.TestCase):
             # it a success
             self.assertEqual(n, i)
 
+    def test_huge(self):
+        self.assertEqual(w2n2w.num_to_word(10**36 + 5), 'thousand decillion and five')
+        self.assertEqual(w2n2w.num_to_word(-123 * 10**33), 'negative one hundred and twenty three decillion')
+        self.assertEqual(
+            w2n2w.num_to_word(10**66 + 10**33 + 7), 'one decillion one decillion and seven'
+        )
+        self.assertEqual(w2n2w.word_to_num(w2n2w.num_to_word(10**36 + 17)), 10**36 + 17)
+
+        # well past the point where `str(int)` gives up
+        huge = 7**20_000
+        words = w2n2w.iter_num_to_word(huge)
+        self.assertEqual(next(words), 'nine')
+        self.assertEqual(' '.join(w2n2w.iter_num_to_word(huge)), w2n2w.num_to_word(huge))
+        # 16,903 digits is 513 windows of 33, with one 'decillion' after every window but the last
+        self.assertEqual(w2n2w.num_to_word(huge).count('decillion'), 512)
+        self.assertEqual(list(w2n2w.iter_num_to_word(0.5)), ['one', 'half'])
+
+    def test_huge_round_trip(self):
+        self.assertEqual(w2n2w.num_to_word(10**99 + 7), 'one decillion decillion decillion and seven')
+        self.assertEqual(w2n2w.word_to_num('one decillion one decillion and seven'), 10**66 + 10**33 + 7)
+        self.assertEqual(w2n2w.word_to_num('one nonillion two thousand decillion'), (10**30 + 2000) * 10**33)
+        self.assertEqual(w2n2w.word_to_num('decillion decillion'), 10**66)
+        self.assertEqual(w2n2w.word_to_num('one million decillion'), 10**39)
+        numbers = [10**66, 10**66 + 10**33 + 5, 10**99 + 7, 2 * 10**99, 10**66 + 10**36, 7**20_000]
+        random.seed(7)
+        for _ in range(200):
+            num = random.randrange(10**36, 10**random.randrange(37, 400))
+            numbers.append(num - num % 10**random.randrange(0, 300))
+        for num in numbers:
+            self.assertEqual(w2n2w.word_to_num(w2n2w.num_to_word(num)), num)
+            self.assertEqual(w2n2w.word_to_num(w2n2w.num_to_word(-num)), -num)
+
+    def test_decimals(self):
+        self.assertEqual(w2n2w.num_to_word(Decimal('1.50')), 'one point five zero')
+        self.assertEqual(w2n2w.num_to_word(Decimal('-0.25')), 'negative one quarter')
+        self.assertEqual(w2n2w.num_to_word(Decimal('-0.25'), prefer_fraction_words=False), 'negative zero point two five')
+        self.assertEqual(w2n2w.num_to_word(Decimal('1E+3')), 'thousand')
+        # trailing zeros are worded, even when the number has a word of its own
+        self.assertEqual(w2n2w.num_to_word(Decimal('2.0')), 'two point zero')
+        self.assertEqual(w2n2w.num_to_word(Decimal('21.0')), 'twenty one point zero')
+        self.assertEqual(w2n2w.num_to_word(Decimal('1000.00')), 'thousand point zero zero')
+        self.assertEqual(w2n2w.num_to_word(Decimal('-0.50')), 'negative zero point five zero')
+        self.assertEqual(w2n2w.num_to_word(Decimal('0.5')), 'one half')
+        self.assertEqual(w2n2w.num_to_word(Decimal('2')), 'two')
+        self.assertEqual(w2n2w.num_to_word(Decimal('12345678901234567890.12')), w2n2w.num_to_word(12345678901234567890) + ' point one two')
+        self.assertEqual(w2n2w.num_to_word(Fraction(1, 3)), 'one third')
+        self.assertEqual(w2n2w.num_to_word(Fraction(7, 8)), 'zero point eight seven five')
+        self.assertEqual(w2n2w.num_to_word(Fraction(2, 3)), w2n2w.num_to_word(2 / 3))
+        self.assertEqual(w2n2w.num_to_word(1e-07), 'zero point zero zero zero zero zero zero one')
+        self.assertEqual(w2n2w.num_to_word(-0.5, prefer_fraction_words=False), 'negative zero point five')
+        self.assertRaises(ValueError, w2n2w.num_to_word, float('inf'))
+        self.assertRaises(ValueError, w2n2w.num_to_word, Decimal('NaN'))
+        self.assertEqual(
+            w2n2w.num_to_word_many([Decimal('1.5'), Decimal('1.50'), 1.5], prefer_fraction_words=False),
+            ['one point five', 'one point five zero', 'one point five']
+        )
+
+    def test_precision(self):
+        self.assertEqual(w2n2w.num_to_word(2.5, precision=2), 'two point five zero')
+        self.assertEqual(w2n2w.num_to_word(2.675, precision=2), 'two point six eight')
+        self.assertEqual(w2n2w.num_to_word(Decimal('2.665'), precision=2), 'two point six six')
+        self.assertEqual(w2n2w.num_to_word(Fraction(1, 3), precision=3), 'zero point three three three')
+        self.assertEqual(w2n2w.num_to_word(1.5, precision=0), 'two')
+        self.assertEqual(w2n2w.num_to_word(-0.004, precision=2), 'zero point zero zero')
+        self.assertEqual(w2n2w.num_to_word(0.5, precision=1), 'zero point five')
+        self.assertEqual(w2n2w.num_to_word(0.0123, significant_digits=2), 'zero point zero one two')
+        self.assertEqual(w2n2w.num_to_word(9.99, significant_digits=2), 'ten')
+        self.assertEqual(w2n2w.num_to_word(Fraction(2, 3), significant_digits=3), 'zero point six six seven')
+        self.assertEqual(w2n2w.num_to_word(123456, significant_digits=2), 'one hundred and twenty thousand')
+        self.assertRaises(ValueError, w2n2w.num_to_word, 1.5, precision=-1)
+        self.assertRaises(ValueError, w2n2w.num_to_word, 1.5, significant_digits=0)
+        self.assertRaises(ValueError, w2n2w.num_to_word, 1.5, precision=1, significant_digits=1)
+
+
+class TestParse(unittest.TestCase):
+    def test_parse(self):
+        text = '  Minus twenty-three thousand and sixth apples '
+        result = w2n2w.parse(text)
+        self.assertEqual(
+            (result.value, result.kind, result.negative, result.start, result.end),
+            (-23006, 'ordinal', True, 2, 46)
+        )
+        self.assertEqual(result.groups, (
+            w2n2w.ParsedGroup('twenty-three thousand', 8, 29, 23000), w2n2w.ParsedGroup('and sixth apples', 30, 46, 6)
+        ))
+        self.assertEqual(result.unparsed, (w2n2w.ParsedWord('apples', 40, 46),))
+
+        self.assertEqual(w2n2w.parse('hello thousand five').unparsed, (w2n2w.ParsedWord('hello', 0, 5),))
+        self.assertEqual(w2n2w.parse('half a million').unparsed, ())
+        self.assertEqual(w2n2w.parse('two point five').groups, (w2n2w.ParsedGroup('two', 0, 3, 2),))
+        self.assertEqual(w2n2w.parse('quatre-vingt-dix', locale='fr').groups[0].text, 'quatre-vingt-dix')
+        self.assertRaises(ValueError, w2n2w.parse, 'not a number')
+        self.assertRaises(TypeError, w2n2w.parse, 5)
+        with self.assertRaises(AttributeError):
+            result.extra = 1
+
+    def test_kinds(self):
+        for words, kind in (
+            ('twenty three', 'cardinal'), ('5', 'cardinal'), ('seventy first', 'ordinal'), ('third', 'ordinal'),
+            ('two thirds', 'fraction'), ('one and a half', 'fraction'), ('one point five', 'decimal'), ('1e3', 'decimal')
+        ):
+            result = w2n2w.parse(words)
+            self.assertEqual((result.value, result.kind), (w2n2w.word_to_num(words), kind))
+
+
+class TestWord2Number(unittest.TestCase):
+    def test_tokenize(self):
+        tokens = w2n2w.Word2Number.tokenize('twenty-two point 5 foo')
+        self.assertEqual([t.word for t in tokens], ['twenty', 'two', 'point', '5', 'foo'])
+        self.assertEqual([t.pos for t in tokens], [0, 7, 11, 17, 19])
+        self.assertEqual([t.value for t in tokens], [20, 2, None, 5, None])
+        self.assertEqual(
+            [t.kind for t in tokens],
+            [w2n2w.TokenKind.NUMBER, w2n2w.TokenKind.NUMBER, w2n2w.TokenKind.POINT,
+             w2n2w.TokenKind.DIGITS, w2n2w.TokenKind.OTHER]
+        )
+        self.assertEqual([t.word for t in w2n2w.Word2Number.tokenize('1.5')], ['1', '.', '5'])
+        self.assertEqual(w2n2w.Word2Number.tokenize(''), [])
+
+    def test_split_by_magnitude(self):
+        self.assertEqual(
+            w2n2w.Word2Number.split_by_magnitude('five million sixty five thousand two hundred and twenty three'),
+            ['five million', 'sixty five thousand', 'two hundred and twenty three']
+        )
+        # whole words only, 'million' shouldn't be found inside 'millionths'
+        self.assertEqual(w2n2w.Word2Number.split_by_magnitude('two millionths'), ['two millionths'])
+        self.assertEqual(w2n2w.Word2Number.split_by_magnitude('two millionths three'), ['two millionths', 'three'])
+
+    def test_process_chunk(self):
+        self.assertEqual(w2n2w.Word2Number.process_chunk('twenty three million'), ([20, 3], 10**6))
+        tokens = w2n2w.Word2Number.tokenize('twenty three million')
+        self.assertEqual(w2n2w.Word2Number.process_chunk(tokens), ([20, 3], 10**6))
+        # an ordinal or fraction before 'hundred' isn't a number
+        self.assertRaises(ValueError, w2n2w.Word2Number.process_chunk, 'third hundred')
+        self.assertRaises(ValueError, w2n2w.Word2Number.process_chunk, 'eightieth two hundred')
+        self.assertEqual(w2n2w.try_word_to_num('third hundred', 'nope'), 'nope')
+        self.assertIs(w2n2w.is_number_phrase('third hundred'), False)
+        self.assertRaises(ValueError, w2n2w.word_to_num, 'third hundred')
+        # as long as part of it is a number the rest is skipped
+        self.assertEqual(w2n2w.word_to_num('third hundred thousand five'), 5)
+
+    def test_stray_signs(self):
+        # signs after the start are skipped like any other word we don't know
+        self.assertEqual(w2n2w.word_to_num('- minus and three'), -3)
+        self.assertEqual(w2n2w.word_to_num('three and minus'), 3)
+        self.assertEqual(w2n2w.word_to_num('- minus and three point'), -3.0)
+        self.assertEqual(w2n2w.word_to_num('forty and - of zero'), 40)
+        self.assertEqual(w2n2w.word_to_num('halves and - and negative one billion'), 1_500_000_000.0)
+        self.assertEqual(w2n2w.word_to_num('three and minus and negative'), 3)
+        self.assertRaises(ValueError, w2n2w.word_to_num, 'minus and negative')
+        # unlike other words, which still make the chunk fail
+        self.assertRaises(ValueError, w2n2w.word_to_num, 'three and foo')
+        # never -0.0
+        for words in ('negative zero point zero', 'minus point zero'):
+            self.assertEqual(str(w2n2w.word_to_num(words)), '0.0')
+            self.assertEqual(str(w2n2w.parse(words).value), '0.0')
+            self.assertEqual(str(w2n2w.word_to_num_many([words])[0]), '0.0')
+
+    def test_chunk_cache(self):
+        w2n2w.clear_cache()
+        total, multiplier = w2n2w.Word2Number.process_chunk('two hundred and twelve thousand')
+        key = (('two', 'hundred', 'and', 'twelve', 'thousand'), False, w2n2w.english_lexicon)
+        self.assertIn(key, w2n2w._chunk_cache)
+        # changing what we got back shouldn't change what's cached
+        total.append(5)
+        self.assertEqual(w2n2w.Word2Number.process_chunk('two hundred and twelve thousand'), ([200, 12], 1000))
+        self.assertEqual(w2n2w.Word2Number.process_chunk('seventy fifth', ordinals=True), ([70, 5], 1))
+        self.assertEqual(w2n2w.Word2Number.process_chunk('seventy fifth'), ([70], 0.2))
+        self.assertEqual(w2n2w.word_to_num('two hundred and twelve thousand and five'), 212005)
+        self.assertEqual(w2n2w.word_to_num('nine million two hundred and twelve thousand'), 9212000)
+
+    def test_whole_words(self):
+        self.assertEqual(w2n2w.word_to_num('three thousand millionths'), 3000 / 10**6)
+        self.assertEqual(w2n2w.word_to_num('one hundred pointless'), 100)
+        self.assertRaises(ValueError, w2n2w.word_to_num, 'one point five million')
+
+
+class TestLocales(unittest.TestCase):
+    def test_locales(self):
+        self.assertEqual(w2n2w.word_to_num('doscientos treinta y cuatro mil', locale='es'), 234_000)
+        self.assertEqual(w2n2w.word_to_num('tres mil millones', locale='es'), 3 * 10**9)
+        self.assertEqual(w2n2w.word_to_num('Quatre-vingt-dix-neuf', locale='fr'), 99)
+        self.assertEqual(w2n2w.word_to_num('moins deux cent vingt et un', locale='fr'), -221)
+        self.assertEqual(w2n2w.word_to_num('zweihunderteinundzwanzig', locale='de'), 221)
+        self.assertEqual(w2n2w.word_to_num('drei komma eins vier', locale='de'), 3.14)
+        self.assertEqual(w2n2w.word_to_num_many(['uno', 'dos', 'tres'], locale='es'), [1, 2, 3])
+        self.assertEqual(w2n2w.word_to_num('forty two', locale='en'), 42)
+        self.assertRaises(ValueError, w2n2w.word_to_num, 'forty two', locale='es')
+        self.assertRaises(ValueError, w2n2w.word_to_num, 'one', locale='xx')
+        self.assertIn('fr', w2n2w.available_locales())
+
+    def test_lazy(self):
+        # only the locales that get used are ever imported
+        code = (
+            'import sys, w2n2w; w2n2w.word_to_num("forty two"); w2n2w.word_to_num("dos", locale="es");'
+            'print(sorted(i for i in sys.modules if i.startswith("w2n2w.locales.")))'
+        )
+        out = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, check=True).stdout
+        self.assertEqual(out.decode().strip(), "['w2n2w.locales.es']")
+
+    def test_lexicon(self):
+        lexicon = w2n2w.get_locale('fr')
+        with self.assertRaises(TypeError):
+            lexicon.number_words['deux'] = 3
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'fr.lexicon')
+            lexicon.save(path)
+            w2n2w.register_locale('fr-snapshot', path)
+            self.assertEqual(w2n2w.word_to_num('soixante et onze', locale='fr-snapshot'), 71)
+            self.assertEqual(w2n2w.get_locale('fr-snapshot').split_order, lexicon.split_order)
+
+        numbers = {'uno': 1, 'dos': 2, 'tres': 3, 'dez': 10, 'mil': 1000}
+        custom = w2n2w.Lexicon('pt', numbers, {'mil': 1000}, numbers, and_words=('e',))
+        self.assertEqual(w2n2w.word_to_num('dos mil e tres', locale=custom), 2003)
+
+
+class TestBatch(unittest.TestCase):
+    def test_word_to_num_many(self):
+        words = ['forty three', 'Forty-Three', 'negative nine', 'seventy first', 'point one', 'forty three']
+        self.assertEqual(w2n2w.word_to_num_many(words), [w2n2w.word_to_num(i) for i in words])
+        self.assertEqual(w2n2w.word_to_num_many([]), [])
+        self.assertEqual(w2n2w.word_to_num_many(iter(['one', 'two'])), [1, 2])
+
+    def test_num_to_word_many(self):
+        nums = [1234, 1.52, -0.999, 0, '12', 0.5, 1234]
+        self.assertEqual(w2n2w.num_to_word_many(nums), [w2n2w.num_to_word(i) for i in nums])
+        self.assertEqual(
+            w2n2w.num_to_word_many([0.5], prefer_fraction_words=False),
+            [w2n2w.num_to_word(0.5, prefer_fraction_words=False)]
+        )
+
+    def test_num_to_word_range(self):
+        huge = w2n2w._stacked_threshold
+        for args in (
+            (2100,), (-1100, 1100), (999_990, 1_001_010), (10**9 + 5, 10**9 - 1005, -1),
+            (0, 10**15, 10**10 + 7), (10**6 - 3, 10**7, 1000), (huge - 5, huge + 5), (-huge - 3, -huge + 3)
+        ):
+            self.assertEqual(list(w2n2w.num_to_word_range(*args)), [w2n2w.num_to_word(i) for i in range(*args)])
+        self.assertRaises(TypeError, w2n2w.num_to_word_range, 0.5)
+        self.assertRaises(ValueError, w2n2w.num_to_word_range, 0, 10, 0)
+
+    def test_phrase_table(self):
+        nums = list(range(0, 20_000, 7)) + [-5, 999, 1000, 1001, 19_999, 20_000, 10**6]
+        phrases = ['Twenty-Three Thousand and Fifth', 'one hundred and fifth', 'five thousand third', 'sixty thousandth']
+        phrases += [w2n2w.num_to_word(i) for i in nums] + [w2n2w.num_to_word(i).replace(' and ', ' ') for i in nums]
+        words = [w2n2w.num_to_word(i) for i in nums]
+        values = w2n2w.word_to_num_many(phrases)
+        w2n2w.enable_phrase_table(20_000)
+        try:
+            self.assertEqual([w2n2w.num_to_word(i) for i in nums], words)
+            self.assertEqual(w2n2w.word_to_num_many(phrases), values)
+            table = w2n2w._phrase_table
+            self.assertEqual(table.word_to_num('nineteen thousand nine hundred ninety ninth'), 19_999)
+            self.assertIsNone(table.word_to_num('twenty thousand'))
+            self.assertIsNone(table.num_to_word(20_000))
+            self.assertLess(len(table), 20_000)
+        finally:
+            w2n2w.disable_phrase_table()
+        self.assertRaises(ValueError, w2n2w.enable_phrase_table, 10**7)
+
+    def test_errors(self):
+        words = ['one', 'on', 2, 'three', 'on']
+        self.assertRaises(ValueError, w2n2w.word_to_num_many, words)
+        self.assertRaises(TypeError, w2n2w.word_to_num_many, [2])
+        self.assertEqual(w2n2w.word_to_num_many(words, errors='skip'), [1, 3])
+        self.assertEqual(w2n2w.word_to_num_many(words, errors='default', default=-1), [1, -1, -1, 3, -1])
+        self.assertEqual(w2n2w.num_to_word_many([1, 'x', None], errors='default'), ['one', None, None])
+        self.assertRaises(ValueError, w2n2w.word_to_num_many, words, errors='ignore')
+
+
+class TestCompactResults(unittest.TestCase):
+    def test_compact(self):
+        words = ['forty three', 'not a number', 'half', 'one thousand decillion', 'negative seven'] * 3
+        results = w2n2w.word_to_num_compact(words)
+        self.assertEqual(len(results), 15)
+        self.assertEqual(results.tolist(), w2n2w.word_to_num_many(words, errors='default'))
+        self.assertEqual((results[0], results[1], results[-1]), (43, None, -7))
+        self.assertTrue(results.failed(1))
+        self.assertFalse(results.failed(2))
+        self.assertEqual(results.failure_count(), 3)
+        self.assertEqual(results.overflow, {3: 10**36, 8: 10**36, 13: 10**36})
+        self.assertEqual(results.ints[:5].tolist(), [43, 0, 0, 0, -7])
+        self.assertEqual(results.floats[2], .5)
+        self.assertEqual(bytes(results.failures), bytes([0b01000010, 0b00001000]))
+        self.assertRaises(IndexError, results.__getitem__, 15)
+        for index in (slice(0, 2), slice(None)):
+            with self.assertRaisesRegex(TypeError, 'indices must be integers'):
+                results[index]
+            self.assertRaisesRegex(TypeError, 'indices must be integers', results.failed, index)
+        self.assertRaises(TypeError, results.append, '1')
+
+    def test_buffers(self):
+        results = w2n2w.CompactResults([1, 2, None])
+        self.assertIsNone(results.floats)
+        self.assertEqual(memoryview(results.ints).cast('B').nbytes, 24)
+        if numpy is not None:
+            ints = numpy.frombuffer(results.ints, dtype=numpy.int64)
+            self.assertEqual(ints.tolist(), [1, 2, 0])
+            # it's a view of the results, not a copy
+            results.ints[0] = 5
+            self.assertEqual(ints[0], 5)
+
+    def test_exported_buffers(self):
+        # a failed append leaves every buffer the same length
+        results = w2n2w.CompactResults([1, 2.5, None, 10**30] * 2)
+        for name in ('ints', 'floats', 'failures', 'float_mask'):
+            with memoryview(getattr(results, name)):
+                for value in (7, 1.5, None, 10**30):
+                    self.assertRaises(BufferError, results.extend, [value])
+                    self.assertEqual((len(results), len(results.floats)), (8, 8))
+                    self.assertEqual((len(results.failures), len(results.float_mask)), (1, 1))
+        results.extend([7, 1.5, None, 10**30])
+        self.assertEqual(results.tolist(), [1, 2.5, None, 10**30] * 2 + [7, 1.5, None, 10**30])
+        self.assertEqual(sorted(results.overflow), [3, 7, 11])
+
+
+def fill_cache(path, nums):
+    # converts numbers with a cache stored in `path`. Run in other processes by `TestCache`
+    w2n2w.enable_cache(path=path)
+    try:
+        return w2n2w.num_to_word_many(nums)
+    finally:
+        w2n2w.disable_cache()
+
+
+class TestCache(unittest.TestCase):
+    def tearDown(self):
+        w2n2w.disable_cache()
+
+    def test_cache(self):
+        w2n2w.enable_cache(maxsize=2)
+        self.assertEqual(w2n2w.word_to_num('twenty five'), 25)
+        self.assertEqual(w2n2w.word_to_num('Twenty-Five'), 25)
+        self.assertEqual(w2n2w.word_to_num('negative twenty five'), -25)
+        self.assertEqual(w2n2w.cache_info()['word_to_num'], w2n2w.CacheInfo(2, 1, 0, 1, 2))
+        w2n2w.word_to_num('one')
+        w2n2w.word_to_num('two')
+        self.assertEqual(w2n2w.cache_info()['word_to_num'].evictions, 1)
+        self.assertEqual(w2n2w.cache_info()['word_to_num'].size, 2)
+
+        self.assertEqual(w2n2w.num_to_word(0.5), 'one half')
+        self.assertEqual(w2n2w.num_to_word(0.5, prefer_fraction_words=False), 'zero point five')
+        self.assertEqual(w2n2w.num_to_word(0.5), 'one half')
+        self.assertEqual(w2n2w.cache_info()['num_to_word'].hits, 1)
+        self.assertRaises(TypeError, w2n2w.num_to_word, [1])
+
+        w2n2w.clear_cache()
+        self.assertEqual(w2n2w.cache_info()['num_to_word'], w2n2w.CacheInfo(0, 0, 0, 0, 2))
+        w2n2w.disable_cache()
+        self.assertEqual(w2n2w.cache_info(), {'word_to_num': None, 'num_to_word': None})
+
+    def test_policy(self):
+        # LRU keeps 'a' because it was used after 'b' was added, FIFO throws it away because it was added first
+        for policy, evicted, kept in (('lru', 'b', {'a': 1, 'c': 3}), ('fifo', 'a', {'b': 2, 'c': 3})):
+            cache = w2n2w.ConversionCache(maxsize=2, policy=policy)
+            cache.set('a', 1)
+            cache.set('b', 2)
+            cache.get('a')
+            cache.set('c', 3)
+            self.assertIs(cache.get(evicted), w2n2w.cache.MISSING, policy)
+            self.assertEqual({key: cache.get(key) for key in kept}, kept, policy)
+            self.assertEqual(len(cache), 2)
+        self.assertRaises(ValueError, w2n2w.ConversionCache, policy='random')
+
+    def test_threads(self):
+        w2n2w.enable_cache(maxsize=50)
+        nums = list(range(200))
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda i: w2n2w.word_to_num(w2n2w.num_to_word(i)), nums * 10))
+        self.assertEqual(results, nums * 10)
+        info = w2n2w.cache_info()['word_to_num']
+        self.assertEqual(info.hits + info.misses, 2000)
+        self.assertLessEqual(info.size, 50)
+
+    def test_persistent(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cache.db')
+            w2n2w.enable_cache(path=path)
+            results = w2n2w.word_to_num_many(['one', 'Two', 'minus two', 'x'], errors='default')
+            self.assertEqual(results, [1, 2, -2, None])
+            self.assertEqual(w2n2w.num_to_word(Decimal('1.50')), 'one point five zero')
+            # the results are still there after the cache is turned off and on again
+            w2n2w.disable_cache()
+            w2n2w.enable_cache(path=path)
+            self.assertEqual(w2n2w.word_to_num_many(['two', 'one', 'three']), [2, 1, 3])
+            self.assertEqual(w2n2w.num_to_word(Decimal('1.50')), 'one point five zero')
+            self.assertEqual(w2n2w.num_to_word(0.5), 'one half')
+            self.assertEqual(w2n2w.cache_info()['word_to_num'], w2n2w.CacheInfo(2, 1, 0, 3, 4096))
+            self.assertEqual(w2n2w.cache_info()['num_to_word'], w2n2w.CacheInfo(1, 1, 0, 2, 4096))
+            w2n2w.disable_cache()
+
+            cache = w2n2w.PersistentCache(path, 'test', maxsize=3, flush_every=2)
+            cache.set_many([('a', 1), (('b', 2.5), 2.5), (w2n2w.get_locale('fr'), 'deux')])
+            self.assertEqual(cache.get_many(['a', ('b', 2.5), 'c']), {'a': 1, ('b', 2.5): 2.5})
+            # keys for lexicons that aren't registered are only kept in memory
+            lexicon = w2n2w.Lexicon('custom', {'um': 1}, {'mil': 1000}, {'um': 1})
+            cache.set(lexicon, 1)
+            cache.set('d', 'four')
+            self.assertEqual(cache.info().size, 3)
+            self.assertEqual(cache.info().evictions, 1)
+            other = w2n2w.PersistentCache(path, 'test')
+            self.assertEqual(other.get_many(['a', ('b', 2.5), w2n2w.get_locale('fr'), 'd']), {
+                ('b', 2.5): 2.5, w2n2w.get_locale('fr'): 'deux', 'd': 'four'
+            })
+            self.assertIs(other.get(lexicon), w2n2w.cache.MISSING)
+            # results from other versions are ignored
+            with mock.patch('w2n2w.persistent._results_version', w2n2w.persistent._results_version + 1):
+                self.assertEqual(w2n2w.PersistentCache(path, 'test').get_many(['d']), {})
+            other.clear()
+            self.assertEqual(cache.info().size, 0)
+            cache.close()
+            other.close()
+
+    def test_persistent_processes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cache.db')
+            chunks = [range(i, i + 300) for i in range(0, 1200, 100)]
+            with ProcessPoolExecutor(4) as executor:
+                results = list(executor.map(fill_cache, [path] * len(chunks), chunks))
+            self.assertEqual(results, [[w2n2w.num_to_word(i) for i in chunk] for chunk in chunks])
+            cache = w2n2w.PersistentCache(path, 'num_to_word')
+            self.assertEqual(cache.info().size, 1400)
+            self.assertEqual(cache.get((int, 1399, True, None, None)), 'one thousand three hundred and ninety nine')
+            cache.close()
+
+
+class TestThreads(unittest.TestCase):
+    def setUp(self):
+        self.interval = sys.getswitchinterval()
+        # switch threads as often as possible to give any races a chance to happen
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.interval)
+
+    def run_threads(self, func, count=8):
+        # calls `func(i)` on `count` threads that all start at the same moment
+        barrier = threading.Barrier(count)
+
+        def run(i):
+            barrier.wait()
+            return func(i)
+
+        with ThreadPoolExecutor(count) as pool:
+            return list(pool.map(run, range(count)))
+
+    def test_threads(self):
+        phrases = [w2n2w.num_to_word(i * 7919) for i in range(2000)] + ['two thirds', 'one point five', 'nonsense']
+        expected = w2n2w.word_to_num_many(phrases, errors='default')
+        with mock.patch.object(w2n2w, '_chunk_cache_size', 16):
+            with ThreadPoolExecutor(8) as pool:
+                results = list(pool.map(
+                    lambda i: w2n2w.word_to_num_many(phrases[i::8], errors='default'), range(8)
+                ))
+        for i, result in enumerate(results):
+            self.assertEqual(result, expected[i::8])
+
+    def test_num_to_word(self):
+        nums = [i * 7919 for i in range(1000)] + [1.5, -2.25, Fraction(2, 3), Decimal('0.10'), 10**40]
+        expected = [w2n2w.num_to_word(i) for i in nums]
+        results = self.run_threads(lambda i: ([w2n2w.num_to_word(n) for n in nums[i::8]], w2n2w.num_to_word_many(nums[i::8])))
+        for i, (words, many) in enumerate(results):
+            self.assertEqual(words, expected[i::8])
+            self.assertEqual(many, expected[i::8])
+
+    def test_cache(self):
+        # far more keys than the caches hold, so they evict all the time
+        nums = [i * 7919 for i in range(600)] * 2
+        phrases = [w2n2w.num_to_word(i) for i in nums]
+        for policy in ('lru', 'fifo'):
+            w2n2w.enable_cache(maxsize=32, policy=policy)
+            try:
+                results = self.run_threads(lambda i: (
+                    [w2n2w.num_to_word(n) for n in nums[i::8]], [w2n2w.word_to_num(w) for w in phrases[i::8]]
+                ))
+                for i, (words, values) in enumerate(results):
+                    self.assertEqual(words, phrases[i::8])
+                    self.assertEqual(values, nums[i::8])
+                for info in w2n2w.cache_info().values():
+                    self.assertEqual(info.size, 32)
+                    self.assertEqual(info.hits + info.misses, len(nums))
+                    self.assertGreater(info.evictions, 0)
+            finally:
+                w2n2w.disable_cache()
+
+    def test_phrase_table(self):
+        nums = list(range(0, 20000, 7))
+        phrases = [w2n2w.num_to_word(i) for i in nums]
+        # every thread uses the table before it has been built
+        w2n2w.enable_phrase_table(20000)
+        try:
+            results = self.run_threads(lambda i: (
+                [w2n2w.word_to_num(w) for w in phrases[i::8]], [w2n2w.num_to_word(n) for n in nums[i::8]]
+            ))
+        finally:
+            w2n2w.disable_phrase_table()
+        for i, (values, words) in enumerate(results):
+            self.assertEqual(values, nums[i::8])
+            self.assertEqual(words, phrases[i::8])
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_num_to_word_column(self):
+        nums = numpy.arange(0, 10**12, 10**9 + 7, dtype=numpy.int64)
+        expected = w2n2w.num_to_word_many(nums.tolist())
+        # start without the word tables so that every thread tries to build them
+        with mock.patch('w2n2w.columns._tables', None):
+            results = self.run_threads(lambda i: list(w2n2w.num_to_word_column(nums[i::8])))
+        for i, result in enumerate(results):
+            self.assertEqual(result, expected[i::8])
+
+    def test_find_numbers(self):
+        texts = [
+            f'I have {w2n2w.num_to_word(i)} apples and 3 pears, or two and a half dozen' for i in range(0, 5000, 13)
+        ]
+        expected = [(list(w2n2w.find_numbers(t)), repr(w2n2w.parse(t.split(' apples')[0][7:]))) for t in texts]
+        results = self.run_threads(lambda i: [
+            (list(w2n2w.find_numbers(t)), repr(w2n2w.parse(t.split(' apples')[0][7:]))) for t in texts[i::8]
+        ])
+        for i, result in enumerate(results):
+            self.assertEqual(result, expected[i::8])
+
+    def test_fuzzy(self):
+        words = [w2n2w.num_to_word(i * 7919) for i in range(500)]
+        # drop a letter from each word, so every phrase needs the fuzzy index
+        typos = [' '.join(w[:-1] if len(w) > 4 else w for w in phrase.split()) for phrase in words]
+        expected = w2n2w.word_to_num_many(typos, errors='default', max_edits=1)
+        # start without the index so that every thread tries to build it
+        with mock.patch.dict(w2n2w.english_lexicon._fuzzy_indexes, clear=True):
+            results = self.run_threads(
+                lambda i: [w2n2w.try_word_to_num(t, max_edits=1) for t in typos[i::8]]
+            )
+        for i, result in enumerate(results):
+            self.assertEqual(result, expected[i::8])
+
+    def test_locale(self):
+        loads = []
+
+        def load():
+            loads.append(1)
+            return w2n2w.get_locale('de')
+
+        phrases = ['dreiundzwanzig', 'einhundertfünf', 'zweitausend', 'neunundneunzig'] * 50
+        expected = w2n2w.word_to_num_many(phrases, locale='de')
+        # a locale that hasn't been loaded yet. It's only loaded once, however many threads want it
+        with mock.patch.dict('w2n2w.lexicon._locales', {'de2': load}):
+            results = self.run_threads(lambda i: [w2n2w.word_to_num(p, locale='de2') for p in phrases[i::8]])
+        self.assertEqual(loads, [1])
+        for i, result in enumerate(results):
+            self.assertEqual(result, expected[i::8])
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            w2n2w.number_words['dozen'] = 12
+        with self.assertRaises(TypeError):
+            w2n2w.magnitudes['grand'] = 1000
+        self.assertNotIn('dozen', w2n2w.number_words)
+
+
+class TestInstrumentation(unittest.TestCase):
+    def tearDown(self):
+        w2n2w.disable_instrumentation()
+        w2n2w.reset_instrumentation()
+
+    def test_stats(self):
+        original = w2n2w.Word2Number.__dict__['process_chunk']
+        events = []
+        w2n2w.enable_instrumentation(callback=lambda stage, seconds: events.append(stage))
+        self.assertEqual(w2n2w.word_to_num('one hundred and five thousand and twenty three'), 105023)
+        self.assertEqual(w2n2w.word_to_num('three point one four'), 3.14)
+        self.assertEqual(w2n2w.word_to_num('seven'), 7)
+        self.assertRaises(ValueError, w2n2w.word_to_num, 'not a number')
+
+        stats = w2n2w.instrumentation_stats()
+        self.assertEqual(stats['shortcuts'].calls, 4)
+        self.assertEqual(stats['process_decimal'].calls, 1)
+        self.assertEqual(stats['evaluate_tokens'].calls, 4)
+        self.assertIn('split_by_magnitude', stats)
+        for stage in stats.values():
+            self.assertLessEqual(stage.own_time, stage.time + 1e-9)
+        self.assertEqual(len(events), sum(i.calls for i in stats.values()))
+
+        w2n2w.disable_instrumentation()
+        self.assertIs(w2n2w.Word2Number.__dict__['process_chunk'], original)
+        w2n2w.word_to_num('seven')
+        self.assertEqual(w2n2w.instrumentation_stats()['shortcuts'].calls, 4)
+        w2n2w.reset_instrumentation()
+        self.assertEqual(w2n2w.instrumentation_stats(), {})
+
+    def test_slow_inputs(self):
+        slow = []
+        w2n2w.enable_instrumentation(slow_threshold=0, slow_callback=lambda *a: slow.append(a), log_size=2)
+        w2n2w.word_to_num_many(['one', 'Two', 'three point five'])
+        self.assertEqual([i.words for i in w2n2w.slow_inputs()], ['two', 'three point five'])
+        self.assertEqual(len(slow), 3)
+        w2n2w.enable_instrumentation(slow_threshold=60)
+        w2n2w.word_to_num('four')
+        self.assertEqual(len(w2n2w.slow_inputs()), 2)
+
+    def test_raising_callback(self):
+        events = []
+
+        def callback(*args):
+            events.append(args[0])
+            raise RuntimeError
+
+        w2n2w.enable_instrumentation(slow_threshold=0, callback=callback, slow_callback=callback)
+        with self.assertLogs('w2n2w.instrumentation', 'ERROR'):
+            # the callbacks don't change the result or hide the real error
+            self.assertEqual(w2n2w.word_to_num('one hundred and five'), 105)
+            self.assertRaises(ValueError, w2n2w.word_to_num, 'not a number')
+        # the outer stages still report after an inner one's callback has raised
+        stats = w2n2w.instrumentation_stats()
+        self.assertEqual(events.count('shortcuts'), 2)
+        self.assertEqual(events.count('one hundred and five'), 1)
+        self.assertEqual(len(events), sum(i.calls for i in stats.values()) + 2)
+        self.assertEqual(len(w2n2w.slow_inputs()), 2)
+
+
+class TestFindNumbers(unittest.TestCase):
+    def find(self, text):
+        return [(text[start: end], value) for start, end, value in w2n2w.find_numbers(text)]
+
+    def test_find_numbers(self):
+        self.assertEqual(
+            self.find('I owe you twenty-five pounds and a half, not 1.5'),
+            [('twenty-five', 25), ('a half', 0.5), ('1.5', 1.5)]
+        )
+        self.assertEqual(
+            self.find('Minus three hundred and six of them. Then ONE POINT FIVE TWO.'),
+            [('Minus three hundred and six', -306), ('ONE POINT FIVE TWO', 1.52)]
+        )
+        self.assertEqual(self.find('half a million and a third'), [('half a million and a third', 500_000 + (1 / 3))])
+        self.assertEqual(self.find('between 1990 2020'), [('1990', 1990), ('2020', 2020)])
+        self.assertEqual(self.find('the point is. And of a'), [])
+        self.assertEqual(self.find('five. Six'), [('five', 5), ('Six', 6)])
+        self.assertEqual(self.find(''), [])
+        self.assertRaises(TypeError, lambda: list(w2n2w.find_numbers(None)))
+
+    def test_matches_word_to_num(self):
+        for i in range(0, 100_000, 997):
+            w = w2n2w.num_to_word(i)
+            self.assertEqual(self.find(f'there are {w} of them'), [(w, i)])
+
+    def test_normalize(self):
+        self.assertEqual(w2n2w.normalize_text('I owe you twenty-five pounds and a half'), 'I owe you 25 pounds and 0.5')
+        self.assertEqual(
+            w2n2w.normalize_text('It costs 1,250.50, not -3 or v1.2', 'to-words'),
+            'It costs one thousand two hundred and fifty point five zero, not negative three or v1.2'
+        )
+        self.assertRaises(ValueError, w2n2w.normalize_text, 'one', 'sideways')
+
+        # numbers that are split between two reads are still found
+        text = ''.join(f'line {i}: {w2n2w.num_to_word(i * 7919)}, then 1.5\r\n' for i in range(200))
+        for direction in ('to-num', 'to-words'):
+            expected = w2n2w.normalize_text(text, direction)
+            for buffer_size in (1, 7, 64, 10_000):
+                out = io.StringIO()
+                count = w2n2w.normalize_file(io.StringIO(text, newline=''), out, direction, buffer_size=buffer_size)
+                self.assertEqual(out.getvalue(), expected)
+                self.assertEqual(count, 600 if direction == 'to-num' else 400)
+
+        # long phrases are cut up rather than held in memory
+        with mock.patch('w2n2w.normalize._max_carry', 8):
+            out = io.StringIO()
+            w2n2w.normalize_file(io.StringIO('one hundred and twenty three'), out, buffer_size=4)
+            self.assertNotEqual(out.getvalue(), '123')
+
+        with tempfile.TemporaryDirectory() as folder:
+            src, dst = os.path.join(folder, 'in.txt'), os.path.join(folder, 'out.txt')
+            with open(src, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            w2n2w.normalize_file(src, dst, buffer_size=100)
+            with open(dst, encoding='utf-8', newline='') as f:
+                self.assertEqual(f.read(), w2n2w.normalize_text(text))
+
+
+@unittest.skipIf(numpy is None, 'needs numpy')
+class TestColumns(unittest.TestCase):
+    def test_array(self):
+        result = w2n2w.word_to_num_column(numpy.array(['one', 'two', 'not a number', 'two', None], dtype=object))
+        self.assertEqual(result.dtype, numpy.int64)
+        self.assertEqual(result.tolist(), [1, 2, None, 2, None])
+        result = w2n2w.word_to_num_column(numpy.array([['one', 'half'], ['ten', 'x']]))
+        self.assertEqual(result.dtype, numpy.float64)
+        self.assertEqual(result.tolist(), [[1, .5], [10, None]])
+        self.assertEqual(w2n2w.word_to_num_column(['one thousand decillion']).tolist(), [10**36])
+        with mock.patch.dict(sys.modules, {'pandas': None}):
+            # without pandas to find the unique values
+            self.assertEqual(w2n2w.word_to_num_column(['uno', 'x', 'uno'], locale='es').tolist(), [1, None, 1])
+
+    def test_num_to_word(self):
+        nums = numpy.concatenate([
+            numpy.arange(-1500, 1500), numpy.array([100_100, 2_000_100, 10**18, 2**63 - 1, -2**63]),
+            numpy.random.default_rng(0).integers(-2**63, 2**63 - 1, 2000)
+        ])
+        self.assertEqual(w2n2w.num_to_word_column(nums).tolist(), [w2n2w.num_to_word(int(i)) for i in nums])
+        self.assertEqual(w2n2w.num_to_word_column(numpy.array([[0, 7]], dtype=numpy.uint8)).tolist(), [['zero', 'seven']])
+        self.assertEqual(w2n2w.num_to_word_column([0.5, 1.5, float('nan')]).tolist(), ['one half', 'one point five', None])
+
+    @unittest.skipIf(pandas is None, 'needs pandas')
+    def test_series(self):
+        series = pandas.Series(['forty two', 'x', None, 'forty two'], index=list('abcd'), name='n')
+        result = w2n2w.word_to_num_column(series)
+        self.assertEqual(str(result.dtype), 'Int64')
+        self.assertEqual(result.name, 'n')
+        self.assertEqual(list(result.index), list('abcd'))
+        self.assertEqual(result.isna().tolist(), [False, True, True, False])
+        self.assertEqual(result['d'], 42)
+        result = w2n2w.num_to_word_column(pandas.Series([3, 1100], index=[5, 6]))
+        self.assertEqual(result.to_dict(), {5: 'three', 6: 'one thousand and one hundred'})
+
+
+class TestIncremental(unittest.TestCase):
+    def test_feed(self):
+        parser = w2n2w.IncrementalParser()
+        values = []
+        for word in 'one hundred and twenty three thousand'.split():
+            parser.feed(word)
+            values.append(parser.value)
+        self.assertEqual(values, [1, 100, 100, 120, 123, 123_000])
+        self.assertEqual(parser.finish(), 123_000)
+        self.assertIsNone(parser.value)
+
+        for word in ('Negative', 'twenty-two', 'point', 'five'):
+            parser.feed(word)
+        self.assertEqual(parser.finish(), -22.5)
+        parser.feed('not')
+        self.assertRaises(ValueError, parser.finish)
+        self.assertRaises(TypeError, parser.feed, 5)
+
+    def test_matches_word_to_num(self):
+        phrases = [
+            'one hundred and twenty three million four hundred and fifty six thousand seven hundred and eighty nine',
+            'three quarters of a million', 'twelve thousand and thirty 8', 'seventy fifth', 'one thousandth',
+            'ten and two thirds', 'five thousand million and six', 'two point 5 nine', '1.5', 'a half point five',
+            'one decillion two thousand decillion and five point five'
+        ]
+        for phrase in phrases:
+            parser = w2n2w.IncrementalParser()
+            words = phrase.split()
+            for index, word in enumerate(words):
+                parser.feed(word)
+                try:
+                    expected = w2n2w.word_to_num(' '.join(words[: index + 1]))
+                except ValueError:
+                    expected = None
+                self.assertEqual(parser.value, expected, words[: index + 1])
+
+    def test_random_prefixes(self):
+        # every prefix of random phrases, including nonsense like 'third hundred' and stray signs
+        vocab = [
+            'one', 'two', 'three', 'twelve', 'twenty', 'seventy', 'hundred', 'thousand', 'million', 'billion',
+            'decillion', 'third', 'thirds', 'fifth', 'half', 'quarters', 'thousandth', 'millionths', 'and', 'of',
+            'a', 'point', 'zero', 'minus', 'negative', 'foo', '7', '12', '1.5'
+        ]
+        rng = random.Random(13)
+        for _ in range(2000):
+            words = [rng.choice(vocab) for _ in range(rng.randrange(1, 9))]
+            parser = w2n2w.IncrementalParser()
+            for index, word in enumerate(words):
+                parser.feed(word)
+                try:
+                    expected = w2n2w.word_to_num(' '.join(words[: index + 1]))
+                except ValueError:
+                    expected = None
+                self.assertEqual((parser.value, type(parser.value)), (expected, type(expected)), words[: index + 1])
+
+    def test_locales(self):
+        parser = w2n2w.IncrementalParser(locale='fr')
+        values = []
+        for word in ('quatre', 'vingt', 'dix', 'neuf'):
+            parser.feed(word)
+            values.append(parser.value)
+        self.assertEqual(values, [4, 80, 90, 99])
+        parser = w2n2w.IncrementalParser(locale='de')
+        parser.feed('zweihundert')
+        parser.feed('einundzwanzig')
+        self.assertEqual(parser.finish(), 221)
+
+
+class TestParallel(unittest.TestCase):
+    def test_parallel(self):
+        words = ['forty three', 'one', 'on', 'forty three', 'seventy first'] * 50
+        nums = list(range(-50, 2000, 3)) + [0.5, 1.0, 1]
+        with w2n2w.ParallelConverter(workers=2, chunk_size=7, errors='default') as converter:
+            self.assertEqual(converter.word_to_num(words), w2n2w.word_to_num_many(words, errors='default'))
+            self.assertEqual(len(converter.failures), 50)
+            self.assertEqual(converter.failures[0][:2], (2, 'on'))
+            self.assertEqual(list(converter.imap_word_to_num(iter(words))), converter.word_to_num(words))
+            self.assertEqual(converter.num_to_word(nums), [w2n2w.num_to_word(i) for i in nums])
+            self.assertEqual(list(converter.imap_num_to_word(nums)), [w2n2w.num_to_word(i) for i in nums])
+            self.assertEqual(converter.num_to_word([1, [2], 3]), ['one', None, 'three'])
+
+    def test_errors(self):
+        with w2n2w.ParallelConverter(workers=2, chunk_size=2) as converter:
+            self.assertRaises(ValueError, converter.word_to_num, ['one', 'two', 'on'])
+            self.assertEqual(converter.word_to_num(['one', 'two']), [1, 2])
+        with w2n2w.ParallelConverter(workers=1, errors='skip') as converter:
+            self.assertEqual(list(converter.imap_word_to_num(['one', 'on', 'two'])), [1, 2])
+        self.assertRaises(RuntimeError, w2n2w.ParallelConverter().word_to_num, ['one'])
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == 'fork', 'workers need to inherit the mock')
+    def test_worker_killed(self):
+        def convert(words):
+            if words == 'die':
+                os.kill(os.getpid(), signal.SIGKILL)
+            return w2n2w.word_to_num(words)
+
+        words = ['one', 'two', 'die', 'three', 'four', 'five']
+        with mock.patch('w2n2w.parallel.word_to_num', convert):
+            with w2n2w.ParallelConverter(workers=2, chunk_size=2, errors='default') as converter:
+                # only the chunk the worker died on fails, and a new pool carries on
+                self.assertEqual(converter.word_to_num(words), [1, 2, None, None, 4, 5])
+                self.assertEqual([failure[:2] for failure in converter.failures], [(2, 'die'), (3, 'three')])
+                self.assertIsInstance(converter.failures[0][2], BrokenProcessPool)
+                self.assertEqual(list(converter.imap_word_to_num(words)), [1, 2, None, None, 4, 5])
+                self.assertEqual(converter.word_to_num(['six']), [6])
+
+
+class TestAsync(unittest.TestCase):
+    def run_async(self, agen):
+        async def collect():
+            return [i async for i in agen]
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(collect())
+        finally:
+            loop.close()
+
+    def test_async(self):
+        words = ['forty three', 'one', 'on', 'seventy first'] * 50
+
+        async def source():
+            for word in words:
+                yield word
+
+        expected = w2n2w.word_to_num_many(words, errors='default')
+        self.assertEqual(self.run_async(w2n2w.word_to_num_async(source(), errors='default', batch_size=7)), expected)
+        self.assertEqual(self.run_async(w2n2w.word_to_num_async(words, errors='skip')), [i for i in expected if i])
+        self.assertEqual(self.run_async(w2n2w.word_to_num_async(['dos', 'tres'], locale='es')), [2, 3])
+        with ProcessPoolExecutor(2) as executor:
+            nums = list(range(-50, 500))
+            self.assertEqual(
+                self.run_async(w2n2w.num_to_word_async(nums, batch_size=16, executor=executor)),
+                [w2n2w.num_to_word(i) for i in nums]
+            )
+        self.assertRaises(ValueError, self.run_async, w2n2w.word_to_num_async(words))
+        # python 3.6 doesn't have `asyncio.get_running_loop`
+        with mock.patch('w2n2w.aio._get_running_loop', asyncio.get_event_loop):
+            self.assertEqual(self.run_async(w2n2w.word_to_num_async(['dos', 'tres'], locale='es')), [2, 3])
+        self.assertRaises(ValueError, w2n2w.word_to_num_async, words, batch_size=0)
+
+    def test_backpressure(self):
+        pulled = []
+
+        async def source():
+            for i in range(10_000):
+                pulled.append(i)
+                yield i
+
+        async def first():
+            agen = w2n2w.num_to_word_async(source(), batch_size=10, max_pending=2)
+            result = await agen.__anext__()
+            # give the producer every chance to run ahead
+            for _ in range(50):
+                await asyncio.sleep(0)
+            await agen.aclose()
+            return result
+
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(first()), 'zero')
+        finally:
+            loop.close()
+        self.assertLessEqual(len(pulled), 50)
+
+
+class TestCommandLine(unittest.TestCase):
+    def run_main(self, argv, text):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        code = cli.main(argv, stdin=io.StringIO(text), stdout=stdout, stderr=stderr)
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_to_num(self):
+        code, out, err = self.run_main(['to-num'], 'forty three\nnot a number\nseventy first\n')
+        self.assertEqual((code, out), (1, '43\n\n71\n'))
+        self.assertIn('3 lines', err)
+        self.assertIn('1 errors', err)
+        code, out, err = self.run_main(['to-num', '--skip-errors', '--quiet'], 'forty three\nnot a number\n')
+        self.assertEqual((code, out, err), (1, '43\n', ''))
+
+    def test_to_words(self):
+        text = ''.join(f'{i}\n' for i in range(-50, 2000, 7))
+        expected = ''.join(w2n2w.num_to_word(i) + '\n' for i in range(-50, 2000, 7))
+        for workers in ('1', '2'):
+            code, out, err = self.run_main(['to-words', '-w', workers, '-c', '16'], text)
+            self.assertEqual((code, out), (0, expected))
+        self.assertEqual(self.run_main(['to-words', '-q'], ''), (0, '', ''))
+
+    def test_in_text(self):
+        code, out, err = self.run_main(['to-num', '--in-text'], 'it was forty three\nor 44 degrees\n')
+        self.assertEqual((code, out), (0, 'it was 43\nor 44 degrees\n'))
+        self.assertIn('2 numbers', err)
+        with self.assertRaises(SystemExit), mock.patch('sys.stderr', io.StringIO()):
+            self.run_main(['to-num', '--in-text', '-w', '2'], '')
+
 
 if __name__ == '__main__':
     unittest.main()
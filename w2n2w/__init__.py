@@ -1,4 +1,12 @@
 import math
+import re
+from collections import namedtuple
+from decimal import ROUND_HALF_EVEN, Context, Decimal
+from fractions import Fraction
+from types import MappingProxyType
+
+from .cache import MISSING, CacheInfo, ConversionCache
+from .fuzzy import FuzzyIndex
 
 magnitudes = {
     'hundred': 100,
@@ -56,7 +64,10 @@ ordinal_words = {
     'nineteenth': 19,
     'twentieth': 20,
     'thirtieth': 30,
+    # 'fourtieth' is a misspelling, but it was here first so it's still accepted.
+    # 'fortieth' comes after it so that it's the one `num_to_word` uses
     'fourtieth': 40,
+    'fortieth': 40,
     'fiftieth': 50,
     'sixtieth': 60,
     'seventieth': 70,
@@ -108,23 +119,186 @@ number_words = {
 # this comes in useful in num_to_word. Exclude plurals because they're a hassle to filter out later
 number_words_backwards = {v: k for k, v in number_words.items() if not k.endswith('s')}
 # comes in useful in both functions
-_split_magnitudes = [
+_split_magnitudes = tuple(
     i for i in list(magnitudes.keys()) + list(ordinal_magnitudes.keys()) if i not in ('hundred', 'hundredth')
-]
+)
+
+# every thread shares these tables, so make them read-only. Nothing can change them halfway through
+# a conversion and the conversions never need a lock to read them
+magnitudes = MappingProxyType(magnitudes)
+decimal_words = MappingProxyType(decimal_words)
+ordinal_magnitudes = MappingProxyType(ordinal_magnitudes)
+ordinal_words = MappingProxyType(ordinal_words)
+fraction_words = MappingProxyType(fraction_words)
+number_words = MappingProxyType(number_words)
+number_words_backwards = MappingProxyType(number_words_backwards)
+# `num_to_word` reads this one a lot and a proxy is slower to read than the dict underneath it
+_words_backwards = dict(number_words_backwards)
+# the magnitude of each 3 digit group in `num_to_word`, smallest first
+_group_magnitudes = ('',) + tuple(i for i in _split_magnitudes if i not in ordinal_magnitudes)
+# the word for each digit after a decimal point, as a table for `str.translate`. Each word has a space
+# on the end so a whole string of digits can be translated in one go
+_digit_words = str.maketrans({str(v): k + ' ' for k, v in decimal_words.items()})
+# the same words as `fraction_words`, keyed on the exact fraction, so that `Fraction(1, 3)` is 'one third'
+_exact_fractions = {
+    Fraction(1, ordinal_words[k]) if k in ordinal_words else Fraction(v): _words_backwards[v]
+    for k, v in fraction_words.items() if not k.endswith('s')
+}
+
+# the types `num_to_word` can convert, apart from strings
+_number_types = (int, float, Decimal, Fraction)
+
+
+class TokenKind():
+    '''The kinds of token that `Word2Number.tokenize` produces'''
+    DIGITS = 0  # a run of digits, eg: '12'
+    NUMBER = 1  # any other word in `number_words`, eg: 'twelve' or 'hundred'
+    FRACTION = 2  # a word in `fraction_words`, eg: 'third' or 'millionths'
+    MAGNITUDE = 3  # a word in `magnitudes` and `_split_magnitudes`, eg: 'million'
+    ORDINAL_MAGNITUDE = 4  # a word in `ordinal_magnitudes` and `_split_magnitudes`, eg: 'millionth'
+    AND = 5
+    OF = 6
+    POINT = 7  # the word 'point' or a decimal point
+    OTHER = 8  # anything we don't recognise
+
+    # the kinds that count as number words
+    numbers = (NUMBER, FRACTION, MAGNITUDE, ORDINAL_MAGNITUDE)
+
+
+Token = namedtuple('Token', ('kind', 'word', 'value', 'pos'))
+_new_token = tuple.__new__
+Token.__doc__ = '''
+A single word from a phrase.
+
+Attributes:
+    kind (int): one of the `TokenKind` constants
+    word (str): the word itself
+    value (int or float): the value of the word, or None if it doesn't have one
+    pos (int): where the word starts in the phrase
+'''
+
+from .lexicon import Lexicon, _start_size, available_locales, get_locale, register_locale  # noqa: E402
+
+# the tables above compiled into the lexicon that `Word2Number` uses by default.
+# Other locales are loaded when they are first used, see `w2n2w.lexicon`
+english_lexicon = Lexicon(
+    'en', number_words, magnitudes, decimal_words, ordinal_words=ordinal_words,
+    ordinal_magnitudes=ordinal_magnitudes, fraction_words=fraction_words, hundred_words=('hundred',),
+    article_words=('one', 'a'), and_words=('and',), of_words=('of',), point_words=('point',),
+    negative_words=('minus', 'negative')
+)
+register_locale('en', english_lexicon)
+_lexicon = english_lexicon.tokens
+
+
+def _unknown_word(word):
+    # the kind, word and value fields for a word that isn't in `_lexicon`
+    if word.isdecimal():
+        return (TokenKind.DIGITS, word, int(word))
+    return (TokenKind.OTHER, word, None)
+
+
+# words that can turn a chunk into a fraction
+_fractional_kinds = (TokenKind.FRACTION, TokenKind.ORDINAL_MAGNITUDE)
+# (total, multiplier) for each chunk `Word2Number.process_chunk` has seen, keyed on the
+# chunk's words, whether ordinals were allowed and the lexicon. Oldest chunks are thrown away first
+_chunk_cache = {}
+_chunk_cache_size = 8192
+
+# words are separated by whitespace and hyphens. Decimal points are words in their own right
+_token_pattern = re.compile(r'[^\s.-]+|\.')
 
 
 class Word2Number():
-    '''Class to group the internal functions used to convert words to numbers'''
+    '''
+    Class to group the internal functions used to convert words to numbers.
+    Every stage uses the vocabulary in `lexicon`. Other locales use subclasses with their own lexicon
+    '''
+    lexicon = english_lexicon
+
+    @classmethod
+    def tokenize(cls, words: str):
+        '''
+        Splits a phrase into a list of tokens in a single pass.
+        Every other stage works on these tokens rather than on the string.
+
+        Args:
+            words (str): the (lower case) phrase to tokenize
+
+        Returns:
+            list: list of `Token`
+
+        Example:
+            ```python
+            print([t.word for t in Word2Number.tokenize('twenty-two point 5')])
+            # ['twenty', 'two', 'point', '5']
+            ```
+        '''
+        # we skip the namedtuple's python-level __new__ in here because this is the hottest loop we have
+        tokens = []
+        lexicon = cls.lexicon
+        lookup = lexicon._tokens.get
+        if '.' in words or '-' in words:
+            for match in _token_pattern.finditer(words):
+                word = match.group()
+                tokens.append(_new_token(Token, (lookup(word) or _unknown_word(word)) + (match.start(),)))
+        else:
+            # the common case. Let str.split do the hard work and find the positions as we go
+            pos = 0
+            for word in words.split():
+                pos = words.find(word, pos)
+                tokens.append(_new_token(Token, (lookup(word) or _unknown_word(word)) + (pos,)))
+                pos += len(word)
+
+        if lexicon.compounds:
+            # some languages write numbers as one word, eg: German 'einundzwanzig'.
+            # Split up any words we don't know into ones we do
+            split = []
+            for token in tokens:
+                parts = lexicon.split_compound(token.word) if token.kind == TokenKind.OTHER else None
+                if parts:
+                    split.extend(_new_token(Token, lookup(part) + (token.pos,)) for part in parts)
+                else:
+                    split.append(token)
+            tokens = split
+        return tokens
+
     @staticmethod
-    def split_by_magnitude(words: str):
+    def split_tokens(tokens: list, kind: int):
+        '''
+        Splits a list of tokens on every token of a certain kind, as long as
+        that token isn't the first or the last in the list.
+        Like `str.split(' and ')`, this never produces an empty part, so
+        'ten and and two' is split into ['ten'] and ['and', 'two'].
+
+        Args:
+            tokens (list): list of `Token`
+            kind (int): the `TokenKind` to split on
+
+        Returns:
+            list: list of lists of `Token`
+        '''
+        parts = []
+        start = 0
+        for index in range(1, len(tokens) - 1):
+            if tokens[index].kind == kind and index > start:
+                parts.append(tokens[start: index])
+                start = index + 1
+        parts.append(tokens[start:])
+        return parts
+
+    @classmethod
+    def split_by_magnitude(cls, words, last=None):
         '''
         Splits strings by words of magnitude orders.
 
         Args:
-            words (str): the string to split
+            words (str or list): the string to split, or a list of `Token`
+            last (dict): the position of the right-most occurrence of each magnitude,
+                keyed by its place in `lexicon.split_order`. Worked out from `words` if not given
 
         Returns:
-            list: list of str
+            list: list of str, or a list of lists of `Token` if `words` was a list
 
         Example:
             ```python
@@ -132,23 +306,37 @@ class Word2Number():
             # ['five million', 'sixty five thousand', 'two hundred and twenty three']
             ```
         '''
+        tokens = cls.tokenize(words) if type(words) == str else words
+
+        if last is None:
+            # find the right-most occurrence of each magnitude word
+            last = {}
+            split_order = cls.lexicon._split_order
+            for index, token in enumerate(tokens):
+                order = split_order.get(token.word)
+                if order is not None:
+                    last[order] = index
+
         groups = []
+        start = 0
         # split the number by magnitude, so 'four hundred thousand seven hundred and twelve'
         # gets split into ['four hundred thousand', 'seven hundred twelve']
-        for m in reversed(_split_magnitudes):
-            if m in words:
-                # for each magnitude, if it's present in the phrase,
-                # find it's right-most occurrence and everything after that
-                # must be in the lower magnitude bracket
-                pos = words.rindex(m)
-                groups.append(words[: pos + len(m)].strip())
-                words = words[pos + len(m):].strip()
-        if words:
+        for order in sorted(last):
+            # for each magnitude, if it's still present in the phrase then
+            # everything after it's right-most occurrence must be in the
+            # lower magnitude bracket
+            pos = last[order]
+            if pos >= start:
+                groups.append(tokens[start: pos + 1])
+                start = pos + 1
+        if start < len(tokens):
             # if there are numbers not grouped yet then them on the end
             # these are likely the ones that dont meet any magnitude bracket
             # (0-999)
-            groups.append(words)
+            groups.append(tokens[start:])
 
+        if type(words) == str:
+            return [' '.join(t.word for t in group) for group in groups]
         return groups
 
     @staticmethod
@@ -189,7 +377,7 @@ class Word2Number():
         return result
 
     @classmethod
-    def process_chunk(cls, item: str, ordinals=False):
+    def process_chunk(cls, item: str, ordinals=False, split_and=True):
         '''
         Processes a 'chunk' and returns the number we think it is.
         Chunks should be of a single magnitude order (use `Word2Number.split_by_magnitude`)
@@ -202,10 +390,22 @@ class Word2Number():
         23 million.
 
         Args:
-            item (str): the chunk to parse
+            item (str or list): the chunk to parse, or a list of `Token`
             ordinals (bool): allow us to parse words like "third" as an ordinal (3rd) instead
                 of as a fraction (1/3)
+            split_and (bool): split the chunk up by the word "and". Callers that already
+                know there is no "and" in the chunk can turn this off to skip looking for one
         '''
+        if type(item) == str:
+            item = cls.tokenize(item)
+
+        # the same chunks turn up inside lots of different phrases, so remember what they came out as
+        lexicon = cls.lexicon
+        key = (tuple([token.word for token in item]), ordinals, lexicon)
+        cached = _chunk_cache.get(key)
+        if cached is not None:
+            return list(cached[0]), cached[1]
+
         multiplier = 1
         total = []
         latent_total = 0  # a total we add to the main total after the processing is done
@@ -215,13 +415,32 @@ class Word2Number():
         run_gbm = False  # see the fraction section for this ones usage
         fails = []  # invalid words we failed to parse
 
-        if ' and ' in item:
+        pieces = cls.split_tokens(item, TokenKind.AND) if split_and else None
+        if pieces and len(pieces) > 1:
             # items like 'ten and two thirds' should be interpreted as "10 + 2/3"
             it = []
-            for i in item.split(' and '):
+            start = 0  # where the current piece starts in `item`
+            for i in pieces:
                 # for each "and" statement
-                tmp_total, tmp_multiplier = cls.process_chunk(i)
-                tmp_result = (sum(tmp_total) or 1) * tmp_multiplier
+                kinds = {t.kind for t in i}
+                if kinds.isdisjoint(TokenKind.numbers) and TokenKind.DIGITS not in kinds:
+                    if any(t.word in lexicon.negative_words for t in i) and all(
+                        t.word in lexicon.negative_words or t.kind == TokenKind.AND for t in i
+                    ):
+                        # a stray sign, eg: the 'minus' in '- minus and three'. Skip it like
+                        # any other word we don't know instead of failing the whole chunk
+                        start += len(i) + 1
+                        continue
+                    # same error that processing the piece would raise
+                    raise ValueError('failed to parse. No valid number words detected')
+                elif kinds.isdisjoint(_fractional_kinds):
+                    # without any fraction words the piece can only ever come out as
+                    # an int, so we don't need to process it on its own to find that out
+                    tmp_result = 0
+                else:
+                    tmp_total, tmp_multiplier = cls.process_chunk(i, split_and=False)
+                    tmp_result = (sum(tmp_total) or 1) * tmp_multiplier
+
                 if type(tmp_result) == float:
                     # if it was a fraction we will add that up at the end
                     # eg: 'forty five and two thirds'. Process the 45
@@ -231,34 +450,44 @@ class Word2Number():
                     # otherwise, we should process it with the rest of the phrase
                     # eg: 'four hundred and fifty six trillion' NEEDS to be
                     # processed as one item
-                    it.append(i)
+                    if it:
+                        # keep the 'and' that came before this piece
+                        it.append(item[start - 1])
+                    it.extend(i)
+                start += len(i) + 1
 
             # now, all processed items have been removed so we can
             # re-construct the items list and move on
-            item = ' and '.join(it)
-
-        item = item.split()
-        for word in item:
-            if word.isdigit():
-                total.append(int(word))
-            elif word in number_words:
-                if word in _split_magnitudes:
-                    # if the current word is a magnitude word then increase the multiplier
-                    if word in magnitudes:
-                        multiplier *= magnitudes[word]
-                    else:
-                        if not ordinals:
-                            multiplier *= 1 / ordinal_magnitudes[word]
-                        else:
-                            run_gbm = True
-                            total.append(ordinal_magnitudes[word])
-                elif word == 'hundred' or (word == 'hundredth' and previous not in ('one', 'a')):
+            item = it
+
+        for token in item:
+            word = token.word
+            kind = token.kind
+            if kind == TokenKind.DIGITS:
+                total.append(token.value)
+            elif kind == TokenKind.MAGNITUDE:
+                # if the current word is a magnitude word then increase the multiplier
+                multiplier *= token.value
+            elif kind == TokenKind.ORDINAL_MAGNITUDE:
+                if not ordinals:
+                    multiplier *= 1 / token.value
+                else:
+                    run_gbm = True
+                    total.append(token.value)
+            elif kind == TokenKind.NUMBER or kind == TokenKind.FRACTION:
+                if word in lexicon.hundred_words or (
+                    word in lexicon.hundredth_words and previous not in lexicon.article_words
+                ):
                     # for phrases like "one hundred 23 million"
                     # we don't want to increase the multiplier by 100, we want
                     # to add 100 to the total so we do that here
                     # but for phrases like 'one hundredth' we want to parse that
                     # as 1/100 (so not here)
                     if total:
+                        if run_gbm and any(type(i) == tuple for i in total):
+                            # an ordinal or a fraction before the 'hundred', like 'third hundred'.
+                            # It isn't a number, and we can't add up an undecided word anyway
+                            raise ValueError('failed to parse. Found a fraction before "hundred"')
                         # if total already contains some items then multiply all of them
                         # by 100
                         total = [sum(total) * 100]
@@ -266,17 +495,17 @@ class Word2Number():
                         # if total doesn't contain any items then set
                         # it to 100
                         total = [100]
-                elif word in fraction_words:
+                elif kind == TokenKind.FRACTION:
                     # the run_gbm bool controls whether we run our total through
                     # cls.group_by_magnitude_order to decide what to do about some fractions
                     run_gbm = True
-                    if ordinals and word in ordinal_words:
+                    if ordinals and word in lexicon.ordinal_words:
                         # try to figure out what to do between cases such as:
                         # 'seventy fifth' (as in 75th) or 'seventy fifths' (as in 70*(1/5))
                         if previous:
                             # if this is not the first word in the sequence then treat as a fraction
                             # otherwise continue deciding
-                            if word.endswith('s') or previous in ('one', 'a'):
+                            if word.endswith('s') or previous in lexicon.article_words:
                                 # if the word ends with 's' then it's more likely to be
                                 # pluralised fraction (eg: three quarters) and if the previous word is
                                 # 'one' or 'a' then the phrase is probably 'one third' which is definitely
@@ -285,30 +514,30 @@ class Word2Number():
                             else:
                                 # if we have decided that it's probably not a fraction then process it as an ordinal
                                 # and return to the beginning of the loop
-                                total.append(ordinal_words[word])
+                                total.append(lexicon.ordinal_words[word])
                                 continue
 
-                    if word in ordinal_words:
+                    if word in lexicon.ordinal_words:
                         # if the number could be a fraction or ordinal we attatch both
                         # and then decide which to use when we run the magnitude
                         # grouper
-                        total.append((ordinal_words[word], fraction_words[word]))
+                        total.append((lexicon.ordinal_words[word], lexicon.fraction_words[word]))
                     else:
                         if prefix:
                             # eg: 'ten and a third' should be treated as 10+(2/3)
                             # so we append to total
-                            total.append(fraction_words[word])
+                            total.append(lexicon.fraction_words[word])
                         else:
                             # eg: 'two thirds'
-                            multiplier *= fraction_words[word]
+                            multiplier *= lexicon.fraction_words[word]
                             prefix = None
                 else:
                     # otherwise they must be in the number dict
-                    total.append(number_words[word])
+                    total.append(token.value)
             else:
                 # dont parse words that arent numbers
                 prefix = word
-                fails.append(word)
+                fails.append(token)
             previous = word
 
         if run_gbm and (total and (len(total) > 1 or type(total[0]) == tuple)):
@@ -337,20 +566,410 @@ class Word2Number():
         if latent_total:
             total.append(latent_total)
 
-        if fails == item:
+        if len(fails) == len(item):
             # if every word was invalid
             raise ValueError('failed to parse. No valid number words detected')
 
+        if len(_chunk_cache) >= _chunk_cache_size:
+            # throw away the oldest chunk. Another thread may have got there first, or be
+            # changing the cache while we look for the oldest, which is fine, it's only a cache
+            try:
+                _chunk_cache.pop(next(iter(_chunk_cache)), None)
+            except (StopIteration, RuntimeError):
+                pass
+        _chunk_cache[key] = (tuple(total), multiplier)
         return total, multiplier
 
+    @classmethod
+    def normalize(cls, words: str):
+        '''
+        Lower-cases a phrase, strips the sign off the front and replaces hyphens.
+        Two phrases that normalize to the same thing will always convert to the same number.
+
+        Args:
+            words (str): the phrase to normalize
+
+        Returns:
+            tuple: the normalized phrase (str) and whether it was negative (bool)
+        '''
+        # convert to lower case and strip whitespace
+        words = words.lower().strip()
+        # decide whether this will be a negative number
+        lexicon = cls.lexicon
+        minus = False
+        if words.startswith('-'):
+            minus = True
+            words = words[1:]
+        elif words.startswith(lexicon.negative_words):
+            minus = True
+            for word in lexicon.negative_words:
+                if words.startswith(word):
+                    words = words[len(word):].strip()
+                    break
+
+        # replace hyphens, strip extra spaces
+        words = words.replace('-', ' ').strip()
+        if lexicon.replacements:
+            words = lexicon.replace(words)
+        return words, minus
+
+    @classmethod
+    def could_be_number(cls, words: str):
+        '''
+        A quick check of whether a phrase that has been through `Word2Number.normalize` could be a number.
+        A phrase needs at least one number word or some digits to be a number, so this only
+        looks at the first few characters of each word to see if it could be one of those.
+
+        Args:
+            words (str): the normalized phrase
+
+        Returns:
+            bool: False if `Word2Number.evaluate` would definitely raise an error. If it's True the phrase
+                is probably a number, but `Word2Number.evaluate` is the only way to be sure
+        '''
+        starts = cls.lexicon._starts
+        if '.' in words:
+            words = words.replace('.', ' ')
+        for word in words.split():
+            if word[:_start_size] in starts or word[0].isdigit() or word[0] == '+':
+                return True
+        return False
+
+    @classmethod
+    def correct(cls, words: str, max_edits=1):
+        '''
+        Replaces misspelt words in a phrase that has been through `Word2Number.normalize` with the
+        closest words in `lexicon.number_words`. See `Lexicon.closest_word`.
+        Words the lexicon already knows, words with digits in and compound words are left alone.
+
+        Ordinary words can be close to number words too, so a word is only corrected if it's next to
+        a word the lexicon knows (or digits), next to another word that's being corrected, or it's the
+        whole phrase. So 'night' on its own is read as 'eight' but the 'night' in 'night shift' isn't touched.
+        Real words next to number words are still corrected: 'one tree' becomes 'one three'.
+
+        Args:
+            words (str): the normalized phrase
+            max_edits (int): the most edits a word can be away from the word it's replaced with
+
+        Returns:
+            str: the corrected phrase, or `words` itself if nothing needed correcting
+
+        Example:
+            ```python
+            print(Word2Number.correct('fourty thousnad and ninty'))
+            # 'forty thousand and ninety'
+            ```
+        '''
+        lexicon = cls.lexicon
+        known = lexicon._tokens
+        split = words.split()
+        # for each word, the word to replace it with, or None if it isn't misspelt
+        closest = [None] * len(split)
+        corrected = False
+        for index, word in enumerate(split):
+            if word not in known and word.isalpha() and not (lexicon.compounds and lexicon.split_compound(word)):
+                closest[index] = lexicon.closest_word(word, max_edits)
+                if closest[index] is not None:
+                    corrected = True
+        if not corrected:
+            return words
+
+        def anchors(index):
+            # whether the word at `index` can vouch for a misspelt word next to it
+            if index < 0 or index >= len(split):
+                return False
+            word = split[index]
+            return closest[index] is not None or word in known or word[0].isdigit()
+
+        for index, word in enumerate(closest):
+            if word is not None and (len(split) == 1 or anchors(index - 1) or anchors(index + 1)):
+                split[index] = word
+        return ' '.join(split)
+
+    @classmethod
+    def evaluate(cls, words: str):
+        '''
+        Converts a phrase that has already been through `Word2Number.normalize` into a number.
+        The sign is not applied here, that is left to the caller.
+
+        Args:
+            words (str): the normalized phrase
+
+        Returns:
+            int or float
+
+        Raises:
+            ValueError: if `words` is invalid
+        '''
+        # run some checks to see if we can get away with taking shortcuts instead
+        # of doing any actual work :)
+        lexicon = cls.lexicon
+        if words.isdigit():
+            return int(words)
+        elif words in lexicon.ordinal_words:
+            # we check ordinal words individually because words like 'third'
+            # are overwritten by fraction words.
+            return lexicon.ordinal_words[words]
+        elif words in lexicon.number_words:
+            return lexicon.number_words[words]
+        elif ' ' not in words:
+            # float() never accepts spaces in the middle so only try this on single words
+            try:
+                # words like '1.5' will fail the isdigit() check so try this
+                return float(words)
+            except Exception:
+                pass
+
+        table = _phrase_table
+        if table is not None and lexicon is english_lexicon:
+            value = table.word_to_num(words)
+            if value is not None:
+                return value
 
-def word_to_num(words):
+        return cls.evaluate_tokens(cls.tokenize(words))
+
+    @classmethod
+    def evaluate_tokens(cls, tokens: list, groups=None):
+        '''
+        Converts a list of tokens from `Word2Number.tokenize` into a number.
+        The sign is not applied here, that is left to the caller.
+
+        Args:
+            tokens (list): list of `Token`
+            groups (list): if given, a (tokens, value) pair is added to this for each of the
+                magnitude groups the phrase was split into (see `Word2Number.split_by_magnitude`).
+                The value is None for groups that couldn't be parsed and were skipped.
+                For decimals, these are the groups before the point
+
+        Returns:
+            int or float
+
+        Raises:
+            ValueError: if `tokens` is invalid, or none of its groups could be parsed
+        '''
+        if len(tokens) == 1:
+            # same shortcuts as `Word2Number.evaluate`, for when we
+            # are called on one side of a decimal point
+            token = tokens[0]
+            value = None
+            if token.kind == TokenKind.DIGITS:
+                value = token.value
+            elif token.word in cls.lexicon.ordinal_words:
+                value = cls.lexicon.ordinal_words[token.word]
+            elif token.kind in TokenKind.numbers:
+                value = token.value
+            if value is not None:
+                if groups is not None:
+                    groups.append((tokens, value))
+                return value
+
+        # make sure that the input value actually has some numbers for us.
+        # While we're at it, find any decimal points, which connecting words are
+        # present and where each magnitude is so that later stages don't have to look
+        valid = False
+        points = []
+        connectors = set()
+        last = {}
+        split_order = cls.lexicon._split_order
+        for index, token in enumerate(tokens):
+            kind = token.kind
+            if kind in TokenKind.numbers:
+                valid = True
+                order = split_order.get(token.word)
+                if order is not None:
+                    last[order] = index
+            elif kind == TokenKind.POINT:
+                points.append(index)
+            elif kind == TokenKind.AND or kind == TokenKind.OF:
+                connectors.add(kind)
+        if not valid:
+            raise ValueError('failed to parse. No valid number words detected')
+
+        if points:
+            # so it's a decimal number, split the tokens either side of the point
+            if len(points) > 1:
+                raise ValueError('too many occurences of "point" to be a valid decimal')
+            return cls.process_decimal(tokens[: points[0]], tokens[points[0] + 1:], groups)
+
+        top = split_order.get(cls.lexicon._top_magnitude)
+        if top in last and TokenKind.OF not in connectors:
+            # a number too big for our magnitude words, like 'one decillion two thousand decillion'
+            for token in tokens[: last[top]]:
+                if token.kind == TokenKind.MAGNITUDE:
+                    return cls.evaluate_stacked(tokens, groups)
+
+        result = None
+        split_and = TokenKind.AND in connectors
+        split_of = TokenKind.OF in connectors
+        chunks = cls.split_by_magnitude(tokens, last)
+        for index, chunk in enumerate(chunks):
+            try:
+                # only allow parsing of ordinals for the last item
+                value = cls.evaluate_chunk(chunk, index == len(chunks) - 1, split_and, split_of)
+            except ValueError:
+                value = None
+            else:
+                result = value if result is None else result + value
+            if groups is not None:
+                groups.append((chunk, value))
+
+        if result is None:
+            # chunks that can't be parsed are skipped, but there has to be something left
+            raise ValueError('failed to parse. None of the phrase is a valid number')
+        return result
+
+    @classmethod
+    def evaluate_stacked(cls, tokens: list, groups=None):
+        '''
+        Converts a list of tokens with more than one magnitude word up to the last occurrence of
+        `lexicon`'s biggest magnitude. This is how `num_to_word` writes numbers too big for any
+        of the magnitude words: each occurrence of the biggest magnitude multiplies everything before it,
+        so 'one decillion two thousand decillion and five' is (10**33 + 2000) * 10**33 + 5.
+
+        The phrase is split up on the biggest magnitude and each part is converted on its own
+        with `Word2Number.evaluate_tokens`. The sign is not applied here, that is left to the caller.
+
+        Args:
+            tokens (list): list of `Token`
+            groups (list): see `Word2Number.evaluate_tokens`. There is a group for each part,
+                with the magnitude word after it, and the value is what the part adds to the number
+
+        Returns:
+            int or float
+
+        Raises:
+            ValueError: if `tokens` is invalid
+        '''
+        top = cls.lexicon._top_magnitude
+        parts = [[]]
+        for token in tokens:
+            if token.word == top:
+                parts[-1].append(token)
+                parts.append([])
+            else:
+                parts[-1].append(token)
+
+        # work from the right so each part is only multiplied once, by every magnitude after it.
+        # Parts we can't parse are skipped, the same as `Word2Number.evaluate_tokens` does with chunks
+        result = None
+        found = []
+        size = 1
+        for index in range(len(parts) - 1, -1, -1):
+            part = parts[index]
+            if index < len(parts) - 1:
+                size *= part[-1].value
+                part = part[:-1]
+            if part:
+                try:
+                    value = cls.evaluate_tokens(part) * size
+                except ValueError:
+                    value = None
+                else:
+                    result = value if result is None else result + value
+            elif index == 0:
+                # 'decillion decillion' is one decillion decillion
+                value = size
+                result = value if result is None else result + value
+            else:
+                # no words between two magnitudes, eg: 'one decillion decillion'
+                value = 0
+            found.append((parts[index], value))
+
+        if groups is not None:
+            groups.extend(reversed(found))
+        if result is None:
+            raise ValueError('failed to parse. None of the phrase is a valid number')
+        return result
+
+    @classmethod
+    def evaluate_chunk(cls, chunk: list, ordinals=False, split_and=True, split_of=True):
+        '''
+        Converts one of the chunks from `Word2Number.split_by_magnitude` into a number.
+
+        Args:
+            chunk (list): list of `Token`
+            ordinals (bool): see `Word2Number.process_chunk`. Only the last chunk of a phrase allows ordinals
+            split_and (bool): see `Word2Number.process_chunk`
+            split_of (bool): split the chunk up by the word "of". Callers that already
+                know there is no "of" in the chunk can turn this off to skip looking for one
+
+        Returns:
+            int or float
+
+        Raises:
+            ValueError: if `chunk` is invalid
+        '''
+        parts = cls.split_tokens(chunk, TokenKind.OF) if split_of else None
+        if parts and len(parts) > 1:
+            # 'of' is treated as a multiplication
+            mults = []
+            # process each chunk
+            for i in parts:
+                total, multiplier = cls.process_chunk(i, ordinals=ordinals, split_and=split_and)
+                mults.append((sum(total) or 1) * multiplier)
+            # multiply all the chunks together at the end
+            num = mults[0]
+            for i in mults[1:]:
+                num *= i
+            return num
+
+        # if there's not 'of' in the chunk then process normally
+        total, multiplier = cls.process_chunk(chunk, ordinals=ordinals, split_and=split_and)
+        return (sum(total) or 1) * multiplier
+
+    @classmethod
+    def process_decimal(cls, left: list, right: list, groups=None):
+        '''
+        Processes the tokens either side of a decimal point.
+
+        Args:
+            left (list): list of `Token` before the point. Parsed as a regular number
+            right (list): list of `Token` after the point. These must be digits
+                or words in `lexicon.decimal_words`
+            groups (list): see `Word2Number.evaluate_tokens`. Only the left is split into groups
+
+        Returns:
+            float
+
+        Raises:
+            ValueError: if either side is invalid
+        '''
+        if not left:
+            # EG: "point five"
+            left = 0
+        else:
+            # the left is a regular number with regular rules
+            left = cls.evaluate_tokens(left, groups)
+
+        r = ''
+        decimal_words = cls.lexicon.decimal_words
+        for token in right:
+            if token.kind == TokenKind.DIGITS:
+                r += token.word
+            elif token.word in decimal_words:
+                # only sample from decimal_words because decimals should be in
+                # standard format, ie: noone should say "one point nineteen"
+                # it should be "one point one nine" and if we open the can
+                # of worms to parse that then we have to decide how to parse
+                # things like "one point twenty three". Is it 1.23 or 1.203?
+                r += str(decimal_words[token.word])
+            else:
+                raise ValueError(f'invalid decimal word "{token.word}"')
+
+        return float(f'{left}.{r}')
+
+
+def word_to_num(words, locale=None, max_edits=0):
     '''
     Converts a word, like "three" or "sixty seven" to a number.
     Can also handle decimals and negative numbers.
 
     Args:
         words (str): the words to convert
+        locale (str or Lexicon): the language `words` is in, eg: 'es'.
+            Defaults to English. See `available_locales`
+        max_edits (int): correct misspelt words that are up to this many edits away from a number word,
+            eg: 'fourty' -> 'forty'. 0 turns this off. See `Word2Number.correct`
 
     Returns:
         int
@@ -358,132 +977,191 @@ def word_to_num(words):
 
     Raises:
         TypeError: if `words` is not a string
-        ValueError: if `words` is invalid
+        ValueError: if `words` is invalid, or `locale` doesn't exist
     '''
     if type(words) != str:
         raise TypeError('word must be a string')
 
-    # convert to lower case and strip whitespace
-    words = words.lower().strip()
-    # decide whether this will be a negative number
-    if words.startswith('minus'):
-        minus = True
-        words = words[6:].strip()
-    elif words.startswith('negative'):
-        minus = True
-        words = words[8:].strip()
-    elif words.startswith('-'):
-        minus = True
-        words = words[1:]
-    else:
-        minus = False
+    parser = Word2Number if locale is None else _parser(locale)
+    words, minus = parser.normalize(words)
+    if max_edits:
+        words = parser.correct(words, max_edits)
+    words = _evaluate(words, parser)
+    # never -0.0
+    return -words if minus and words else words
 
-    # replace hyphens, strip extra spaces
-    words = words.replace('-', ' ').strip()
-
-    # run some checks to see if we can get away with taking shortcuts instead
-    # of doing any actual work :)
-    if words.isdigit():
-        words = int(words)
-        return -words if minus else words
-    elif words in ordinal_words:
-        # we check ordinal words individually because words like 'third'
-        # are overwritten by fraction words.
-        words = ordinal_words[words]
-        return -words if minus else words
-    elif words in number_words:
-        words = number_words[words]
-        return -words if minus else words
-    else:
-        try:
-            # words like '1.5' will fail the isdigit() check so try this
-            words = float(words)
-        except Exception:
-            pass
-        else:
-            return -words if minus else words
-
-    # make sure that the input value actually has some numbers for us
-    if all(i not in number_words and i not in ordinal_words for i in words.split()):
-        raise ValueError
-
-    if 'point' in words or '.' in words:
-        # so it's a decimal number decide on the delimiter, whether its the word "point"
-        # or a decimal point then split the word by that delimiter
-        delim = 'point' if 'point' in words else '.'
-        if words.count(delim) > 1:
-            raise ValueError(f'too many occurences of "{delim}" to be a valid decimal')
-        left, right = words.split(delim)
-        if not left:
-            # EG: "point five"
-            left = 0
-        else:
-            # the left is a regular number with regular rules so pass that to
-            # word_to_num to sort out
-            left = word_to_num(left)
 
-        r = ''
-        for i in right.split():
-            if i.isdigit():
-                r += i
-            else:
-                try:
-                    # only sample from decimal_words because decimals should be in
-                    # standard format, ie: noone should say "one point nineteen"
-                    # it should be "one point one nine" and if we open the can
-                    # of worms to parse that then we have to decide how to parse
-                    # things like "one point twenty three". Is it 1.23 or 1.203?
-                    r += str(decimal_words[i])
-                except ValueError:
-                    raise ValueError(f'invalid decimal word "{i}"')
+def try_word_to_num(words, default=None, locale=None, max_edits=0):
+    '''
+    Like `word_to_num` but returns `default` instead of raising an error when `words` isn't a number.
+    Phrases that can't be numbers are turned away early, so this is much quicker than catching
+    the errors from `word_to_num` when most of the inputs aren't numbers.
 
-        number = float(f'{left}.{r}')
-        return -number if minus else number
-    else:
-        result = 0
-        groups = Word2Number.split_by_magnitude(words)
-        for chunk in groups:
-            try:
-                # only allow parsing of ordinals for the last item
-                ordinals = chunk == groups[-1]
-                if ' of ' in chunk:
-                    # 'of' is treated as a multiplication
-                    mults = []
-                    # process each chunk
-                    for i in chunk.split(' of '):
-                        total, multiplier = Word2Number.process_chunk(i, ordinals=ordinals)
-                        mults.append((sum(total) or 1) * multiplier)
-                    # multiply all the chunks together at the end
-                    num = mults[0]
-                    for i in mults[1:]:
-                        num *= i
-                else:
-                    # if there's not 'of' in the chunk then process normally
-                    total, multiplier = Word2Number.process_chunk(chunk, ordinals=ordinals)
-                    num = (sum(total) or 1) * multiplier
+    Args:
+        words (str): the words to convert
+        default: what to return if `words` isn't a number
+        locale (str or Lexicon): the language `words` is in. See `word_to_num`
+        max_edits (int): see `word_to_num`
 
-                result += num
-            except ValueError:
-                pass
+    Returns:
+        int or float: the number, or `default` if `words` isn't a number or isn't a string
 
-        return -result if minus else result
+    Raises:
+        ValueError: if `locale` doesn't exist
+    '''
+    if type(words) != str:
+        return default
+
+    parser = Word2Number if locale is None else _parser(locale)
+    words, minus = parser.normalize(words)
+    if max_edits:
+        words = parser.correct(words, max_edits)
+    if not parser.could_be_number(words):
+        return default
+    try:
+        words = _evaluate(words, parser)
+    except ValueError:
+        return default
+    # never -0.0
+    return -words if minus and words else words
+
+
+def is_number_phrase(words, locale=None, max_edits=0):
+    '''
+    Checks whether `word_to_num` can convert a phrase. Most phrases that aren't numbers are turned
+    away after looking at the first few characters of each word. See `try_word_to_num`.
 
+    Args:
+        words (str): the words to check
+        locale (str or Lexicon): the language `words` is in. See `word_to_num`
+        max_edits (int): see `word_to_num`
+
+    Returns:
+        bool
 
-def num_to_word(num, prefer_fraction_words=True):
+    Raises:
+        ValueError: if `locale` doesn't exist
     '''
-    Converts a number into words. Can handle decimals and negatives
+    return try_word_to_num(words, MISSING, locale, max_edits) is not MISSING
+
+
+# the `Word2Number` subclass for each lexicon other than English
+_parsers = {}
+
+
+def _parser(locale):
+    # gets the `Word2Number` that uses a locale's lexicon
+    lexicon = locale if isinstance(locale, Lexicon) else get_locale(locale)
+    if lexicon is english_lexicon:
+        return Word2Number
+    parser = _parsers.get(lexicon)
+    if parser is None:
+        parser = _parsers.setdefault(lexicon, type('Word2Number', (Word2Number,), {'lexicon': lexicon}))
+    return parser
+
+
+def _evaluate(words, parser=Word2Number):
+    # `parser.evaluate`, but checks the cache first
+    cache = _caches['word_to_num']
+    if cache is None:
+        return parser.evaluate(words)
+    # English phrases are cached on their own. Anything else is cached with its lexicon
+    key = words if parser is Word2Number else (parser.lexicon, words)
+    result = cache.get(key)
+    if result is MISSING:
+        result = parser.evaluate(words)
+        cache.set(key, result)
+    return result
+
+
+def num_to_word(num, prefer_fraction_words=True, precision=None, significant_digits=None):
+    '''
+    Converts a number into words. Can handle decimals and negatives.
+
+    `Decimal`s are worded with exactly the digits they have, so `Decimal('1.50')` is
+    'one point five zero', and `Fraction`s are worded exactly if they have a finite decimal
+    expansion (otherwise they're worded like the nearest float).
 
     Args:
-        num (str, int or float): the number to convert
+        num (str, int, float, Decimal or Fraction): the number to convert
         prefer_fraction_words (bool): try to match decimals to fraction words.
-            EG: 0.5 -> 'half' instead of 'zero point five'
+            EG: 0.5 -> 'half' instead of 'zero point five'. Ignored if `precision`
+            or `significant_digits` is given
+        precision (int): round to this many decimal places and say all of them, even trailing zeros.
+            EG: 2.5 with a precision of 2 -> 'two point five zero'
+        significant_digits (int): round to this many significant digits and say all of them.
+            EG: 0.0123 with 2 significant digits -> 'zero point zero one two'
+
+    Both kinds of rounding round half to even, like `round`. Floats are rounded from the digits
+    they're normally worded with, so 2.675 rounds to 2.68 even though the float is slightly less.
 
     Returns:
         str
 
     Raises:
-        TypeError: if num isn't int or float
+        TypeError: if num isn't int, float, Decimal or Fraction
+        ValueError: if num is infinity or NaN, or if `precision` or `significant_digits` is invalid
+    '''
+    _check_digits(precision, significant_digits)
+    table = _phrase_table
+    if table is not None and type(num) == int and precision is None and significant_digits is None:
+        words = table.num_to_word(num)
+        if words is not None:
+            return words
+
+    cache = _caches['num_to_word']
+    if cache is None:
+        return _num_to_word(num, prefer_fraction_words, precision, significant_digits)
+
+    # key on the type as well because 1 == 1.0 but they aren't always worded the same.
+    # The same goes for Decimals with trailing zeros
+    try:
+        key = (
+            type(num), str(num) if type(num) == Decimal else num,
+            prefer_fraction_words, precision, significant_digits
+        )
+        result = cache.get(key)
+    except TypeError:
+        # unhashable, so definitely not something we can convert
+        raise TypeError('num must be int, float, Decimal or Fraction')
+    if result is MISSING:
+        result = _num_to_word(num, prefer_fraction_words, precision, significant_digits)
+        cache.set(key, result)
+    return result
+
+
+def _check_digits(precision, significant_digits):
+    if precision is not None and significant_digits is not None:
+        raise ValueError('only one of precision and significant_digits can be given')
+    if precision is not None and (type(precision) != int or precision < 0):
+        raise ValueError('precision must be an int of at least 0')
+    if significant_digits is not None and (type(significant_digits) != int or significant_digits < 1):
+        raise ValueError('significant_digits must be an int of at least 1')
+
+
+def iter_num_to_word(num, prefer_fraction_words=True):
     '''
+    Like `num_to_word` but yields the words one at a time. For huge ints the words are
+    generated as they are yielded, so the whole string never has to be held in memory.
+
+    Args:
+        num (str, int or float): the number to convert
+        prefer_fraction_words (bool): see `num_to_word`
+
+    Yields:
+        str: each word of the number
+
+    Raises:
+        TypeError: if num isn't int or float. This is raised when the first word is asked for
+    '''
+    if type(num) == int and abs(num) >= _stacked_threshold:
+        yield from _iter_stacked_words(num)
+    else:
+        yield from num_to_word(num, prefer_fraction_words).split(' ')
+
+
+def _num_to_word(num, prefer_fraction_words, precision=None, significant_digits=None):
+    # the uncached body of `num_to_word`
     if type(num) == str:
         try:
             # we try an int first because huge numbers don't play nicely with floats
@@ -491,130 +1169,68 @@ def num_to_word(num, prefer_fraction_words=True):
         except Exception:
             num = float(num)
 
-    if type(num) not in (int, float):
-        raise TypeError('num must be int or float')
+    t = type(num)
+    if t not in _number_types:
+        raise TypeError('num must be int, float, Decimal or Fraction')
+    if (t == float and not math.isfinite(num)) or (t == Decimal and not num.is_finite()):
+        raise ValueError('cannot convert infinity or NaN into words')
+
+    if precision is not None or significant_digits is not None:
+        return _point_to_word(_round_digits(num, precision, significant_digits))
 
-    if type(num) == float and prefer_fraction_words:
-        if abs(num) in number_words_backwards:
+    if t != int and prefer_fraction_words and not (t == Decimal and _trailing_zeros(num)):
+        word = (_exact_fractions if t == Fraction else _words_backwards).get(abs(num))
+        if word is not None:
             # if we already have the value computed (eg: a third)
-            minus = num < 0
-            num = abs(num)
-            word = number_words_backwards[num]
-            if num < 1 and word in fraction_words:
+            if abs(num) < 1 and word in fraction_words:
                 # eg: 'tenth' -> 'one tenth'
                 word = 'one ' + word
 
-            if minus:
+            if num < 0:
                 return 'negative ' + word
             else:
                 return word
 
-    if type(num) == float and not num.is_integer():
-        num = str(num).split('.')
-
-        # parse the left like a regular number because it essentially is
-        left = num_to_word(int(num[0]))
-
-        # since decimals are in a nice easy format we just
-        # have to concatenate a string of words
-        dw_backwards = {v: k for k, v in decimal_words.items()}
-        right = ' '.join([dw_backwards[int(i)] for i in num[1]])
-
-        return f'{left} point {right}'
+    if t != int and not (t == float and num.is_integer()):
+        return _point_to_word(_fixed_point(num))
     else:
-        num = str(int(num)).strip()
+        num = int(num)
+        if abs(num) >= _stacked_threshold:
+            # too big for our magnitude words, see `_iter_stacked_words`
+            return ' '.join(_iter_stacked_words(num))
+
+        num = str(num).strip()
         if num.startswith('-'):
             minus = True
             num = num.lstrip('-')
         else:
             minus = False
 
-        if int(num) in number_words_backwards:
+        if int(num) in _words_backwards:
             # to handle simple cases like 0, 1, 2...
             if minus:
-                return 'negative ' + number_words_backwards[int(num)]
+                return 'negative ' + _words_backwards[int(num)]
             else:
-                return number_words_backwards[int(num)]
+                return _words_backwards[int(num)]
 
         # split the number into 3 digit chunks
         num = num[::-1]
         chunks = [num[i: i + 3][::-1] for i in range(0, len(num), 3)]
-        split_magnitudes = [''] + [i for i in _split_magnitudes if i not in ordinal_magnitudes]
+        split_magnitudes = _group_magnitudes
         parsed = []
 
-        if len(chunks) > len(split_magnitudes):
-            # if we have more chunks than we have magnitudes then we are going to have
-            # to stack magnitudes, EG: 10**15 -> one thousand trillion
-            # and 10**18 -> million trillion.
-            # this is technically a valid number word? It's better than having an IndexError
-
-            # use this alias for convenience
-            lsm = len(split_magnitudes)
-            for i in range(0, len(chunks), lsm - 1):
-                # chunk the list into chunks that can be handled by our selection of magnitudes,
-                # process each chunk and insert into the parsed list
-                w = num_to_word(''.join(reversed(chunks[i: i + lsm - 1])))
-                if w != 'zero':
-                    # for big numbers like 10**25 there will be many trailing zeroes
-                    # so dont add those
-                    parsed.insert(0, w)
-            # tag the correct number of magnitudes onto the first word in the list
-            # this should be the largest magnitude word we have repeated for the
-            # number of chunks we created
-            parsed[0] = parsed[0] + ((' ' + split_magnitudes[-1]) * (i // (lsm - 1)))
-        else:
-            for index, chunk in enumerate(chunks):
-                # get the suffix for the chunk we are parsing
-                addon = ''
-                if split_magnitudes[index]:
-                    addon = ' ' + split_magnitudes[index]
-
-                if int(chunk) == 0:
-                    continue
-                elif int(chunk) in number_words_backwards and chunk != '100':
-                    # the !='100' makes sure that we parse it as "one hundred" and not just "hundred"
-
-                    # if this chunk is in the reversed number_words dict's keys (so it's a number)
-                    # then slap that right in. No need to make any decisions ourselves
-                    parsed.insert(0, number_words_backwards[int(chunk)] + addon)
-                else:
-                    chunk = str(int(chunk))  # gets rid of leading zeroes
-                    tmp = ''
-                    if len(chunk) == 3:
-                        # if it's a 3 digit chunk then take the first digit
-                        # and put the "X hundred"
-                        tmp += number_words_backwards[int(chunk[0])] + ' hundred'
-                        chunk = chunk[1:]
-                    if int(chunk) != 0:
-                        # if the rest of the chunk is just zeroes then don't parse it
-                        if len(chunk) == 2:
-                            if int(chunk) in number_words_backwards:
-                                # if the chunk is directly mentioned in the dict, eg: 17
-                                if tmp:
-                                    tmp += ' and '
-                                tmp += number_words_backwards[int(chunk)]
-                            else:
-                                # if the chunk isnt directly mentioned, eg: 25
-                                # then we split the number into its digits, times the first by 10
-                                # to get its word and combine with the second.
-                                # eg: 25 -> (2*10) + 5 -> [20, 5] -> ['twenty', 'five']
-                                if tmp:
-                                    tmp += ' and '
-                                tmp += (
-                                    number_words_backwards[int(chunk[0]) * 10]
-                                    + ' '
-                                    + number_words_backwards[int(chunk[1])]
-                                )
-                        else:
-                            # by now the length of the chunk must be 1 digit long
-                            # therefore it must be in the dict
-                            if tmp:
-                                tmp += ' and '
-                            tmp += number_words_backwards[int(chunk)]
+        for index, chunk in enumerate(chunks):
+            # get the suffix for the chunk we are parsing
+            addon = ''
+            if split_magnitudes[index]:
+                addon = ' ' + split_magnitudes[index]
 
-                    if tmp:
-                        # if we parsed any values then insert them here
-                        parsed.insert(0, tmp + addon)
+            if int(chunk) == 0:
+                continue
+            tmp = _chunk_to_word(chunk)
+            if tmp:
+                # if we parsed any values then insert them here
+                parsed.insert(0, tmp + addon)
 
         if parsed[0] in magnitudes:
             # if we parsed something like 100 and it came out as "hundred"
@@ -632,3 +1248,601 @@ def num_to_word(num, prefer_fraction_words=True):
         if minus:
             parsed = 'negative ' + parsed
         return parsed
+
+
+def _trailing_zeros(num):
+    # whether a Decimal has zeros on the end after the point, like 2.0 or 0.50.
+    # Those digits get worded, so they can't be matched to words like 'two' or 'half'
+    sign, digits, exponent = num.as_tuple()
+    return exponent < 0 and digits[-1] == 0
+
+
+def _point_to_word(text):
+    # words for a number written out in full, like '-12.05'
+    minus = text.startswith('-')
+    left, _, right = text.lstrip('-').partition('.')
+    # parse the left like a regular number because it essentially is
+    words = _num_to_word(int(left), False)
+    if right:
+        # since decimals are in a nice easy format we just have to look up each digit
+        words = f'{words} point {right.translate(_digit_words)[:-1]}'
+    # there's no such thing as negative zero
+    if minus and text.strip('-0.'):
+        return 'negative ' + words
+    return words
+
+
+def _fixed_point(num):
+    # a float, Decimal or Fraction written out in full without an exponent. EG: 1e-07 -> '0.0000001'
+    if type(num) == float:
+        text = repr(num)
+        return format(Decimal(text), 'f') if 'e' in text else text
+    if type(num) == Fraction:
+        # fractions whose denominator only has 2s and 5s in it have a finite decimal expansion
+        denominator = num.denominator
+        places = 0
+        for factor in (2, 5):
+            count = 0
+            while denominator % factor == 0:
+                denominator //= factor
+                count += 1
+            places = max(places, count)
+        if denominator != 1:
+            return _fixed_point(float(num))
+        num = _round_places(num, places)
+    return format(num, 'f')
+
+
+def _exponent(num):
+    # the power of ten of the first significant digit of a Decimal or Fraction. EG: 0.05 -> -2
+    if not num:
+        return 0
+    if type(num) == Decimal:
+        return num.adjusted()
+    num = abs(num)
+    # the lengths of the numerator and denominator get it right or one too high
+    exponent = len(str(num.numerator)) - len(str(num.denominator))
+    if num < Fraction(10) ** exponent:
+        exponent -= 1
+    return exponent
+
+
+def _round_places(num, places):
+    # rounds a Decimal or Fraction to a number of decimal places (which can be negative), half to even,
+    # and returns it as a Decimal with exactly that many places
+    if type(num) == Fraction:
+        return Decimal(f'{round(num * Fraction(10) ** places)}E{-places}')
+    # the context needs enough precision for every digit of the result
+    context = Context(prec=max(1, num.adjusted() + places + 2))
+    return num.quantize(Decimal(f'1E{-places}'), rounding=ROUND_HALF_EVEN, context=context)
+
+
+def _round_digits(num, precision, significant_digits):
+    # `num` rounded to `precision` decimal places or `significant_digits` significant digits
+    # and written out in full
+    if type(num) == float:
+        num = Decimal(repr(num))
+    elif type(num) == int:
+        num = Decimal(num)
+
+    if significant_digits is None:
+        return format(_round_places(num, precision), 'f')
+
+    exponent = _exponent(num)
+    places = significant_digits - 1 - exponent
+    rounded = _round_places(num, places)
+    if _exponent(rounded) > exponent:
+        # rounding up added a digit on the front, eg: 9.99 -> 10.0, so drop one off the end
+        rounded = _round_places(num, places - 1)
+    return format(rounded, 'f')
+
+
+def _chunk_to_word(chunk):
+    '''
+    Converts a 3 digit chunk of a number into words, without the magnitude that goes after it.
+
+    Args:
+        chunk (str): the digits of the chunk. Leading zeroes are ignored
+
+    Returns:
+        str: the words, or an empty string if the chunk is zero
+
+    Example:
+        ```python
+        print(_chunk_to_word('025'))  # 'twenty five'
+        print(_chunk_to_word('100'))  # 'one hundred'
+        ```
+    '''
+    if int(chunk) in _words_backwards and chunk != '100':
+        # the !='100' makes sure that we parse it as "one hundred" and not just "hundred"
+
+        # if this chunk is in the reversed number_words dict's keys (so it's a number)
+        # then slap that right in. No need to make any decisions ourselves
+        return _words_backwards[int(chunk)] if int(chunk) else ''
+
+    chunk = str(int(chunk))  # gets rid of leading zeroes
+    tmp = ''
+    if len(chunk) == 3:
+        # if it's a 3 digit chunk then take the first digit
+        # and put the "X hundred"
+        tmp += _words_backwards[int(chunk[0])] + ' hundred'
+        chunk = chunk[1:]
+    if int(chunk) != 0:
+        # if the rest of the chunk is just zeroes then don't parse it
+        if len(chunk) == 2:
+            if int(chunk) in _words_backwards:
+                # if the chunk is directly mentioned in the dict, eg: 17
+                if tmp:
+                    tmp += ' and '
+                tmp += _words_backwards[int(chunk)]
+            else:
+                # if the chunk isnt directly mentioned, eg: 25
+                # then we split the number into its digits, times the first by 10
+                # to get its word and combine with the second.
+                # eg: 25 -> (2*10) + 5 -> [20, 5] -> ['twenty', 'five']
+                if tmp:
+                    tmp += ' and '
+                tmp += (
+                    _words_backwards[int(chunk[0]) * 10]
+                    + ' '
+                    + _words_backwards[int(chunk[1])]
+                )
+        else:
+            # by now the length of the chunk must be 1 digit long
+            # therefore it must be in the dict
+            if tmp:
+                tmp += ' and '
+            tmp += _words_backwards[int(chunk)]
+    return tmp
+
+
+# Numbers with more 3 digit groups than we have magnitude words for get split into windows
+# of 10**33 (one decillion) and each window is followed by the biggest magnitude word,
+# which multiplies everything before it. So the words are read like 'x decillion y'
+# where x is the words for everything above the lowest window, eg: 10**36 -> thousand decillion,
+# 10**66 -> one decillion decillion and 10**66 + 10**33 -> one decillion one decillion.
+# Each window only adds one word to the phrase, see `Word2Number.evaluate_stacked`
+_stacked_magnitude = _group_magnitudes[-1]
+_window_size = magnitudes[_stacked_magnitude]
+_stacked_threshold = _window_size * 1000
+
+
+def _stacked_windows(num, powers, level, index):
+    # yields (index, window) for each non-zero window of `num`, most significant first.
+    # `powers[level]` is `_window_size ** (2 ** level)`, `num` must be less than
+    # `powers[level] ** 2` and `index` is the index of the lowest window of `num`.
+    # Splitting the number in half each time means the work is dominated by a few
+    # big divisions, instead of one division of the whole number per window
+    if level < 0:
+        if num:
+            yield index, num
+        return
+    high, low = divmod(num, powers[level])
+    if high:
+        yield from _stacked_windows(high, powers, level - 1, index + (1 << level))
+    if low:
+        yield from _stacked_windows(low, powers, level - 1, index)
+
+
+def _iter_stacked_words(num):
+    # yields the words for an int >= `_stacked_threshold`, one at a time.
+    # Only one window's worth of words is held in memory at once
+    if num < 0:
+        yield 'negative'
+        num = -num
+
+    powers = [_window_size]
+    while num.bit_length() >= powers[-1].bit_length() * 2 - 1:
+        powers.append(powers[-1] ** 2)
+
+    parts = 0
+    has_and = False
+    last = None
+    previous = None
+    for index, window in _stacked_windows(num, powers, len(powers) - 1, 0):
+        if last is not None:
+            # one magnitude word for each window between this one and the last, including empty ones
+            yield from last.split(' ')
+            yield from (_stacked_magnitude,) * (previous - index)
+        last = _num_to_word(window, False)
+        previous = index
+        parts += 1
+        has_and = has_and or ' and ' in last
+
+    # same as the small number rule, join the last part on with an 'and' if nothing else was
+    if parts >= 2 and not has_and and (previous or last not in _split_magnitudes):
+        yield 'and'
+    yield from last.split(' ')
+    yield from (_stacked_magnitude,) * previous
+
+
+# the caches used by `word_to_num` and `num_to_word`. Turned on by `enable_cache`
+_caches = {'word_to_num': None, 'num_to_word': None}
+
+
+def enable_cache(maxsize=4096, policy='lru', path=None):
+    '''
+    Turns on caching of results for `word_to_num` and `num_to_word`. Each gets its own cache.
+    Phrases are cached after they have been normalized, so 'Twenty-Five' and
+    'twenty five' share a cache entry, as do 'five' and 'negative five'.
+    The caches are safe to use from multiple threads.
+    Calling this again replaces the current caches with new, empty ones.
+
+    If `path` is given the results are stored in that file (see `PersistentCache`), so they're kept
+    between runs and shared with every other process that uses the same file.
+    Calling this again with the same `path` keeps the results that are already in the file.
+
+    Args:
+        maxsize (int): the most results each cache will hold. With `path`, this is the most
+            kept in the file, and the 4096 most recent results are kept in memory too
+        policy (str): which result to throw away when a cache is full.
+            'lru' evicts the least recently used result and 'fifo' evicts the oldest one.
+            With `path`, this only applies to the results kept in memory
+        path (str or os.PathLike): the file to store the results in
+    '''
+    _close_caches()
+    if path is None:
+        _caches['word_to_num'] = ConversionCache(maxsize, policy)
+        _caches['num_to_word'] = ConversionCache(maxsize, policy)
+    else:
+        memory_size = min(maxsize, 4096)
+        _caches['word_to_num'] = PersistentCache(path, 'word_to_num', maxsize, memory_size, policy)
+        _caches['num_to_word'] = PersistentCache(path, 'num_to_word', maxsize, memory_size, policy)
+
+
+def disable_cache():
+    '''
+    Turns off the caches turned on by `enable_cache` and throws away their contents.
+    Results stored in a file are written out and kept
+    '''
+    _close_caches()
+    _caches['word_to_num'] = None
+    _caches['num_to_word'] = None
+
+
+def _close_caches():
+    for cache in _caches.values():
+        if isinstance(cache, PersistentCache):
+            cache.close()
+
+
+def clear_cache():
+    '''
+    Empties the caches and resets their statistics without turning them off.
+    Also empties the cache of phrase chunks that `word_to_num` always keeps.
+    Results stored in a file are deleted from the file too
+    '''
+    _chunk_cache.clear()
+    for cache in _caches.values():
+        if cache is not None:
+            cache.clear()
+
+
+def cache_info():
+    '''
+    Returns the statistics for each cache.
+
+    Returns:
+        dict: maps 'word_to_num' and 'num_to_word' to a `CacheInfo`,
+            or to None if caching is turned off
+    '''
+    return {k: None if v is None else v.info() for k, v in _caches.items()}
+
+
+# the table `word_to_num` and `num_to_word` check before doing any work. Turned on by `enable_phrase_table`
+_phrase_table = None
+
+
+def enable_phrase_table(limit=1_000_000):
+    '''
+    Turns on a table of every whole number below `limit` that `word_to_num` and `num_to_word` check
+    before doing any parsing. Most phrases for those numbers are looked up instead of parsed, including
+    the ones without 'and' and ordinals like 'twenty third'. The results are always the same as without
+    the table. Only English phrases use the table. See `PhraseTable`.
+
+    Args:
+        limit (int): the numbers covered are 0 to `limit - 1`. At most 1,000,000
+    '''
+    global _phrase_table
+    _phrase_table = PhraseTable(limit)
+
+
+def disable_phrase_table():
+    '''Turns off the table turned on by `enable_phrase_table`'''
+    global _phrase_table
+    _phrase_table = None
+
+
+def _check_errors_policy(errors):
+    if errors not in ('raise', 'skip', 'default'):
+        raise ValueError(f'errors must be "raise", "skip" or "default", not {errors!r}')
+
+
+def word_to_num_many(words, errors='raise', default=None, locale=None, max_edits=0):
+    '''
+    Converts many phrases at once. Repeated phrases (including ones that only differ in
+    case, spacing or hyphenation) are only converted once.
+
+    Args:
+        words (iterable of str): the phrases to convert
+        errors (str): what to do with a phrase that can't be converted.
+            'raise' re-raises the error, 'skip' leaves it out of the results
+            and 'default' puts `default` in its place
+        default: the value used for failed phrases when `errors='default'`
+        locale (str or Lexicon): the language the phrases are in. See `word_to_num`
+        max_edits (int): see `word_to_num`
+
+    Returns:
+        list: the results, in the same order as `words`
+
+    Raises:
+        TypeError: if an item is not a string and `errors='raise'`
+        ValueError: if an item is invalid and `errors='raise'`, or `locale` doesn't exist
+    '''
+    _check_errors_policy(errors)
+    parser = Word2Number if locale is None else _parser(locale)
+    normalize = parser.normalize
+    if max_edits:
+        def normalize(words, normalize=normalize, correct=parser.correct):
+            words, minus = normalize(words)
+            return correct(words, max_edits), minus
+    # raw phrase -> result and normalized phrase -> unsigned result.
+    # Failures are stored as the exception so they are only computed once too
+    seen = {}
+    normalized = {}
+    results = []
+    evaluate = _evaluate
+    cache = _caches['word_to_num']
+    if isinstance(cache, PersistentCache):
+        # look every phrase up in the file at once rather than with a query each,
+        # then store the new results at the end
+        words = list(words)
+        norms = {normalize(item)[0] for item in words if type(item) == str}
+        if parser is Word2Number:
+            normalized = cache.get_many(norms)
+        else:
+            found = cache.get_many((parser.lexicon, norm) for norm in norms)
+            normalized = {key[1]: value for key, value in found.items()}
+        cached = set(normalized)
+        evaluate = _evaluate_uncached
+    for item in words:
+        if type(item) != str:
+            result = TypeError('word must be a string')
+        else:
+            try:
+                result = seen[item]
+            except KeyError:
+                norm, minus = normalize(item)
+                try:
+                    result = normalized[norm]
+                except KeyError:
+                    if not parser.could_be_number(norm):
+                        # skip the work (and the cost of raising) for phrases that can't be numbers
+                        result = ValueError('failed to parse. No valid number words detected')
+                    else:
+                        try:
+                            result = evaluate(norm, parser)
+                        except ValueError as e:
+                            result = e
+                    normalized[norm] = result
+                if minus and result and not isinstance(result, Exception):
+                    result = -result
+                seen[item] = result
+
+        if isinstance(result, Exception):
+            if errors == 'raise':
+                raise result
+            elif errors == 'skip':
+                continue
+            result = default
+        results.append(result)
+
+    if evaluate is _evaluate_uncached:
+        cache.set_many(
+            (norm if parser is Word2Number else (parser.lexicon, norm), result)
+            for norm, result in normalized.items()
+            if norm not in cached and not isinstance(result, Exception)
+        )
+    return results
+
+
+def _evaluate_uncached(words, parser):
+    return parser.evaluate(words)
+
+
+def num_to_word_many(
+    nums, prefer_fraction_words=True, errors='raise', default=None, precision=None, significant_digits=None
+):
+    '''
+    Converts many numbers into words at once. Repeated numbers are only converted once.
+
+    Args:
+        nums (iterable of str, int, float, Decimal or Fraction): the numbers to convert
+        prefer_fraction_words (bool): see `num_to_word`
+        errors (str): what to do with a number that can't be converted.
+            'raise' re-raises the error, 'skip' leaves it out of the results
+            and 'default' puts `default` in its place
+        default: the value used for failed numbers when `errors='default'`
+        precision (int): see `num_to_word`
+        significant_digits (int): see `num_to_word`
+
+    Returns:
+        list: the results, in the same order as `nums`
+
+    Raises:
+        TypeError: if an item isn't int, float, Decimal, Fraction or str and `errors='raise'`
+        ValueError: if an item is an invalid string, infinity or NaN and `errors='raise'`,
+            or if `precision` or `significant_digits` is invalid
+    '''
+    _check_errors_policy(errors)
+    _check_digits(precision, significant_digits)
+    # key on the type as well because 1 == 1.0 but they aren't always worded the same.
+    # The same goes for Decimals with trailing zeros
+    seen = {}
+    results = []
+    convert = num_to_word
+    options = (prefer_fraction_words, precision, significant_digits)
+    cache = _caches['num_to_word']
+    if isinstance(cache, PersistentCache):
+        # look every number up in the file at once rather than with a query each,
+        # then store the new results at the end
+        nums = list(nums)
+        keys = {
+            (type(item), str(item) if type(item) == Decimal else item) for item in nums
+            if type(item) == str or type(item) in _number_types
+        }
+        seen = {key[:2]: value for key, value in cache.get_many(key + options for key in keys).items()}
+        cached = set(seen)
+        convert = _num_to_word
+
+    for item in nums:
+        t = type(item)
+        if t != str and t not in _number_types:
+            result = TypeError('num must be int, float, Decimal or Fraction')
+        else:
+            key = (t, str(item) if t == Decimal else item)
+            try:
+                result = seen[key]
+            except KeyError:
+                try:
+                    result = convert(
+                        item, prefer_fraction_words=prefer_fraction_words,
+                        precision=precision, significant_digits=significant_digits
+                    )
+                except (TypeError, ValueError) as e:
+                    result = e
+                seen[key] = result
+
+        if isinstance(result, Exception):
+            if errors == 'raise':
+                raise result
+            elif errors == 'skip':
+                continue
+            result = default
+        results.append(result)
+
+    if convert is _num_to_word:
+        cache.set_many(
+            (key + options, result) for key, result in seen.items()
+            if key not in cached and not isinstance(result, Exception)
+        )
+    return results
+
+
+def num_to_word_range(start, stop=None, step=1):
+    '''
+    Converts a range of whole numbers into words, like calling `num_to_word` on each number in
+    `range(start, stop, step)` but much quicker. Consecutive numbers share all but their lowest
+    groups of 3 digits, so the words for the higher groups are carried over from one number to
+    the next and only the groups that changed are worked out again.
+
+    Args:
+        start (int): the first number, or the end of the range if `stop` isn't given (like `range`)
+        stop (int): the end of the range. It isn't included
+        step (int): the difference between each number
+
+    Yields:
+        str: the words for each number, the same as `num_to_word` gives
+
+    Raises:
+        TypeError: if `start`, `stop` or `step` isn't an int
+        ValueError: if `step` is 0
+
+    Example:
+        ```python
+        print(list(num_to_word_range(999, 1002)))
+        # ['nine hundred and ninety nine', 'thousand', 'one thousand and one']
+        ```
+    '''
+    # `range` checks the arguments, and it's done here rather than in the generator so errors
+    # are raised straight away
+    numbers = range(start) if stop is None else range(start, stop, step)
+    return _range_to_words(numbers)
+
+
+def _range_to_words(numbers):
+    # the same rules as `_num_to_word`, with the words for the groups above the lowest one kept
+    # from the last number. `chunks` maps a 3 digit value to (its words, the words it has on its own,
+    # whether it can be joined on with an 'and')
+    chunks = {}
+    # for each group above the lowest, lowest first: (the number made of it and every group above it,
+    # its words with its magnitude). A group and the ones above it are unchanged if that number is
+    upper = []
+    high = None
+    # the words for the groups above the lowest, on their own, with the last one joined on
+    # with an 'and' and when the lowest group is joined on with an 'and'
+    prefix = prefix_and = None
+    joins_and = False
+
+    for num in numbers:
+        magnitude = -num if num < 0 else num
+        if magnitude >= _stacked_threshold:
+            yield _num_to_word(num, False)
+            continue
+
+        words = _words_backwards.get(magnitude)
+        if words is None:
+            value, low = divmod(magnitude, 1000)
+            if value != high:
+                high = value
+                level = 0
+                while value:
+                    if level < len(upper) and upper[level][0] == value:
+                        break
+                    group = value % 1000
+                    group_words = _chunk_to_word(str(group)) + ' ' + _group_magnitudes[level + 1] if group else ''
+                    if level < len(upper):
+                        upper[level] = (value, group_words)
+                    else:
+                        upper.append((value, group_words))
+                    value //= 1000
+                    level += 1
+                else:
+                    del upper[level:]
+
+                parsed = [group_words for _, group_words in reversed(upper) if group_words]
+                if parsed and parsed[0] in magnitudes:
+                    parsed.insert(0, 'one')
+                prefix = ' '.join(parsed)
+                # whether a group can be joined on with an 'and'. See `_num_to_word`
+                joins_and = bool(parsed) and ' and ' not in prefix
+                if len(parsed) >= 2 and joins_and and parsed[-1] not in _group_magnitudes:
+                    prefix_and = ' '.join(parsed[:-1]) + ' and ' + parsed[-1]
+                else:
+                    prefix_and = prefix
+
+            if not low:
+                words = prefix_and
+            else:
+                chunk = chunks.get(low)
+                if chunk is None:
+                    chunk_words = _chunk_to_word(str(low))
+                    chunk = chunks[low] = (
+                        chunk_words,
+                        'one ' + chunk_words if chunk_words in magnitudes else chunk_words,
+                        ' and ' not in chunk_words and chunk_words not in _group_magnitudes
+                    )
+                if not prefix:
+                    words = chunk[1]
+                elif joins_and and chunk[2]:
+                    words = prefix + ' and ' + chunk[0]
+                else:
+                    words = prefix + ' ' + chunk[0]
+
+        yield 'negative ' + words if num < 0 else words
+
+
+from .search import find_numbers  # noqa: E402
+from .normalize import normalize_text, normalize_file  # noqa: E402
+from .parsing import ParseResult, ParsedGroup, ParsedWord, parse  # noqa: E402
+from .incremental import IncrementalParser  # noqa: E402
+from .parallel import ParallelConverter  # noqa: E402
+from .aio import word_to_num_async, num_to_word_async  # noqa: E402
+from .columns import word_to_num_column, num_to_word_column  # noqa: E402
+from .results import CompactResults, word_to_num_compact  # noqa: E402
+from .persistent import PersistentCache  # noqa: E402
+from .table import PhraseTable  # noqa: E402
+from .instrumentation import (  # noqa: E402
+    StageStats, SlowInput, enable_instrumentation, disable_instrumentation,
+    reset_instrumentation, instrumentation_stats, slow_inputs
+)
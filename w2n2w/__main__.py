@@ -0,0 +1,139 @@
+'''
+Converts stdin to stdout, one value per line.
+
+    python -m w2n2w to-num < phrases.txt > numbers.txt
+    python -m w2n2w to-words --workers 4 < numbers.txt > phrases.txt
+    python -m w2n2w to-num --in-text < transcript.txt > normalized.txt
+
+Lines that can't be converted come out blank (or are left out with `--skip-errors`)
+and a summary is written to stderr at the end. With `--in-text`, the numbers inside
+free text are rewritten instead and everything else is left as it is.
+'''
+import argparse
+import sys
+import time
+from itertools import islice
+
+from . import normalize_file, num_to_word_many, word_to_num_many
+from .parallel import ParallelConverter
+
+
+def convert_lines(direction, lines):
+    '''
+    Converts a chunk of lines.
+
+    Args:
+        direction (str): 'to-num' or 'to-words'
+        lines (list): list of str, without their line endings
+
+    Returns:
+        list: the converted lines (str), with None for the lines that failed
+    '''
+    if direction == 'to-num':
+        results = word_to_num_many(lines, errors='default', default=None)
+    else:
+        results = num_to_word_many([i.strip() for i in lines], errors='default', default=None)
+    return [None if i is None else str(i) for i in results]
+
+
+def _chunks(stream, size):
+    # reads `size` lines at a time so we never hold more than that in memory
+    lines = (line.rstrip('\r\n') for line in stream)
+    while True:
+        chunk = list(islice(lines, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _convert_chunks(direction, chunks, workers, chunk_size):
+    # yields each converted chunk in order
+    if workers <= 1:
+        for chunk in chunks:
+            yield convert_lines(direction, chunk)
+        return
+
+    lines = (line for chunk in chunks for line in chunk)
+    with ParallelConverter(workers, chunk_size=chunk_size, errors='default') as converter:
+        if direction == 'to-num':
+            results = converter.imap_word_to_num(lines)
+        else:
+            results = converter.imap_num_to_word(line.strip() for line in lines)
+        results = (None if i is None else str(i) for i in results)
+        while True:
+            chunk = list(islice(results, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def main(argv=None, stdin=None, stdout=None, stderr=None):
+    '''
+    Runs the command line interface.
+
+    Args:
+        argv (list): the arguments, not including the program name. Defaults to `sys.argv[1:]`
+        stdin, stdout, stderr: the streams to use. Default to the `sys` ones
+
+    Returns:
+        int: the exit code. 1 if any line failed to convert, otherwise 0
+    '''
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    parser = argparse.ArgumentParser(prog='python -m w2n2w', description='Convert words to numbers and back again')
+    parser.add_argument('direction', choices=('to-num', 'to-words'), help='which way to convert each line')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='number of worker processes to use')
+    parser.add_argument(
+        '-c', '--chunk-size', type=int, default=1000, help='number of lines to read and convert at a time'
+    )
+    parser.add_argument(
+        '-s', '--skip-errors', action='store_true', help='leave out lines that fail instead of writing a blank line'
+    )
+    parser.add_argument(
+        '-t', '--in-text', action='store_true',
+        help='rewrite the numbers inside free text instead of converting whole lines'
+    )
+    parser.add_argument('-q', '--quiet', action='store_true', help="don't write a summary to stderr")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be at least 1')
+    if args.in_text and args.workers > 1:
+        parser.error("--in-text can't be used with --workers")
+
+    if args.in_text:
+        start = time.perf_counter()
+        count = normalize_file(stdin, stdout, args.direction)
+        stdout.flush()
+        if not args.quiet:
+            stderr.write(f'{count} numbers rewritten in {time.perf_counter() - start:.2f}s\n')
+        return 0
+
+    count = errors = 0
+    start = time.perf_counter()
+    for results in _convert_chunks(args.direction, _chunks(stdin, args.chunk_size), args.workers, args.chunk_size):
+        out = []
+        for result in results:
+            if result is None:
+                errors += 1
+                if args.skip_errors:
+                    continue
+                result = ''
+            out.append(result)
+        count += len(results)
+        if out:
+            stdout.write('\n'.join(out) + '\n')
+    stdout.flush()
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        rate = count / elapsed if elapsed else 0
+        stderr.write(f'{count} lines in {elapsed:.2f}s ({rate:.0f} lines/sec), {errors} errors\n')
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+import asyncio
+from functools import partial
+
+from . import _check_errors_policy, num_to_word_many, word_to_num_many
+
+_done = object()
+# `asyncio.get_running_loop` is new in 3.7. Inside a coroutine `get_event_loop` gives the same loop on 3.6
+_get_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
+async def _batches(values, batch_size):
+    # groups normal and async iterables into lists of `batch_size`
+    batch = []
+    if hasattr(values, '__aiter__'):
+        async for value in values:
+            batch.append(value)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    else:
+        for value in values:
+            batch.append(value)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _convert(func, values, batch_size, executor, max_pending):
+    # checks the args straight away rather than when the results are first awaited
+    if batch_size < 1:
+        raise ValueError('batch_size must be at least 1')
+    if max_pending < 1:
+        raise ValueError('max_pending must be at least 1')
+    return _iter_converted(func, values, batch_size, executor, max_pending)
+
+
+async def _iter_converted(func, values, batch_size, executor, max_pending):
+    loop = _get_running_loop()
+    # the batches sent to the executor, in order. It's bounded so that a source that's quicker than
+    # the conversions (or than whoever is reading the results) waits instead of filling up memory
+    queue = asyncio.Queue(maxsize=max_pending)
+
+    async def produce():
+        try:
+            async for batch in _batches(values, batch_size):
+                await queue.put(loop.run_in_executor(executor, func, batch))
+        except Exception as e:
+            # errors from the source are raised once the batches before them are done
+            await queue.put(e)
+        else:
+            await queue.put(_done)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            for result in await item:
+                yield result
+    finally:
+        producer.cancel()
+        while not queue.empty():
+            item = queue.get_nowait()
+            if isinstance(item, asyncio.Future):
+                item.cancel()
+
+
+def word_to_num_async(
+    words, errors='raise', default=None, locale=None, batch_size=1000, executor=None, max_pending=4
+):
+    '''
+    Converts many phrases into numbers without blocking the event loop.
+    The phrases are converted in batches on `executor` and the results are yielded
+    in the same order as `words`, as soon as each batch is done.
+
+    ```python
+    async for number in word_to_num_async(request_phrases(), executor=pool):
+        ...
+    ```
+
+    Args:
+        words (iterable or async iterable of str): the phrases to convert
+        errors (str): what to do with a phrase that can't be converted. See `word_to_num_many`
+        default: the value used for failed phrases when `errors='default'`
+        locale (str): the language the phrases are in. See `word_to_num`.
+            Use the name of the locale rather than a `Lexicon` with a process pool
+        batch_size (int): the number of phrases sent to the executor at a time
+        executor (concurrent.futures.Executor): where to run the conversions. Defaults to the
+            event loop's default thread pool. Conversions hold the GIL, so a
+            `ProcessPoolExecutor` keeps the event loop the most responsive
+        max_pending (int): the most batches that can be waiting in the queue for their results
+            to be read. Once it's full, `words` isn't read any further until there's room
+
+    Returns:
+        async generator: the results
+
+    Raises:
+        ValueError: if `errors`, `batch_size` or `max_pending` is invalid. Errors from the
+            conversions are raised by the generator, see `word_to_num_many`
+    '''
+    _check_errors_policy(errors)
+    func = partial(word_to_num_many, errors=errors, default=default, locale=locale)
+    return _convert(func, words, batch_size, executor, max_pending)
+
+
+def num_to_word_async(
+    nums, prefer_fraction_words=True, errors='raise', default=None, batch_size=1000, executor=None, max_pending=4
+):
+    '''
+    Converts many numbers into words without blocking the event loop.
+    Works the same way as `word_to_num_async`.
+
+    Args:
+        nums (iterable or async iterable of str, int or float): the numbers to convert
+        prefer_fraction_words (bool): see `num_to_word`
+        errors (str): what to do with a number that can't be converted. See `num_to_word_many`
+        default: the value used for failed numbers when `errors='default'`
+        batch_size (int): the number of numbers sent to the executor at a time
+        executor (concurrent.futures.Executor): where to run the conversions. See `word_to_num_async`
+        max_pending (int): the most batches that can be waiting in the queue for their results
+            to be read
+
+    Returns:
+        async generator: the results
+
+    Raises:
+        ValueError: if `errors`, `batch_size` or `max_pending` is invalid. Errors from the
+            conversions are raised by the generator, see `num_to_word_many`
+    '''
+    _check_errors_policy(errors)
+    func = partial(num_to_word_many, prefer_fraction_words=prefer_fraction_words, errors=errors, default=default)
+    return _convert(func, nums, batch_size, executor, max_pending)
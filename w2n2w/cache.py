@@ -0,0 +1,98 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'evictions', 'size', 'maxsize'))
+CacheInfo.__doc__ = '''
+A snapshot of a cache's statistics.
+
+Attributes:
+    hits (int): lookups that found a result
+    misses (int): lookups that didn't
+    evictions (int): results thrown away to stay within `maxsize`
+    size (int): the number of results currently stored
+    maxsize (int): the most results the cache will hold
+'''
+
+# returned by `ConversionCache.get` when a key isn't cached. Can't use None because None could be cached
+MISSING = object()
+
+
+class ConversionCache():
+    '''
+    A bounded, thread-safe cache of conversion results.
+
+    Args:
+        maxsize (int): the most results to hold at once
+        policy (str): which result to throw away when the cache is full.
+            'lru' evicts the least recently used result and 'fifo' evicts the oldest one
+    '''
+    def __init__(self, maxsize=4096, policy='lru'):
+        if policy not in ('lru', 'fifo'):
+            raise ValueError(f'policy must be "lru" or "fifo", not {policy!r}')
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self.policy = policy
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key, default=MISSING):
+        '''
+        Looks up a result.
+
+        Args:
+            key: the key to look up
+            default: returned if `key` isn't cached
+
+        Returns:
+            the cached result, or `default`
+        '''
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            if self.policy == 'lru':
+                self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key, value):
+        '''
+        Stores a result, evicting an old one if the cache is full.
+
+        Args:
+            key: the key to store the result under
+            value: the result
+        '''
+        with self._lock:
+            if key in self._data:
+                self._data[key] = value
+                if self.policy == 'lru':
+                    self._data.move_to_end(key)
+                return
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        '''Throws away every result and resets the statistics'''
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self):
+        '''
+        Returns:
+            CacheInfo: the cache's current statistics
+        '''
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, len(self._data), self.maxsize)
+
+    def __len__(self):
+        return len(self._data)
@@ -0,0 +1,236 @@
+from . import (
+    _chunk_to_word, _group_magnitudes, num_to_word_many, number_words_backwards, word_to_num_many
+)
+
+# the range of int64. Columns with ints outside of it come back as objects
+_int64_min = -2**63
+_int64_max = 2**63 - 1
+
+# the most 3 digit groups a uint64 can have
+_max_groups = 7
+# see `_word_tables`
+_tables = None
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('NumPy is needed for this. Install it with `pip install w2n2w[numpy]`') from None
+    return numpy
+
+
+def _factorize(numpy, values):
+    # splits a 1d array into the index of each item in `uniques` and the unique items.
+    # Missing values (None and NaN) get an index of -1. pandas does this in C so use it if we can
+    try:
+        import pandas
+    except ImportError:
+        pandas = None
+    if pandas is not None:
+        codes, uniques = pandas.factorize(values)
+        return codes, uniques.tolist() if isinstance(uniques, numpy.ndarray) else list(uniques)
+
+    index = {}
+    codes = numpy.fromiter(
+        (-1 if value is None else index.setdefault(value, len(index)) for value in values.tolist()),
+        dtype=numpy.intp, count=len(values)
+    )
+    return codes, list(index)
+
+
+def _series(values):
+    # whether `values` is a pandas Series, without importing pandas
+    return type(values).__name__ == 'Series' and type(values).__module__.startswith('pandas')
+
+
+def word_to_num_column(values, locale=None):
+    '''
+    Converts a whole column of phrases into numbers. Each distinct phrase is only converted once,
+    so this is much quicker than `Series.map(word_to_num)` on columns with lots of repeats.
+    Needs NumPy. pandas is used to find the distinct phrases quicker if it's installed.
+
+    Args:
+        values (numpy.ndarray, pandas.Series or list): the phrases to convert
+        locale (str or Lexicon): the language the phrases are in. See `word_to_num`
+
+    Returns:
+        numpy.ma.MaskedArray: if `values` isn't a `pandas.Series`. Phrases that can't be converted
+            (including missing values) are masked. The dtype is int64 if every result is an int,
+            float64 if any are floats and object if there are ints that don't fit in an int64
+        pandas.Series: if `values` is a `pandas.Series`. The result has the same index and name
+            and uses pandas' nullable 'Int64' or 'Float64' dtypes, with failed phrases set to `NA`
+
+    Example:
+        ```python
+        print(word_to_num_column(numpy.array(['one', 'two', 'not a number', 'two'])))
+        # [1 2 -- 2]
+        ```
+    '''
+    numpy = _import_numpy()
+    series = None
+    if _series(values):
+        series = values
+        values = values.to_numpy(dtype=object)
+    array = numpy.asarray(values)
+    codes, uniques = _factorize(numpy, array.ravel())
+
+    results = word_to_num_many(uniques, errors='default', default=None, locale=locale)
+    valid = [i is not None for i in results]
+    converted = [i for i in results if i is not None]
+    if any(type(i) == float for i in converted):
+        dtype = numpy.float64
+    elif all(_int64_min <= i <= _int64_max for i in converted):
+        dtype = numpy.int64
+    else:
+        dtype = object
+
+    # the extra item on the end is where missing values, with an index of -1, end up
+    numbers = numpy.zeros(len(results) + 1, dtype=dtype)
+    numbers[:-1] = [0 if i is None else i for i in results]
+    failed = numpy.ones(len(results) + 1, dtype=bool)
+    failed[:-1] = numpy.logical_not(valid)
+
+    numbers = numbers[codes].reshape(array.shape)
+    mask = failed[codes].reshape(array.shape)
+    if series is None:
+        return numpy.ma.MaskedArray(numbers, mask)
+
+    import pandas
+    if dtype == numpy.int64:
+        numbers = pandas.arrays.IntegerArray(numbers, mask)
+    elif dtype == numpy.float64:
+        numbers = pandas.arrays.FloatingArray(numbers, mask)
+    else:
+        numbers[mask] = None
+    return pandas.Series(numbers, index=series.index, name=series.name)
+
+
+def _word_tables(numpy):
+    # everything `_num_to_word` would look up for the ints in a uint64, as arrays. For each
+    # 3 digit group: the words for every value of the group with its magnitude on the end, on its own,
+    # after a space and after an 'and', plus whether the group's own words contain an 'and'.
+    # They're only assigned once they're complete, so other threads never see them half built
+    global _tables
+    if _tables is not None:
+        return _tables
+
+    magnitude_words = [' ' + i if i else '' for i in _group_magnitudes]
+    chunks = [_chunk_to_word(str(i)) for i in range(1000)]
+    first, rest, joined = [], [], []
+    for addon in magnitude_words[:_max_groups]:
+        words = [w + addon if w else '' for w in chunks]
+        first.append(numpy.array(words, dtype=object))
+        rest.append(numpy.array([' ' + w if w else '' for w in words], dtype=object))
+        joined.append(numpy.array([' and ' + w if w else '' for w in words], dtype=object))
+
+    # whole numbers that `_num_to_word` has a word for, eg: 0 -> 'zero' and 1000 -> 'thousand'
+    simple = sorted((k, v) for k, v in number_words_backwards.items() if type(k) == int and 0 <= k < 2**64)
+    _tables = {
+        'first': first,
+        'rest': rest,
+        'and': joined,
+        'has_and': numpy.array([' and ' in w for w in chunks]),
+        'simple_values': numpy.array([k for k, _ in simple], dtype=numpy.uint64),
+        'simple_words': numpy.array([v for _, v in simple], dtype=object)
+    }
+    return _tables
+
+
+def _ints_to_words(numpy, array):
+    # `num_to_word` for a 1d array of ints, worked out a group of 3 digits at a time across the whole array
+    tables = _word_tables(numpy)
+    negative = array < 0 if array.dtype.kind == 'i' else numpy.zeros(array.shape, dtype=bool)
+    values = array.astype(numpy.uint64)
+    # two's complement, so that even the smallest int64 has the right magnitude
+    values[negative] = ~values[negative] + numpy.uint64(1)
+    magnitude = values
+
+    groups = []
+    for _ in range(_max_groups):
+        groups.append((values % 1000).astype(numpy.intp))
+        values = values // 1000
+
+    # the index of the biggest and smallest group that isn't zero, and how many aren't
+    nonzero = [group != 0 for group in groups]
+    highest = numpy.full(array.shape, -1)
+    lowest = numpy.full(array.shape, -1)
+    count = numpy.zeros(array.shape, dtype=numpy.intp)
+    has_and = numpy.zeros(array.shape, dtype=bool)
+    for index in range(_max_groups):
+        highest[nonzero[index]] = index
+        lowest[nonzero[_max_groups - index - 1]] = _max_groups - index - 1
+        count += nonzero[index]
+        has_and |= tables['has_and'][groups[index]]
+    # the same 'and' rule as `_num_to_word`: if none of the groups has an 'and' of its own
+    # then the last one is joined on with one
+    needs_and = (count >= 2) & ~has_and
+
+    words = numpy.full(array.shape, '', dtype=object)
+    for index in range(_max_groups - 1, -1, -1):
+        if not nonzero[index].any():
+            continue
+        group = groups[index]
+        part = tables['rest'][index][group]
+        last = needs_and & (lowest == index)
+        part[last] = tables['and'][index][group[last]]
+        first = highest == index
+        part[first] = tables['first'][index][group[first]]
+        words += part
+
+    # numbers like 0 and 1000 come out as 'zero' and 'thousand' rather than '' and 'one thousand'
+    positions = numpy.searchsorted(tables['simple_values'], magnitude)
+    positions[positions == len(tables['simple_values'])] = 0
+    simple = tables['simple_values'][positions] == magnitude
+    words[simple] = tables['simple_words'][positions[simple]]
+
+    words[negative] = 'negative ' + words[negative]
+    return words
+
+
+def num_to_word_column(values, prefer_fraction_words=True):
+    '''
+    Converts a whole column of numbers into words. Arrays of ints are converted all at once with
+    array arithmetic and table lookups, anything else converts each distinct value once.
+    The words are always the same as `num_to_word`'s. Needs NumPy.
+
+    Args:
+        values (numpy.ndarray, pandas.Series or list): the numbers to convert
+        prefer_fraction_words (bool): see `num_to_word`
+
+    Returns:
+        numpy.ndarray: an object array of the words if `values` isn't a `pandas.Series`. Values that
+            can't be converted (including missing values) are None
+        pandas.Series: if `values` is a `pandas.Series`. The result has the same index and name
+
+    Example:
+        ```python
+        print(num_to_word_column(numpy.arange(1, 4)))
+        # ['one' 'two' 'three']
+        ```
+    '''
+    numpy = _import_numpy()
+    series = None
+    if _series(values):
+        series = values
+        values = values.to_numpy()
+    array = numpy.asarray(values)
+
+    if array.dtype.kind in 'iu':
+        words = _ints_to_words(numpy, array.ravel())
+    else:
+        codes, uniques = _factorize(numpy, array.ravel())
+        results = num_to_word_many(
+            uniques, prefer_fraction_words=prefer_fraction_words, errors='default', default=None
+        )
+        # the extra item on the end is where missing values, with an index of -1, end up
+        words = numpy.empty(len(results) + 1, dtype=object)
+        words[:-1] = results
+        words = words[codes]
+
+    words = words.reshape(array.shape)
+    if series is None:
+        return words
+
+    import pandas
+    return pandas.Series(words, index=series.index, name=series.name)
@@ -0,0 +1,103 @@
+def _deletes(word, edits):
+    # every string made by deleting up to `edits` letters from `word`, including `word` itself
+    found = {word}
+    layer = {word}
+    for _ in range(edits):
+        layer = {w[:i] + w[i + 1:] for w in layer for i in range(len(w))}
+        found |= layer
+    return found
+
+
+def _edit_distance(a, b, limit):
+    # the optimal string alignment distance between two words: inserting, deleting or changing a letter
+    # and swapping two letters next to each other all count as one edit. Gives up as soon as
+    # the distance must be more than `limit` and returns `limit + 1`
+    before = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            distance = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                distance = min(distance, before[j - 2] + 1)
+            current[j] = distance
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+class FuzzyIndex():
+    '''
+    Finds the closest word in a vocabulary to a misspelt word, eg: 'fourty' -> 'forty'.
+
+    Uses a symmetric delete index: every string made by deleting up to `max_edits` letters from
+    each word is worked out up front. A misspelt word can only be close to a word if they have
+    one of those strings in common, so a lookup only has to check the handful of words that do,
+    rather than comparing against the whole vocabulary.
+
+    Args:
+        words (iterable of str): the vocabulary. When two words are just as close, the one that
+            came first wins
+        max_edits (int): the most edits a word can be away from the word it's matched to.
+            Inserting, deleting or changing a letter and swapping two letters next to each other
+            all count as one edit
+    '''
+    def __init__(self, words, max_edits=1):
+        if type(max_edits) != int or max_edits < 1:
+            raise ValueError('max_edits must be an int of at least 1')
+        self.max_edits = max_edits
+        self._rank = {}
+        deletes = {}
+        for word in words:
+            if word in self._rank:
+                continue
+            self._rank[word] = len(self._rank)
+            for variant in _deletes(word, max_edits):
+                deletes.setdefault(variant, []).append(word)
+        self._deletes = {k: tuple(v) for k, v in deletes.items()}
+        self._found = {}
+
+    def __len__(self):
+        return len(self._rank)
+
+    def closest(self, word):
+        '''
+        Finds the closest word in the vocabulary. Words are only matched if fewer than a third
+        of their letters need changing, so short words like 'to' or 'for' are never matched
+        to 'two' or 'four'.
+
+        Args:
+            word (str): the word to look up
+
+        Returns:
+            str: the closest word, which is `word` itself if it's in the vocabulary,
+                or None if nothing is close enough
+        '''
+        if word in self._rank:
+            return word
+        try:
+            return self._found[word]
+        except KeyError:
+            pass
+
+        limit = min(self.max_edits, (len(word) - 1) // 3)
+        best = None
+        if limit > 0:
+            checked = set()
+            for variant in _deletes(word, limit):
+                for candidate in self._deletes.get(variant, ()):
+                    if candidate in checked or abs(len(candidate) - len(word)) > limit:
+                        continue
+                    checked.add(candidate)
+                    distance = _edit_distance(word, candidate, limit)
+                    if distance <= limit:
+                        score = (distance, self._rank[candidate])
+                        if best is None or score < best[0]:
+                            best = (score, candidate)
+
+        result = None if best is None else best[1]
+        if len(self._found) >= 4096:
+            self._found.clear()
+        self._found[word] = result
+        return result
@@ -0,0 +1,334 @@
+from . import Token, TokenKind, Word2Number, _evaluate, _new_token, _parser
+
+_numbers = TokenKind.numbers
+_unset = object()
+
+
+def _add_values(total, value):
+    # adds up the chunks like `Word2Number.evaluate_tokens` does. None is a chunk that couldn't
+    # be parsed, or no chunks at all
+    if value is None:
+        return total
+    return value if total is None else total + value
+
+
+class IncrementalParser():
+    '''
+    Converts a phrase into a number as it arrives, one word at a time. Useful for things like
+    speech recognition, where the transcript grows a word at a time and you want the number so far.
+
+    Calling `word_to_num` on the whole phrase after every word means going over every word again
+    each time. Instead, this keeps the state that `Word2Number.split_by_magnitude` and
+    `Word2Number.process_chunk` work out, so a new word only costs as much as the words since
+    the last magnitude word (eg: 'thousand'), which is only ever a handful in a real number.
+
+    The results are always the same as calling `word_to_num` on all the words fed in so far,
+    or None where `word_to_num` would raise an error.
+
+    ```python
+    parser = IncrementalParser()
+    for word in 'one hundred and twenty three thousand'.split():
+        parser.feed(word)
+        print(parser.value)
+    # 1, 100, 100, 120, 123, 123000
+    ```
+
+    Args:
+        locale (str or Lexicon): the language of the words. See `word_to_num`
+    '''
+    def __init__(self, locale=None):
+        self._parser = Word2Number if locale is None else _parser(locale)
+        self.reset()
+
+    def reset(self):
+        '''Throws away all the words fed in so far, ready for the next number'''
+        self._started = False
+        self._minus = False
+        self._original = []  # the words before the lexicon's replacements
+        self._clear()
+
+    def _clear(self):
+        # everything worked out from the words, as opposed to the sign
+        self._words = []
+        self._tokens = []
+        self._length = -1  # the length of the phrase so far, for the tokens' positions
+        self._valid = False  # whether we've seen a number word, like `Word2Number.evaluate_tokens`
+        # whether the phrase has a magnitude before the biggest one, like `Word2Number.evaluate_tokens`
+        # looks for, and whether it has an 'of'
+        self._magnitude = False
+        self._stacked = False
+        self._of = False
+        self._value = _unset
+        # decimals. These are the same as `Word2Number.process_decimal`'s
+        self._point = None  # the index of the first decimal point
+        self._points = 0
+        self._left = None  # the number before the point, or the error it raised
+        self._decimal = ''
+        self._decimal_error = None
+        # one [order, index, running total, value with ordinals] for each chunk that's been split
+        # off by a magnitude. The orders always go down, just like in `Word2Number.split_by_magnitude`.
+        # The running total is None until a chunk can be parsed
+        self._chunks = []
+        self._open_chunk()
+
+    def _open_chunk(self):
+        # the state of the chunk after the last magnitude. While it's only got plain numbers in it
+        # we keep a running total, so we don't need to call `Word2Number.process_chunk` at all
+        self._simple = True
+        self._start = len(self._tokens)
+        self._sum = 0
+        self._count = 0  # the length of `total` in `Word2Number.process_chunk`
+        self._fails = 0
+        # the 'and's that split the chunk up, see `Word2Number.split_tokens`
+        self._piece_start = self._start
+        self._piece_valid = False
+        # whether the piece has a sign in it, and any other words that aren't numbers or 'and's.
+        # Pieces that are just a stray sign are skipped
+        self._piece_sign = False
+        self._piece_other = False
+        self._bad_piece = False
+        self._splits = 0
+        self._and_pending = False
+
+    def feed(self, words):
+        '''
+        Adds the next word(s) to the phrase.
+
+        Args:
+            words (str): the next word, or a few words
+
+        Raises:
+            TypeError: if `words` is not a string
+        '''
+        if type(words) != str:
+            raise TypeError('word must be a string')
+
+        # the same as `Word2Number.normalize`, but the sign can only come at the start of the phrase
+        words = words.lower()
+        if not self._started:
+            words = words.strip()
+            if not words:
+                return
+            self._started = True
+            lexicon = self._parser.lexicon
+            if words.startswith('-'):
+                self._minus = True
+                words = words[1:]
+            elif words.startswith(lexicon.negative_words):
+                self._minus = True
+                for word in lexicon.negative_words:
+                    if words.startswith(word):
+                        words = words[len(word):].strip()
+                        break
+
+        words = words.replace('-', ' ').split()
+        if not words:
+            return
+        self._value = _unset
+
+        lexicon = self._parser.lexicon
+        if lexicon.replacements:
+            self._original.extend(words)
+            replaced = lexicon.replace(' '.join(self._original)).split()
+            if replaced[:len(self._words)] != self._words:
+                # the new words finished off a replacement that starts in words we've already added
+                self._clear()
+                words = replaced
+            else:
+                words = replaced[len(self._words):]
+
+        tokenize = self._parser.tokenize
+        for word in words:
+            self._words.append(word)
+            offset = self._length + 1
+            self._length = offset + len(word)
+            for token in tokenize(word):
+                self._add(_new_token(Token, (token.kind, token.word, token.value, token.pos + offset)))
+
+    def _add(self, token):
+        tokens = self._tokens
+        index = len(tokens)
+        kind = token.kind
+        if kind in _numbers:
+            self._valid = True
+
+        if self._point is not None:
+            # everything after the decimal point is just strung together
+            if kind == TokenKind.POINT:
+                self._points += 1
+            elif self._decimal_error is None:
+                if kind == TokenKind.DIGITS:
+                    self._decimal += token.word
+                elif token.word in self._parser.lexicon.decimal_words:
+                    self._decimal += str(self._parser.lexicon.decimal_words[token.word])
+                else:
+                    self._decimal_error = ValueError(f'invalid decimal word "{token.word}"')
+            tokens.append(token)
+            return
+
+        if kind == TokenKind.POINT:
+            # the number before the point won't change from here on
+            try:
+                self._left = self._integer() if tokens else 0
+            except ValueError as e:
+                self._left = e
+            self._point = index
+            self._points = 1
+            tokens.append(token)
+            return
+
+        tokens.append(token)
+        if kind == TokenKind.MAGNITUDE:
+            self._stacked = self._stacked or (self._magnitude and token.word == self._parser.lexicon._top_magnitude)
+            self._magnitude = True
+        elif kind == TokenKind.OF:
+            self._of = True
+        order = self._parser.lexicon._split_order.get(token.word) if kind in _numbers else None
+        if order is not None:
+            self._split(index, order)
+            return
+
+        if not self._simple:
+            return
+        if kind == TokenKind.FRACTION or kind == TokenKind.OF:
+            # too complicated to keep a running total for. `Word2Number.process_chunk` can do it
+            self._simple = False
+            return
+
+        # the 'and' before this word wasn't the last word after all, so it splits the chunk up
+        if self._and_pending:
+            self._and_pending = False
+            self._bad_piece = self._bad_piece or not self._good_piece()
+            self._splits += 1
+            self._piece_start = index
+            self._piece_valid = self._piece_sign = self._piece_other = False
+        if kind == TokenKind.AND and index > self._piece_start:
+            self._and_pending = True
+        elif kind in _numbers or kind == TokenKind.DIGITS:
+            self._piece_valid = True
+        elif token.word in self._parser.lexicon.negative_words:
+            self._piece_sign = True
+        elif kind != TokenKind.AND:
+            self._piece_other = True
+
+        # the same as the main loop in `Word2Number.process_chunk`
+        if kind == TokenKind.DIGITS:
+            self._sum += token.value
+            self._count += 1
+        elif kind == TokenKind.NUMBER:
+            if token.word in self._parser.lexicon.hundred_words:
+                self._sum = self._sum * 100 if self._count else 100
+                self._count = 1
+            else:
+                self._sum += token.value
+                self._count += 1
+        else:
+            self._fails += 1
+
+    def _good_piece(self):
+        # whether the piece `Word2Number.process_chunk` is up to is allowed
+        return self._piece_valid or (self._piece_sign and not self._piece_other)
+
+    def _split(self, index, order):
+        # a magnitude ends the current chunk. Any chunks that ended in a smaller (or the same)
+        # magnitude aren't split off any more because this one is further right
+        chunks = self._chunks
+        while chunks and chunks[-1][0] >= order:
+            chunks.pop()
+        start = chunks[-1][1] + 1 if chunks else 0
+        total = chunks[-1][2] if chunks else None
+        value = self._evaluate_chunk(self._tokens[start: index + 1], False)
+        chunks.append([order, index, _add_values(total, value), _unset])
+        self._open_chunk()
+
+    def _evaluate_chunk(self, chunk, ordinals):
+        # `Word2Number.evaluate_chunk`, but returns None if the chunk is invalid
+        try:
+            return self._parser.evaluate_chunk(chunk, ordinals)
+        except ValueError:
+            return None
+
+    def _open_value(self):
+        # the value of the chunk after the last magnitude, which is always the last chunk
+        if not self._simple:
+            return self._evaluate_chunk(self._tokens[self._start:], True)
+        if self._splits and (self._bad_piece or not self._good_piece()):
+            return None
+        if self._fails == len(self._tokens) - self._start:
+            return None
+        return self._sum or 1
+
+    def _integer(self):
+        # `Word2Number.evaluate_tokens` for a phrase without a decimal point
+        tokens = self._tokens
+        if len(tokens) == 1:
+            return self._parser.evaluate_tokens(tokens)
+        if not self._valid:
+            raise ValueError('failed to parse. No valid number words detected')
+        if self._stacked and not self._of:
+            # a number too big for our magnitude words. These aren't split up like other phrases
+            return self._parser.evaluate_stacked(tokens)
+
+        chunks = self._chunks
+        if self._start < len(tokens):
+            total = chunks[-1][2] if chunks else None
+            value = self._open_value()
+        else:
+            # the phrase ends with a magnitude, so the chunk it ends is the last one and allows ordinals
+            last = chunks[-1]
+            if last[3] is _unset:
+                start = chunks[-2][1] + 1 if len(chunks) > 1 else 0
+                last[3] = self._evaluate_chunk(tokens[start:], True)
+            total = chunks[-2][2] if len(chunks) > 1 else None
+            value = last[3]
+        total = _add_values(total, value)
+        if total is None:
+            raise ValueError('failed to parse. None of the phrase is a valid number')
+        return total
+
+    def _evaluate(self):
+        if not self._words:
+            raise ValueError('failed to parse. No valid number words detected')
+        if len(self._words) == 1:
+            # one word might be something like '1.5' or '1e3', which `Word2Number.evaluate` handles
+            result = _evaluate(self._words[0], self._parser)
+        elif self._point is None:
+            result = self._integer()
+        else:
+            if not self._valid:
+                raise ValueError('failed to parse. No valid number words detected')
+            if self._points > 1:
+                raise ValueError('too many occurences of "point" to be a valid decimal')
+            if isinstance(self._left, ValueError):
+                raise self._left
+            if self._decimal_error is not None:
+                raise self._decimal_error
+            result = float(f'{self._left}.{self._decimal}')
+        return -result if self._minus and result else result
+
+    @property
+    def value(self):
+        '''
+        The number the words fed in so far make up, or None if they aren't a valid number (yet)
+        '''
+        if self._value is _unset:
+            try:
+                self._value = self._evaluate()
+            except ValueError:
+                self._value = None
+        return self._value
+
+    def finish(self):
+        '''
+        Gets the number the words fed in make up and resets the parser, ready for the next number.
+
+        Returns:
+            int or float
+
+        Raises:
+            ValueError: if the words aren't a valid number
+        '''
+        try:
+            return self._evaluate()
+        finally:
+            self.reset()
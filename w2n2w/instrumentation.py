@@ -0,0 +1,176 @@
+import logging
+import threading
+import time
+from collections import deque, namedtuple
+
+from . import Word2Number
+
+StageStats = namedtuple('StageStats', ('calls', 'time', 'own_time'))
+StageStats.__doc__ = '''
+The statistics for one stage of `word_to_num`.
+
+Attributes:
+    calls (int): how many times the stage ran, including recursive calls
+    time (float): seconds spent in the stage, including the stages it called.
+        Recursive calls aren't counted twice
+    own_time (float): seconds spent in the stage itself, not counting the stages it called
+'''
+
+SlowInput = namedtuple('SlowInput', ('words', 'time'))
+SlowInput.__doc__ = '''
+A phrase that took longer than the slow input threshold to evaluate.
+
+Attributes:
+    words (str): the normalized phrase
+    time (float): how long it took, in seconds
+'''
+
+# the `Word2Number` methods we time and the stage names we record them under.
+# `evaluate` only does the shortcut checks itself, everything else is handed off to the other stages
+_stages = {
+    'normalize': 'normalize',
+    'evaluate': 'shortcuts',
+    'tokenize': 'tokenize',
+    'evaluate_tokens': 'evaluate_tokens',
+    'split_by_magnitude': 'split_by_magnitude',
+    'split_tokens': 'split_tokens',
+    'evaluate_chunk': 'evaluate_chunk',
+    'process_chunk': 'process_chunk',
+    'group_by_magnitude_order': 'group_by_magnitude_order',
+    'process_decimal': 'process_decimal'
+}
+
+_lock = threading.Lock()
+_local = threading.local()
+# the original methods, while instrumentation is on
+_originals = {}
+_stats = {}
+_slow_inputs = deque(maxlen=100)
+_settings = {'slow_threshold': None, 'callback': None, 'slow_callback': None}
+_logger = logging.getLogger(__name__)
+
+
+def _record(stage, elapsed, outer, own):
+    with _lock:
+        calls, total, own_total = _stats.get(stage, (0, 0.0, 0.0))
+        _stats[stage] = (calls + 1, total + elapsed if outer else total, own_total + own)
+
+
+def _notify(callback, *args):
+    # the callbacks are user code. If one raises it gets logged rather than replacing
+    # the result (or the real error) of the conversion, or stopping the outer stages from reporting
+    try:
+        callback(*args)
+    except Exception:
+        _logger.exception('instrumentation callback %r raised', callback)
+
+
+def _timed(stage, func):
+    # wraps one of the `Word2Number` methods so that each call is timed.
+    # Each thread keeps a stack of how long the calls in progress have spent in
+    # other stages so that we can work out each stage's own time
+    timer = time.perf_counter
+
+    def wrapper(*args, **kwargs):
+        try:
+            stack = _local.stack
+            depth = _local.depth
+        except AttributeError:
+            stack = _local.stack = []
+            depth = _local.depth = {}
+        stack.append(0.0)
+        depth[stage] = depth.get(stage, 0) + 1
+        start = timer()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = timer() - start
+            inner = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            depth[stage] -= 1
+            outer = depth[stage] == 0
+            _record(stage, elapsed, outer, elapsed - inner)
+
+            callback = _settings['callback']
+            if callback is not None:
+                _notify(callback, stage, elapsed)
+            threshold = _settings['slow_threshold']
+            if stage == 'shortcuts' and outer and threshold is not None and elapsed >= threshold:
+                # the first argument of `Word2Number.evaluate` is the phrase
+                words = args[-1] if args else kwargs['words']
+                _slow_inputs.append(SlowInput(words, elapsed))
+                slow_callback = _settings['slow_callback']
+                if slow_callback is not None:
+                    _notify(slow_callback, words, elapsed)
+
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def enable_instrumentation(slow_threshold=None, callback=None, slow_callback=None, log_size=100):
+    '''
+    Starts recording how many times each stage of `word_to_num` runs and how long it takes.
+    When instrumentation is off the stages run without any timing code at all,
+    so it costs nothing unless it's turned on.
+    Calling this again changes the settings without clearing what has been recorded.
+
+    Args:
+        slow_threshold (float): phrases that take at least this many seconds to evaluate are
+            kept in the slow input log. Defaults to None, which doesn't log anything
+        callback (callable): called with (stage, seconds) after every stage runs.
+            Use this to forward timings to your own metrics system
+        slow_callback (callable): called with (words, seconds) for every slow phrase.
+            Exceptions raised by either callback are logged and otherwise ignored
+        log_size (int): the most slow inputs to keep. The oldest are thrown away first
+    '''
+    global _slow_inputs
+    with _lock:
+        _settings['slow_threshold'] = slow_threshold
+        _settings['callback'] = callback
+        _settings['slow_callback'] = slow_callback
+        if log_size != _slow_inputs.maxlen:
+            _slow_inputs = deque(_slow_inputs, maxlen=log_size)
+
+        if _originals:
+            return
+        for name, stage in _stages.items():
+            original = Word2Number.__dict__[name]
+            # keep the method a staticmethod or classmethod like the original
+            setattr(Word2Number, name, type(original)(_timed(stage, original.__func__)))
+            _originals[name] = original
+
+
+def disable_instrumentation():
+    '''Stops recording and puts the stages back as they were. Anything already recorded is kept'''
+    with _lock:
+        for name, original in _originals.items():
+            setattr(Word2Number, name, original)
+        _originals.clear()
+
+
+def reset_instrumentation():
+    '''Throws away the recorded statistics and slow inputs'''
+    with _lock:
+        _stats.clear()
+        _slow_inputs.clear()
+
+
+def instrumentation_stats():
+    '''
+    Returns:
+        dict: maps the name of each stage that has run to its `StageStats`
+    '''
+    with _lock:
+        return {k: StageStats(*v) for k, v in _stats.items()}
+
+
+def slow_inputs():
+    '''
+    Returns:
+        list: the `SlowInput`s logged since the last reset, oldest first
+    '''
+    with _lock:
+        return list(_slow_inputs)
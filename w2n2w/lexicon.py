@@ -0,0 +1,311 @@
+import pickle
+import re
+import threading
+from importlib import import_module
+from types import MappingProxyType
+
+from . import TokenKind
+from .fuzzy import FuzzyIndex
+
+# bump this whenever the attributes of `Lexicon` change so that old snapshots are rejected
+SNAPSHOT_VERSION = 1
+# how many characters of each word `Word2Number.could_be_number` looks at
+_start_size = 4
+
+
+class Lexicon():
+    '''
+    The vocabulary `word_to_num` understands for one language, compiled into read-only
+    lookup tables. All of the work is done once, when the lexicon is created or loaded.
+
+    Args:
+        name (str): the name of the locale, eg: 'en'
+        number_words (dict): every word with a value mapped to that value,
+            including the words in all of the other tables
+        magnitudes (dict): words that multiply the words before them, eg: 'thousand'
+        decimal_words (dict): the words allowed after a decimal point, eg: 'five'
+        ordinal_words (dict): ordinals mapped to the number they're the ordinal of, eg: 'third' -> 3
+        ordinal_magnitudes (dict): ordinal magnitudes mapped to their magnitude, eg: 'thousandth' -> 1000
+        fraction_words (dict): fractions mapped to their value, eg: 'thirds' -> 1/3
+        hundred_words (iterable): magnitudes that multiply everything before them in a chunk instead
+            of splitting the phrase up, eg: 'hundred' in 'one hundred 23 million'
+        article_words (iterable): words that mean 'one' in front of a fraction, eg: 'a' in 'a third'
+        and_words (iterable): words that join parts of a number, eg: 'and'
+        of_words (iterable): words that multiply the parts either side of them, eg: 'of'
+        point_words (iterable): words used for a decimal point. '.' always counts as one
+        negative_words (iterable): words that make a number negative when they come first
+        compounds (bool): split words the lexicon doesn't know into words it does, for
+            languages that write numbers as one word. EG: 'einundzwanzig' -> 'ein und zwanzig'
+        replacements (dict): phrases to replace before parsing, for multi-word numbers
+            that don't add up word by word. EG: 'quatre vingt' -> 'quatrevingt'
+    '''
+    def __init__(
+        self, name, number_words, magnitudes, decimal_words, ordinal_words=None, ordinal_magnitudes=None,
+        fraction_words=None, hundred_words=(), article_words=(), and_words=(), of_words=(), point_words=(),
+        negative_words=(), compounds=False, replacements=None
+    ):
+        ordinal_words = ordinal_words or {}
+        ordinal_magnitudes = ordinal_magnitudes or {}
+        fraction_words = fraction_words or {}
+
+        self.name = name
+        self.number_words = MappingProxyType(dict(number_words))
+        self.magnitudes = MappingProxyType(dict(magnitudes))
+        self.decimal_words = MappingProxyType(dict(decimal_words))
+        self.ordinal_words = MappingProxyType(dict(ordinal_words))
+        self.ordinal_magnitudes = MappingProxyType(dict(ordinal_magnitudes))
+        self.fraction_words = MappingProxyType(dict(fraction_words))
+        self.hundred_words = frozenset(hundred_words)
+        hundreds = {magnitudes[i] for i in hundred_words}
+        self.hundredth_words = frozenset(k for k, v in ordinal_magnitudes.items() if v in hundreds)
+        self.article_words = frozenset(article_words)
+        self.negative_words = tuple(negative_words)
+        self.compounds = compounds
+        self.replacements = MappingProxyType(dict(replacements or {}))
+
+        # magnitudes that split a phrase up into chunks
+        self.split_magnitudes = tuple(
+            i for i in list(magnitudes) + list(ordinal_magnitudes)
+            if i not in self.hundred_words and i not in self.hundredth_words
+        )
+        # the order `Word2Number.split_by_magnitude` splits things up in. Biggest first,
+        # ordinals before cardinals. Plural fractions like 'millionths' split the phrase
+        # in the same place as 'millionth'
+        split_order = {m: i for i, m in enumerate(reversed(self.split_magnitudes))}
+        split_order.update({
+            m + 's': i for m, i in split_order.items() if m in ordinal_magnitudes and m + 's' in fraction_words
+        })
+        self._split_order = split_order
+
+        # every word the tokenizer knows about, mapped to the kind, word and value fields of its token.
+        # Magnitudes use the values in `magnitudes` and `ordinal_magnitudes` because
+        # `number_words` maps ordinal magnitudes (eg: 'thousandth') to their fractions
+        self._tokens = {
+            **{
+                k: (TokenKind.FRACTION if k in fraction_words else TokenKind.NUMBER, k, v)
+                for k, v in number_words.items()
+            },
+            **{k: (TokenKind.MAGNITUDE, k, v) for k, v in magnitudes.items() if k in self.split_magnitudes},
+            **{
+                k: (TokenKind.ORDINAL_MAGNITUDE, k, v)
+                for k, v in ordinal_magnitudes.items() if k in self.split_magnitudes
+            },
+            **{k: (TokenKind.AND, k, None) for k in and_words},
+            **{k: (TokenKind.OF, k, None) for k in of_words},
+            **{k: (TokenKind.POINT, k, None) for k in point_words},
+            '.': (TokenKind.POINT, '.', None)
+        }
+        self._setup()
+
+    def _setup(self):
+        # the bits that aren't saved in snapshots
+        self.tokens = MappingProxyType(self._tokens)
+        self.split_order = MappingProxyType(self._split_order)
+        self._replacement_pattern = None
+        if self.replacements:
+            # longest first so that a phrase is never partly replaced by a shorter one
+            phrases = sorted(self.replacements, key=len, reverse=True)
+            self._replacement_pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, phrases)) + r')\b')
+        self._compound_cache = {}
+        self._fuzzy_indexes = {}
+        # the biggest magnitude, which `num_to_word` stacks up for numbers too big for any of them.
+        # See `Word2Number.evaluate_stacked`
+        self._top_magnitude = max(
+            (k for k in self.magnitudes if k in self._split_order), key=self.magnitudes.get, default=None
+        )
+
+        # the first few characters of every word that can make a phrase a number, see
+        # `Word2Number.could_be_number`. 'infinity' and 'nan' are there because `float` accepts them.
+        # In languages with compound words a word can start with any of the words in the lexicon,
+        # so we also need the beginnings of words made of more than one of them
+        if self.compounds:
+            words = [k for k in self._tokens if k != '.']
+        else:
+            words = [k for k, v in self._tokens.items() if v[0] in TokenKind.numbers]
+        words += ['infinity', 'nan']
+        starts = set()
+        pending = {''}
+        while pending:
+            prefix = pending.pop()
+            for word in words:
+                word = prefix + word
+                starts.update(word[:i] for i in range(len(prefix) + 1, min(len(word), _start_size) + 1))
+                if self.compounds and len(word) < _start_size:
+                    pending.add(word)
+        self._starts = frozenset(starts)
+
+    def __repr__(self):
+        return f'<Lexicon {self.name!r}>'
+
+    def replace(self, words):
+        '''
+        Applies the lexicon's `replacements` to a lower case phrase.
+
+        Args:
+            words (str): the phrase
+
+        Returns:
+            str
+        '''
+        if self._replacement_pattern is None:
+            return words
+        return self._replacement_pattern.sub(lambda m: self.replacements[m.group()], words)
+
+    def split_compound(self, word):
+        '''
+        Splits a word into the fewest words from the lexicon that make it up.
+
+        Args:
+            word (str): the word to split
+
+        Returns:
+            tuple: the words, or None if it can't be made out of words from the lexicon
+        '''
+        try:
+            return self._compound_cache[word]
+        except KeyError:
+            pass
+
+        # best[i] is the shortest way of making word[:i] out of known words
+        tokens = self._tokens
+        best = [()] + [None] * len(word)
+        for end in range(1, len(word) + 1):
+            for start in range(end):
+                if best[start] is not None and word[start: end] in tokens:
+                    parts = best[start] + (word[start: end],)
+                    if best[end] is None or len(parts) < len(best[end]):
+                        best[end] = parts
+        result = best[-1]
+
+        if len(self._compound_cache) >= 4096:
+            self._compound_cache.clear()
+        self._compound_cache[word] = result
+        return result
+
+    def closest_word(self, word, max_edits=1):
+        '''
+        Finds the word in `number_words` that's closest to a misspelt word, eg: 'fourty' -> 'forty'.
+        Cardinals win over ordinals and fractions that are just as close, so 'ninty' is 'ninety' rather
+        than 'ninth'. The index it searches is built the first time each `max_edits` is used.
+        See `FuzzyIndex`.
+
+        Args:
+            word (str): the (lower case) word
+            max_edits (int): the most edits `word` can be away from the word it's matched to
+
+        Returns:
+            str: the closest word, or None if nothing is close enough
+        '''
+        index = self._fuzzy_indexes.get(max_edits)
+        if index is None:
+            ranked = sorted(
+                self.number_words,
+                key=lambda k: 2 if k in self.fraction_words else 1 if k in self.ordinal_words else 0
+            )
+            index = self._fuzzy_indexes.setdefault(max_edits, FuzzyIndex(ranked, max_edits))
+        return index.closest(word)
+
+    def save(self, path):
+        '''
+        Saves the compiled lexicon to a snapshot file that `Lexicon.load` can read
+        without compiling it again.
+
+        Args:
+            path (str): where to save it
+        '''
+        state = {
+            k: dict(v) if type(v) == MappingProxyType else v for k, v in self.__dict__.items()
+            if k not in (
+                'tokens', 'split_order', '_replacement_pattern', '_compound_cache', '_fuzzy_indexes', '_starts',
+                '_top_magnitude'
+            )
+        }
+        with open(path, 'wb') as f:
+            pickle.dump({'version': SNAPSHOT_VERSION, 'state': state}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        '''
+        Loads a lexicon saved by `Lexicon.save`. Snapshots are pickles,
+        so only load ones you trust.
+
+        Args:
+            path (str): the snapshot file
+
+        Returns:
+            Lexicon
+
+        Raises:
+            ValueError: if the snapshot was made by an incompatible version of this library
+        '''
+        with open(path, 'rb') as f:
+            snapshot = pickle.load(f)
+        if type(snapshot) != dict or snapshot.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f'{path} is not a compatible lexicon snapshot')
+
+        self = cls.__new__(cls)
+        for k, v in snapshot['state'].items():
+            if type(v) == dict and not k.startswith('_'):
+                v = MappingProxyType(v)
+            setattr(self, k, v)
+        self._setup()
+        return self
+
+
+# locale names mapped to their `Lexicon`, or to something that makes one the first time it's used:
+# a function that returns it or the path of a snapshot
+_locales = {
+    'de': lambda: import_module('.locales.de', __package__).lexicon,
+    'es': lambda: import_module('.locales.es', __package__).lexicon,
+    'fr': lambda: import_module('.locales.fr', __package__).lexicon
+}
+_locales_lock = threading.Lock()
+
+
+def register_locale(name, source):
+    '''
+    Adds a locale, or replaces an existing one. Nothing is loaded until the locale is first used.
+
+    Args:
+        name (str): the name to use it by, eg: 'pt'
+        source (Lexicon, callable or str): the lexicon, a function that returns it,
+            or the path of a snapshot saved with `Lexicon.save`
+    '''
+    with _locales_lock:
+        _locales[name] = source
+
+
+def get_locale(name):
+    '''
+    Gets a locale's lexicon, loading it if this is the first time it has been used.
+
+    Args:
+        name (str): the name of the locale, eg: 'en'
+
+    Returns:
+        Lexicon
+
+    Raises:
+        ValueError: if there is no locale called `name`
+    '''
+    lexicon = _locales.get(name)
+    if isinstance(lexicon, Lexicon):
+        return lexicon
+
+    with _locales_lock:
+        # another thread may have loaded it while we waited for the lock
+        lexicon = _locales.get(name)
+        if lexicon is None:
+            raise ValueError(f'unknown locale {name!r}. Use one of {", ".join(sorted(_locales))}')
+        if not isinstance(lexicon, Lexicon):
+            lexicon = Lexicon.load(lexicon) if type(lexicon) == str else lexicon()
+            _locales[name] = lexicon
+        return lexicon
+
+
+def available_locales():
+    '''
+    Returns:
+        list: the names of every registered locale, loaded or not
+    '''
+    return sorted(_locales)
@@ -0,0 +1,23 @@
+'''
+The lexicons for languages other than English. Each module builds a `lexicon` when it
+is imported, which only happens the first time the locale is used (see `w2n2w.get_locale`).
+'''
+import unicodedata
+
+
+def plain_spellings(words):
+    '''
+    Adds a copy of each word spelt without accents, so that 'dieciséis' can also be written 'dieciseis'.
+    A 'ß' becomes 'ss'.
+
+    Args:
+        words (dict): words mapped to their values
+
+    Returns:
+        dict: `words` with the extra spellings added
+    '''
+    result = dict(words)
+    for word, value in words.items():
+        plain = unicodedata.normalize('NFKD', word.replace('ß', 'ss')).encode('ascii', 'ignore').decode()
+        result.setdefault(plain, value)
+    return result
@@ -0,0 +1,99 @@
+'''German. Numbers written as one word, like 'zweihunderteinundzwanzig', are split into their parts'''
+from ..lexicon import Lexicon
+from . import plain_spellings
+
+decimal_words = plain_spellings({
+    'null': 0,
+    'eins': 1,
+    'zwei': 2,
+    'drei': 3,
+    'vier': 4,
+    'fünf': 5,
+    'sechs': 6,
+    'sieben': 7,
+    'acht': 8,
+    'neun': 9
+})
+
+magnitudes = {
+    'hundert': 100,
+    'tausend': 1_000,
+    'million': 10**6,
+    'millionen': 10**6,
+    'milliarde': 10**9,
+    'milliarden': 10**9,
+    'billion': 10**12,
+    'billionen': 10**12
+}
+
+ordinal_words = plain_spellings({
+    'erste': 1,
+    'erster': 1,
+    'zweite': 2,
+    'zweiter': 2,
+    'dritte': 3,
+    'dritter': 3,
+    'vierte': 4,
+    'vierter': 4,
+    'fünfte': 5,
+    'fünfter': 5,
+    'sechste': 6,
+    'sechster': 6,
+    'siebte': 7,
+    'siebter': 7,
+    'achte': 8,
+    'achter': 8,
+    'neunte': 9,
+    'neunter': 9,
+    'zehnte': 10,
+    'zehnter': 10
+})
+
+# unlike English, German fractions are never the same word as an ordinal
+fraction_words = plain_spellings({
+    'halb': .5,
+    'halbe': .5,
+    'hälfte': .5,
+    'drittel': 1 / 3,
+    'viertel': .25,
+    'fünftel': .2,
+    'sechstel': 1 / 6,
+    'siebtel': 1 / 7,
+    'achtel': .125,
+    'neuntel': 1 / 9,
+    'zehntel': .1,
+    'hundertstel': .01,
+    'tausendstel': .001,
+    'millionstel': 10**-6
+})
+
+cardinal_words = plain_spellings({
+    'ein': 1,
+    'eine': 1,
+    'zehn': 10,
+    'elf': 11,
+    'zwölf': 12,
+    'dreizehn': 13,
+    'vierzehn': 14,
+    'fünfzehn': 15,
+    'sechzehn': 16,
+    'siebzehn': 17,
+    'achtzehn': 18,
+    'neunzehn': 19,
+    'zwanzig': 20,
+    'dreißig': 30,
+    'vierzig': 40,
+    'fünfzig': 50,
+    'sechzig': 60,
+    'siebzig': 70,
+    'achtzig': 80,
+    'neunzig': 90
+})
+
+lexicon = Lexicon(
+    'de',
+    {**ordinal_words, **decimal_words, **fraction_words, **cardinal_words, **magnitudes},
+    magnitudes, decimal_words, ordinal_words=ordinal_words, fraction_words=fraction_words,
+    hundred_words=('hundert',), article_words=('ein', 'eine', 'eins'), and_words=('und',),
+    point_words=('komma', 'punkt'), negative_words=('minus', 'negativ'), compounds=True
+)
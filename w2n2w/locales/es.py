@@ -0,0 +1,124 @@
+'''Spanish. Large numbers use the long scale, so 'billón' is 10^12 and 'mil millones' is 10^9'''
+from ..lexicon import Lexicon
+from . import plain_spellings
+
+decimal_words = plain_spellings({
+    'cero': 0,
+    'uno': 1,
+    'dos': 2,
+    'tres': 3,
+    'cuatro': 4,
+    'cinco': 5,
+    'seis': 6,
+    'siete': 7,
+    'ocho': 8,
+    'nueve': 9
+})
+
+magnitudes = plain_spellings({
+    'mil': 1_000,
+    'millón': 10**6,
+    'millones': 10**6,
+    'billón': 10**12,
+    'billones': 10**12,
+    'trillón': 10**18,
+    'trillones': 10**18
+})
+
+ordinal_magnitudes = plain_spellings({
+    'milésimo': 1_000,
+    'milésima': 1_000,
+    'millonésimo': 10**6,
+    'millonésima': 10**6
+})
+
+ordinal_words = plain_spellings({
+    'primero': 1,
+    'primer': 1,
+    'primera': 1,
+    'segundo': 2,
+    'segunda': 2,
+    'tercero': 3,
+    'tercer': 3,
+    'tercera': 3,
+    'cuarto': 4,
+    'cuarta': 4,
+    'quinto': 5,
+    'quinta': 5,
+    'sexto': 6,
+    'sexta': 6,
+    'séptimo': 7,
+    'séptima': 7,
+    'octavo': 8,
+    'octava': 8,
+    'noveno': 9,
+    'novena': 9,
+    'décimo': 10,
+    'décima': 10,
+    **ordinal_magnitudes
+})
+
+fraction_words = {
+    'medio': .5,
+    'media': .5,
+    'medios': .5,
+    'medias': .5,
+    'tercio': 1 / 3,
+    'tercios': 1 / 3
+}
+for k, v in ordinal_words.items():
+    if v > 3:
+        fraction_words[k] = 1 / v
+        fraction_words[k + 's'] = 1 / v
+
+cardinal_words = plain_spellings({
+    'un': 1,
+    'una': 1,
+    'diez': 10,
+    'once': 11,
+    'doce': 12,
+    'trece': 13,
+    'catorce': 14,
+    'quince': 15,
+    'dieciséis': 16,
+    'diecisiete': 17,
+    'dieciocho': 18,
+    'diecinueve': 19,
+    'veinte': 20,
+    'veintiuno': 21,
+    'veintiún': 21,
+    'veintiuna': 21,
+    'veintidós': 22,
+    'veintitrés': 23,
+    'veinticuatro': 24,
+    'veinticinco': 25,
+    'veintiséis': 26,
+    'veintisiete': 27,
+    'veintiocho': 28,
+    'veintinueve': 29,
+    'treinta': 30,
+    'cuarenta': 40,
+    'cincuenta': 50,
+    'sesenta': 60,
+    'setenta': 70,
+    'ochenta': 80,
+    'noventa': 90,
+    # the hundreds are words of their own rather than 'dos cien'
+    'cien': 100,
+    'ciento': 100,
+    **{
+        k + ending: v for k, v in {
+            'dos': 200, 'tres': 300, 'cuatro': 400, 'seis': 600, 'sete': 700, 'ocho': 800, 'nove': 900
+        }.items() for ending in ('cientos', 'cientas')
+    },
+    'quinientos': 500,
+    'quinientas': 500
+})
+
+lexicon = Lexicon(
+    'es',
+    {**ordinal_words, **decimal_words, **fraction_words, **cardinal_words, **magnitudes},
+    magnitudes, decimal_words, ordinal_words=ordinal_words, ordinal_magnitudes=ordinal_magnitudes,
+    fraction_words=fraction_words, article_words=('un', 'una', 'uno'), and_words=('y',), of_words=('de',),
+    point_words=('coma', 'punto'), negative_words=('menos',)
+)
@@ -0,0 +1,101 @@
+'''French. 'Quatre-vingt' is read as eighty rather than four and twenty'''
+from ..lexicon import Lexicon
+from . import plain_spellings
+
+decimal_words = plain_spellings({
+    'zéro': 0,
+    'un': 1,
+    'deux': 2,
+    'trois': 3,
+    'quatre': 4,
+    'cinq': 5,
+    'six': 6,
+    'sept': 7,
+    'huit': 8,
+    'neuf': 9
+})
+
+magnitudes = {
+    'cent': 100,
+    'cents': 100,
+    'mille': 1_000,
+    'mil': 1_000,
+    'million': 10**6,
+    'millions': 10**6,
+    'milliard': 10**9,
+    'milliards': 10**9,
+    'billion': 10**12,
+    'billions': 10**12
+}
+
+ordinal_magnitudes = plain_spellings({
+    'centième': 100,
+    'millième': 1_000,
+    'millionième': 10**6,
+    'milliardième': 10**9
+})
+
+ordinal_words = plain_spellings({
+    'premier': 1,
+    'première': 1,
+    'deuxième': 2,
+    'second': 2,
+    'seconde': 2,
+    'troisième': 3,
+    'quatrième': 4,
+    'cinquième': 5,
+    'sixième': 6,
+    'septième': 7,
+    'huitième': 8,
+    'neuvième': 9,
+    'dixième': 10,
+    'onzième': 11,
+    'douzième': 12,
+    'vingtième': 20,
+    'trentième': 30,
+    **ordinal_magnitudes
+})
+
+fraction_words = {
+    'demi': .5,
+    'demie': .5,
+    'demis': .5,
+    'demies': .5,
+    'tiers': 1 / 3,
+    'quart': .25,
+    'quarts': .25
+}
+for k, v in ordinal_words.items():
+    if v > 4:
+        fraction_words[k] = 1 / v
+        fraction_words[k + 's'] = 1 / v
+
+cardinal_words = {
+    'une': 1,
+    'dix': 10,
+    'onze': 11,
+    'douze': 12,
+    'treize': 13,
+    'quatorze': 14,
+    'quinze': 15,
+    'seize': 16,
+    'vingt': 20,
+    'vingts': 20,
+    'trente': 30,
+    'quarante': 40,
+    'cinquante': 50,
+    'soixante': 60,
+    # see `replacements`
+    'quatrevingt': 80,
+    'quatrevingts': 80
+}
+
+lexicon = Lexicon(
+    'fr',
+    {**ordinal_words, **decimal_words, **fraction_words, **cardinal_words, **magnitudes},
+    magnitudes, decimal_words, ordinal_words=ordinal_words, ordinal_magnitudes=ordinal_magnitudes,
+    fraction_words=fraction_words, hundred_words=('cent', 'cents'), article_words=('un', 'une'),
+    and_words=('et',), of_words=('de',), point_words=('virgule', 'point'), negative_words=('moins',),
+    # everything else adds up word by word, eg: 'soixante dix' is 60 + 10, but 'quatre vingt' is 4 * 20
+    replacements={'quatre vingt': 'quatrevingt', 'quatre vingts': 'quatrevingts'}
+)
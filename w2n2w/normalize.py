@@ -0,0 +1,156 @@
+import os
+import re
+from decimal import Decimal
+
+from . import num_to_word
+from .search import _scan
+
+# numbers written in digits, with or without thousands separators, like '-12', '1,000' or '3.14'.
+# They can't be part of a bigger word or number, so '2nd', 'v1.2', '1.2.3' and '1,23' are left alone
+_digits_pattern = re.compile(r'(?<![\w.])(?<!\d,)-?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?!\w|[.,]\d)')
+# the last bit of whitespace in a string. Numbers in digits can never carry on across whitespace
+_last_space = re.compile(r'\s(?=\S*\Z)')
+# the most text `normalize_file` keeps back waiting to see if a number carries on (or `buffer_size`, if that's bigger)
+_max_carry = 1 << 16
+
+
+def _check_direction(direction):
+    if direction not in ('to-num', 'to-words'):
+        raise ValueError(f'direction must be "to-num" or "to-words", not {direction!r}')
+
+
+def _digits_to_word(digits):
+    # read out exactly as written, so '0.50' is 'zero point five zero' rather than 'one half'
+    digits = digits.replace(',', '')
+    return num_to_word(Decimal(digits) if '.' in digits else int(digits), prefer_fraction_words=False)
+
+
+def _spans(text, direction, final):
+    # the (start, end, replacement) of each number in `text`, and how much of `text` has been decided.
+    # If `final` is False then `text` is only the start of something longer, so the end of it
+    # might be part of a number that carries on. That part isn't decided until there's more text
+    if direction == 'to-num':
+        spans = []
+        scan = _scan(text, final)
+        while True:
+            try:
+                start, end, value = next(scan)
+            except StopIteration as e:
+                decided = e.value
+                break
+            spans.append((start, end, str(value)))
+        # `_scan` can find numbers after the point it stopped at. They'll be found again next time
+        return [span for span in spans if span[1] <= decided], decided
+
+    decided = len(text)
+    if not final:
+        match = _last_space.search(text)
+        decided = match.end() if match else 0
+    spans = [
+        (match.start(), match.end(), _digits_to_word(match.group()))
+        for match in _digits_pattern.finditer(text, 0, decided)
+    ]
+    return spans, decided
+
+
+def _replace(text, spans):
+    out = []
+    last = 0
+    for start, end, replacement in spans:
+        out.append(text[last: start])
+        out.append(replacement)
+        last = end
+    out.append(text[last:])
+    return ''.join(out)
+
+
+def normalize_text(text, direction='to-num'):
+    '''
+    Rewrites every number in a piece of text.
+
+    Args:
+        text (str): the text to rewrite
+        direction (str): 'to-num' to turn number phrases into digits (see `find_numbers`) or
+            'to-words' to turn numbers written in digits into words. Digits are read out
+            exactly as they're written, so '0.50' becomes 'zero point five zero'
+
+    Returns:
+        str
+
+    Raises:
+        TypeError: if `text` is not a string
+        ValueError: if `direction` is invalid
+
+    Example:
+        ```python
+        print(normalize_text('I owe you twenty-five pounds'))
+        # I owe you 25 pounds
+        print(normalize_text('I owe you 25 pounds', 'to-words'))
+        # I owe you twenty five pounds
+        ```
+    '''
+    if type(text) != str:
+        raise TypeError('text must be a string')
+    _check_direction(direction)
+    spans, _ = _spans(text, direction, True)
+    return _replace(text, spans)
+
+
+def normalize_file(src, dst, direction='to-num', buffer_size=1 << 20, encoding='utf-8'):
+    '''
+    Rewrites every number in a file, like `normalize_text`, without reading the whole file into memory.
+    The file is read `buffer_size` characters at a time and written out as it goes.
+    Numbers that are split between two reads are still found, because the end of each read that
+    might be part of a number is kept back and joined on to the start of the next one.
+
+    At most 64K characters (or `buffer_size`, if that's bigger) are kept back, so memory use stays the
+    same however big the file is. The only numbers that can be missed are ones with more characters than that.
+
+    Args:
+        src (str, os.PathLike or file): the file to read, or a file object opened in text mode
+        dst (str, os.PathLike or file): the file to write, or a file object opened in text mode
+        direction (str): 'to-num' or 'to-words'. See `normalize_text`
+        buffer_size (int): the number of characters to read at a time
+        encoding (str): the encoding of `src` and `dst` if they are paths
+
+    Returns:
+        int: how many numbers were rewritten
+
+    Raises:
+        ValueError: if `direction` or `buffer_size` is invalid
+    '''
+    _check_direction(direction)
+    if buffer_size < 1:
+        raise ValueError('buffer_size must be at least 1')
+
+    # newline='' so line endings are written back exactly as they were read
+    source = open(src, encoding=encoding, newline='') if isinstance(src, (str, os.PathLike)) else src
+    try:
+        dest = open(dst, 'w', encoding=encoding, newline='') if isinstance(dst, (str, os.PathLike)) else dst
+        try:
+            return _normalize_stream(source, dest, direction, buffer_size)
+        finally:
+            if dest is not dst:
+                dest.close()
+    finally:
+        if source is not src:
+            source.close()
+
+
+def _normalize_stream(source, dest, direction, buffer_size):
+    count = 0
+    carry = ''  # the text at the end of the last read that hasn't been decided yet
+    while True:
+        chunk = source.read(buffer_size)
+        text = carry + chunk
+        # if the undecided text has grown too big then give up waiting for the end of it,
+        # so that memory use doesn't depend on the file
+        final = not chunk or len(carry) >= max(buffer_size, _max_carry)
+        spans, decided = _spans(text, direction, final)
+        dest.write(_replace(text[:decided], spans))
+        count += len(spans)
+        carry = text[decided:]
+        if not chunk:
+            dest.write(carry)
+            return count
+
@@ -0,0 +1,253 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+
+from . import _check_errors_policy, num_to_word, word_to_num
+
+
+def _convert_chunk(direction, values, prefer_fraction_words):
+    # runs in the worker. Errors are sent back instead of raised so one
+    # bad value doesn't throw away the rest of the chunk
+    results = []
+    for value in values:
+        try:
+            if direction == 'word_to_num':
+                results.append(word_to_num(value))
+            else:
+                results.append(num_to_word(value, prefer_fraction_words=prefer_fraction_words))
+        except (TypeError, ValueError) as e:
+            results.append(e)
+    return results
+
+
+def _key(direction, value):
+    # the key we dedupe inputs on. Numbers are keyed on their type as well
+    # because 1 == 1.0 but they aren't always worded the same
+    return value if direction == 'word_to_num' else (type(value), value)
+
+
+class ParallelConverter():
+    '''
+    Converts large numbers of values across a pool of worker processes.
+    Inputs are sent to the workers in chunks, repeated inputs are only sent once and the
+    results always come back in the same order as the inputs.
+
+    Use it as a context manager so the pool is shut down afterwards:
+
+    ```python
+    with ParallelConverter(workers=4) as converter:
+        numbers = converter.word_to_num(phrases)
+    ```
+
+    Args:
+        workers (int): the number of worker processes. Defaults to the number of CPUs
+        chunk_size (int): the number of values to send to a worker at a time
+        errors (str): what to do with a value that can't be converted.
+            'raise' re-raises the error, 'skip' leaves it out of the results
+            and 'default' puts `default` in its place. Whatever the policy, the
+            failures are recorded in `failures`. If a worker process dies (eg: it's killed) then
+            every value in the chunk it was working on fails with `BrokenProcessPool`
+        default: the value used for failed values when `errors='default'`
+
+    Attributes:
+        failures (list): a list of (index, value, exception) for each input that failed
+            during the most recent call
+    '''
+    def __init__(self, workers=None, chunk_size=1000, errors='raise', default=None):
+        _check_errors_policy(errors)
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.errors = errors
+        self.default = default
+        self.failures = []
+        self._pool = None
+        self._in_flight = set()  # chunks that have been sent to the pool but haven't finished
+
+    def __enter__(self):
+        self._pool = ProcessPoolExecutor(self.workers)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            # don't bother with the chunks that haven't started yet
+            for future in list(self._in_flight):
+                future.cancel()
+        self._pool.shutdown()
+        self._pool = None
+        self._in_flight.clear()
+
+    def word_to_num(self, words):
+        '''
+        Converts every phrase in `words`. See `w2n2w.word_to_num`.
+
+        Args:
+            words (iterable of str): the phrases to convert
+
+        Returns:
+            list: the results, in the same order as `words`
+        '''
+        return self._convert('word_to_num', list(words), True)
+
+    def num_to_word(self, nums, prefer_fraction_words=True):
+        '''
+        Converts every number in `nums`. See `w2n2w.num_to_word`.
+
+        Args:
+            nums (iterable of str, int or float): the numbers to convert
+            prefer_fraction_words (bool): see `w2n2w.num_to_word`
+
+        Returns:
+            list: the results, in the same order as `nums`
+        '''
+        return self._convert('num_to_word', list(nums), prefer_fraction_words)
+
+    def imap_word_to_num(self, words):
+        '''
+        Like `ParallelConverter.word_to_num` but yields the results as they're ready.
+        Only a few chunks per worker are read ahead, so this can be used on inputs that
+        are too big to fit in memory. Repeated inputs are only deduped within a chunk.
+
+        Args:
+            words (iterable of str): the phrases to convert
+
+        Yields:
+            the results, in the same order as `words`
+        '''
+        return self._imap('word_to_num', words, True)
+
+    def imap_num_to_word(self, nums, prefer_fraction_words=True):
+        '''
+        Like `ParallelConverter.num_to_word` but yields the results as they're ready.
+        See `ParallelConverter.imap_word_to_num`.
+
+        Args:
+            nums (iterable of str, int or float): the numbers to convert
+            prefer_fraction_words (bool): see `w2n2w.num_to_word`
+
+        Yields:
+            the results, in the same order as `nums`
+        '''
+        return self._imap('num_to_word', nums, prefer_fraction_words)
+
+    def _check_pool(self):
+        if self._pool is None:
+            raise RuntimeError('ParallelConverter must be used as a context manager')
+
+    def _submit(self, direction, values, prefer_fraction_words):
+        future = self._pool.submit(_convert_chunk, direction, values, prefer_fraction_words)
+        self._in_flight.add(future)
+        future.add_done_callback(self._in_flight.discard)
+        return future
+
+    def _restart(self):
+        # a worker died (eg: it was killed) and took the pool down with it, so start a new one
+        self._pool.shutdown()
+        self._pool = ProcessPoolExecutor(self.workers)
+
+    def _collect(self, future, direction, values, prefer_fraction_words):
+        # gets a chunk's results. If the whole chunk failed then every value in
+        # it is marked as failed rather than losing the whole job
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            pass
+        except Exception as e:
+            return [e] * len(values)
+
+        # when a worker dies every chunk in flight fails with it, not just the one that was
+        # running in that worker. Run the chunk again on its own to find out if it was the culprit
+        try:
+            try:
+                future = self._submit(direction, values, prefer_fraction_words)
+            except BrokenProcessPool:
+                # nobody has restarted the pool since it broke
+                self._restart()
+                future = self._submit(direction, values, prefer_fraction_words)
+            return future.result()
+        except BrokenProcessPool as e:
+            self._restart()
+            return [e] * len(values)
+        except Exception as e:
+            return [e] * len(values)
+
+    def _unique(self, direction, values):
+        # maps each distinct input to its results index, and each input to its distinct index
+        unique = {}
+        unique_values = []
+        indexes = []
+        for value in values:
+            try:
+                key = _key(direction, value)
+                index = unique.get(key)
+            except TypeError:
+                # unhashable, just send it on its own and let the worker raise the error
+                key = index = None
+            if index is None:
+                index = len(unique_values)
+                unique_values.append(value)
+                if key is not None:
+                    unique[key] = index
+            indexes.append(index)
+        return unique_values, indexes
+
+    def _finish(self, values, results, offset=0):
+        # applies the error policy to a list of results
+        out = []
+        for index, (value, result) in enumerate(zip(values, results), start=offset):
+            if isinstance(result, Exception):
+                self.failures.append((index, value, result))
+                if self.errors == 'raise':
+                    raise result
+                elif self.errors == 'skip':
+                    continue
+                result = self.default
+            out.append(result)
+        return out
+
+    def _convert(self, direction, values, prefer_fraction_words):
+        self._check_pool()
+        self.failures = []
+        unique_values, indexes = self._unique(direction, values)
+
+        pending = []
+        for start in range(0, len(unique_values), self.chunk_size):
+            chunk = unique_values[start: start + self.chunk_size]
+            pending.append((self._submit(direction, chunk, prefer_fraction_words), chunk))
+        unique_results = []
+        for future, chunk in pending:
+            unique_results.extend(self._collect(future, direction, chunk, prefer_fraction_words))
+
+        return self._finish(values, [unique_results[i] for i in indexes])
+
+    def _imap(self, direction, values, prefer_fraction_words):
+        self._check_pool()
+        self.failures = []
+        values = iter(values)
+        in_flight = deque()
+        offset = 0
+
+        def drain():
+            nonlocal offset
+            chunk, indexes, future, unique_values = in_flight.popleft()
+            unique_results = self._collect(future, direction, unique_values, prefer_fraction_words)
+            results = self._finish(chunk, [unique_results[i] for i in indexes], offset)
+            offset += len(chunk)
+            return results
+
+        while True:
+            chunk = list(islice(values, self.chunk_size))
+            if not chunk:
+                break
+            unique_values, indexes = self._unique(direction, chunk)
+            future = self._submit(direction, unique_values, prefer_fraction_words)
+            in_flight.append((chunk, indexes, future, unique_values))
+            # keep a couple of chunks per worker in flight so that the workers always
+            # have something to do without reading the whole input into memory
+            if len(in_flight) >= self.workers * 2:
+                yield from drain()
+        while in_flight:
+            yield from drain()
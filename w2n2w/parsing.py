@@ -0,0 +1,184 @@
+import re
+from collections import namedtuple
+
+from . import TokenKind, Word2Number, _parser
+
+ParsedGroup = namedtuple('ParsedGroup', ('text', 'start', 'end', 'value'))
+ParsedGroup.__doc__ = '''
+One of the magnitude groups a phrase was split into, eg: 'twenty three thousand' in
+'twenty three thousand and six'. See `Word2Number.split_by_magnitude`.
+
+Attributes:
+    text (str): the group, as it was written in the phrase
+    start (int): where the group starts in the phrase
+    end (int): where the group ends in the phrase
+    value (int or float): what the group added to the number, or None if it couldn't be parsed
+        and was skipped
+'''
+
+ParsedWord = namedtuple('ParsedWord', ('text', 'start', 'end'))
+ParsedWord.__doc__ = '''
+A word that didn't count towards the number.
+
+Attributes:
+    text (str): the word, as it was written in the phrase
+    start (int): where the word starts in the phrase
+    end (int): where the word ends in the phrase
+'''
+
+# the kinds of number `parse` can find
+CARDINAL = 'cardinal'  # eg: 'twenty three'
+ORDINAL = 'ordinal'  # eg: 'twenty third'
+FRACTION = 'fraction'  # eg: 'two thirds' or 'one and a half'
+DECIMAL = 'decimal'  # eg: 'two point five' or '1e3'
+
+_fractional_kinds = (TokenKind.FRACTION, TokenKind.ORDINAL_MAGNITUDE)
+
+
+class ParseResult():
+    '''
+    What `parse` found out about a phrase.
+
+    Attributes:
+        value (int or float): the number, the same as `word_to_num` gives
+        kind (str): 'cardinal', 'ordinal', 'fraction' or 'decimal'
+        negative (bool): whether the phrase started with a minus sign or a word like 'negative'
+        start (int): where the phrase starts in the text given to `parse`, after any whitespace
+        end (int): where the phrase ends in the text given to `parse`, before any whitespace
+        groups (tuple): a `ParsedGroup` for each magnitude group. For decimals these are the groups
+            before the point
+        unparsed (tuple): a `ParsedWord` for each word that didn't count towards the number. That's
+            words that aren't number words and every word in a group that couldn't be parsed
+    '''
+    __slots__ = ('value', 'kind', 'negative', 'start', 'end', 'groups', 'unparsed')
+
+    def __init__(self, value, kind, negative, start, end, groups, unparsed):
+        self.value = value
+        self.kind = kind
+        self.negative = negative
+        self.start = start
+        self.end = end
+        self.groups = groups
+        self.unparsed = unparsed
+
+    def __repr__(self):
+        return (
+            f'ParseResult(value={self.value!r}, kind={self.kind!r}, negative={self.negative!r}, '
+            f'start={self.start!r}, end={self.end!r}, groups={self.groups!r}, unparsed={self.unparsed!r})'
+        )
+
+
+def _locate(text, tokens, lexicon, pos):
+    # finds where each token's word is in `text`, starting from `pos`. Normalizing a phrase only lower-cases
+    # it, takes the sign off and turns hyphens into spaces, so its words are still in `text` in the same order.
+    # The exception is the lexicon's replacements, eg: 'quatre vingt' -> 'quatrevingt', which are found
+    # from the words they replaced. Returns a (start, end) for each token
+    lowered = text.lower()
+    sources = None
+    spans = []
+    for token in tokens:
+        start = lowered.find(token.word, pos)
+        if start != -1:
+            end = start + len(token.word)
+        else:
+            if sources is None:
+                sources = {
+                    new: re.compile(r'[\s-]+'.join(re.escape(word) for word in old.split()))
+                    for old, new in lexicon.replacements.items()
+                }
+            match = sources[token.word].search(lowered, pos) if token.word in sources else None
+            start, end = match.span() if match else (pos, pos)
+        spans.append((start, end))
+        # compound words are split into parts that share the word's position, so carry on from the
+        # end of this part rather than looking for the next word
+        pos = end
+    return spans
+
+
+def _kind(tokens, value, lexicon):
+    # what kind of number the tokens made
+    if any(token.kind == TokenKind.POINT for token in tokens):
+        return DECIMAL
+    if type(value) == float:
+        return FRACTION if any(token.kind in _fractional_kinds for token in tokens) else DECIMAL
+    # whole numbers are ordinals if the last number word is, eg: 'twenty third'
+    for token in reversed(tokens):
+        if token.kind in TokenKind.numbers:
+            return ORDINAL if token.word in lexicon.ordinal_words else CARDINAL
+    return CARDINAL
+
+
+def parse(words, locale=None):
+    '''
+    Converts a phrase into a number like `word_to_num`, but also returns what it found out along the way:
+    the kind of number, its sign, the magnitude groups it was split into and the words that
+    were ignored, with where each of them is in `words`. It's all worked out in the same pass that
+    works out the value, rather than by parsing the phrase again.
+    Results aren't cached, even if the cache is turned on.
+
+    Args:
+        words (str): the words to convert
+        locale (str or Lexicon): the language `words` is in. See `word_to_num`
+
+    Returns:
+        ParseResult
+
+    Raises:
+        TypeError: if `words` is not a string
+        ValueError: if `words` is invalid, or `locale` doesn't exist
+
+    Example:
+        ```python
+        result = parse('minus twenty three thousand and sixth apples')
+        print(result.value, result.kind, result.negative)
+        # -23006 ordinal True
+        print([group.text for group in result.groups], [word.text for word in result.unparsed])
+        # ['twenty three thousand', 'and sixth apples'] ['apples']
+        ```
+    '''
+    if type(words) != str:
+        raise TypeError('word must be a string')
+
+    parser = Word2Number if locale is None else _parser(locale)
+    lexicon = parser.lexicon
+    phrase, minus = parser.normalize(words)
+    tokens = parser.tokenize(phrase)
+
+    groups = []
+    shortcut = ' ' not in phrase or phrase in lexicon.ordinal_words or phrase in lexicon.number_words
+    if shortcut:
+        # one word, or something like '1.5' or '1e3'. `Word2Number.evaluate` has shortcuts for these
+        value = parser.evaluate(phrase)
+        groups.append((tokens, value))
+    else:
+        value = parser.evaluate_tokens(tokens, groups)
+
+    # where the phrase starts and ends, and where the words start after the sign
+    start = len(words) - len(words.lstrip())
+    end = len(words.rstrip())
+    pos = start
+    if minus:
+        lowered = words[start:].lower()
+        if lowered.startswith('-'):
+            pos += 1
+        else:
+            pos += next(len(word) for word in lexicon.negative_words if lowered.startswith(word))
+    spans = dict(zip(map(id, tokens), _locate(words, tokens, lexicon, pos)))
+
+    parsed_groups = []
+    unparsed = []
+    for group, group_value in groups:
+        if not group:
+            continue
+        group_start = spans[id(group[0])][0]
+        group_end = spans[id(group[-1])][1]
+        parsed_groups.append(ParsedGroup(words[group_start: group_end], group_start, group_end, group_value))
+        for token in group:
+            # words like 'a' in 'half a million' aren't number words but they aren't ignored either
+            ignored = token.kind == TokenKind.OTHER and not shortcut and token.word not in lexicon.article_words
+            if group_value is None or ignored:
+                token_start, token_end = spans[id(token)]
+                unparsed.append(ParsedWord(words[token_start: token_end], token_start, token_end))
+
+    kind = _kind(tokens, value, lexicon)
+    return ParseResult(-value if minus and value else value, kind, minus, start, end, tuple(parsed_groups), tuple(unparsed))
@@ -0,0 +1,299 @@
+import atexit
+import os
+import threading
+from decimal import Decimal
+from fractions import Fraction
+
+from . import MISSING, CacheInfo, ConversionCache
+from .lexicon import Lexicon, _locales
+
+# stored with every result and checked on every lookup, so results saved by a version of the library
+# that converts things differently are ignored (and evicted first). Bump it whenever a change to
+# `word_to_num` or `num_to_word` changes the result for any input, or changes what the cache keys mean
+_results_version = 4
+# the most keys to look up in one query. SQLite has a limit on the number of parameters
+_batch_size = 500
+
+_schema = '''
+CREATE TABLE IF NOT EXISTS results (
+    name TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (name, version, key)
+)
+'''
+_decoders = {'i': int, 'f': float, 's': str}
+
+
+def _encode_key(key):
+    # turns a cache key into a string that's the same in every process, or raises TypeError if
+    # the key can't be stored. Strings are repr'd so they can't be mistaken for anything else
+    t = type(key)
+    if t == str or t == int or t == bool or key is None:
+        return repr(key)
+    if t == tuple:
+        return '(' + ', '.join(map(_encode_key, key)) + ')'
+    if t == float or t == Fraction or t == Decimal:
+        return f'{t.__name__}({str(key)!r})'
+    if t == type:
+        return f'{key.__module__}.{key.__qualname__}'
+    if isinstance(key, Lexicon) and _locales.get(key.name) is key:
+        # registered locales are stored by name, so other processes can use the results
+        return f'Lexicon({key.name!r})'
+    raise TypeError(f'{t.__name__} keys can\'t be stored')
+
+
+def _encode_value(value):
+    t = type(value)
+    if t == int:
+        return 'i', str(value)
+    if t == float:
+        return 'f', repr(value)
+    if t == str:
+        return 's', value
+    raise TypeError(f'{t.__name__} results can\'t be stored')
+
+
+class PersistentCache():
+    '''
+    A cache of conversion results stored in an SQLite database, so that results survive restarts
+    and are shared by every process using the same file. It can be used in place of a
+    `ConversionCache`, and `enable_cache(path=...)` turns one on for `word_to_num` and `num_to_word`.
+
+    Recent results are also kept in memory so repeats don't need a query, and new results are
+    written in batches, every `flush_every` results and when the cache is closed. Results that haven't
+    been written yet aren't visible to other processes. Results that can't be stored in the file (like
+    ones for lexicons that aren't registered under their name, see `register_locale`) are only kept in memory.
+
+    Any number of processes and threads can read and write the file at once. Each result is stored
+    with the version of the conversion rules that made it, and results from other versions are ignored.
+
+    Args:
+        path (str or os.PathLike): the database file. It's created if it doesn't exist
+        name (str): the name to store the results under, so several caches can share a file
+        maxsize (int): the most results to keep in the file. The oldest results are evicted first,
+            with results from other versions going before any others
+        memory_size (int): the most results to keep in memory as well
+        policy (str): which result to throw away when the memory is full. See `ConversionCache`
+        flush_every (int): how many new results to hold before writing them to the file
+    '''
+    def __init__(self, path, name='default', maxsize=1_000_000, memory_size=4096, policy='lru', flush_every=256):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        if flush_every < 1:
+            raise ValueError('flush_every must be at least 1')
+        self.path = os.fspath(path)
+        self.name = name
+        self.maxsize = maxsize
+        self.flush_every = flush_every
+        self._memory = ConversionCache(memory_size, policy)
+        self._lock = threading.Lock()
+        self._pending = {}  # encoded key -> encoded value, for results that haven't been written yet
+        self._connection = None
+        self._pid = None
+        # an upper bound on the number of results in the file, so they're only counted when needed
+        self._size = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._connect()
+
+    def _connect(self):
+        # connections can't be shared with a forked process, so each process opens its own
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+        import sqlite3
+
+        # the lock is held whenever the connection is used, so it's safe to share between threads.
+        # Transactions are started by hand so that writes can take the write lock up front
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        # WAL lets readers carry on while another process is writing
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(_schema)
+        self._connection = connection
+        self._pid = os.getpid()
+        self._size = None
+        # so that pending results aren't lost when the program exits
+        atexit.register(self.close)
+        return connection
+
+    def _lookup(self, encoded):
+        # fetches encoded keys from the pending results and the file. Returns encoded key -> result
+        found = {}
+        for key in encoded:
+            if key in self._pending:
+                kind, value = self._pending[key]
+                found[key] = _decoders[kind](value)
+        remaining = [key for key in encoded if key not in found]
+        connection = self._connect()
+        for start in range(0, len(remaining), _batch_size):
+            batch = remaining[start: start + _batch_size]
+            rows = connection.execute(
+                'SELECT key, kind, value FROM results WHERE name = ? AND version = ? AND key IN '
+                f'({", ".join("?" * len(batch))})',
+                (self.name, _results_version, *batch)
+            )
+            for key, kind, value in rows:
+                found[key] = _decoders[kind](value)
+        return found
+
+    def get(self, key, default=MISSING):
+        '''
+        Looks up a result, in memory first and then in the file.
+
+        Args:
+            key: the key to look up
+            default: returned if `key` isn't cached
+
+        Returns:
+            the cached result, or `default`
+        '''
+        value = self._memory.get(key)
+        if value is not MISSING:
+            with self._lock:
+                self._hits += 1
+            return value
+        return self.get_many((key,)).get(key, default)
+
+    def get_many(self, keys):
+        '''
+        Looks up lots of results at once, with as few queries as possible.
+
+        Args:
+            keys (iterable): the keys to look up
+
+        Returns:
+            dict: the keys that were found, mapped to their results
+        '''
+        found = {}
+        encoded = {}
+        misses = 0
+        for key in keys:
+            if key in found:
+                continue
+            value = self._memory.get(key)
+            if value is not MISSING:
+                found[key] = value
+                continue
+            try:
+                encoded[_encode_key(key)] = key
+            except (TypeError, ValueError):
+                # ValueError is for ints too big to turn into a string
+                misses += 1
+
+        with self._lock:
+            hits = len(found)
+            if encoded:
+                for k, value in self._lookup(list(encoded)).items():
+                    found[encoded[k]] = value
+                    self._memory.set(encoded[k], value)
+            self._hits += len(found)
+            self._misses += misses + len(encoded) - (len(found) - hits)
+        return found
+
+    def set(self, key, value):
+        '''
+        Stores a result. It's written to the file with the next batch.
+
+        Args:
+            key: the key to store the result under
+            value: the result
+        '''
+        self.set_many(((key, value),))
+
+    def set_many(self, items):
+        '''
+        Stores lots of results.
+
+        Args:
+            items (iterable): (key, result) pairs
+        '''
+        with self._lock:
+            for key, value in items:
+                self._memory.set(key, value)
+                try:
+                    self._pending[_encode_key(key)] = _encode_value(value)
+                except (TypeError, ValueError):
+                    pass
+            if len(self._pending) >= self.flush_every:
+                self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        connection = self._connect()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.executemany(
+                'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                [(self.name, _results_version, k, kind, v) for k, (kind, v) in self._pending.items()]
+            )
+            if self._size is not None:
+                self._size += len(self._pending)
+            if self._size is None or self._size > self.maxsize:
+                self._size = connection.execute(
+                    'SELECT COUNT(*) FROM results WHERE name = ?', (self.name,)
+                ).fetchone()[0]
+            if self._size > self.maxsize:
+                # results from other versions sort first because `version = ?` is 0 for them
+                evicted = connection.execute(
+                    'DELETE FROM results WHERE rowid IN (SELECT rowid FROM results WHERE name = ? '
+                    'ORDER BY version = ?, rowid LIMIT ?)',
+                    (self.name, _results_version, self._size - self.maxsize)
+                ).rowcount
+                self._evictions += evicted
+                self._size -= evicted
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        self._pending.clear()
+
+    def flush(self):
+        '''Writes any results that haven't been written to the file yet'''
+        with self._lock:
+            self._flush()
+
+    def clear(self):
+        '''
+        Throws away every result, in memory and in the file, and resets the statistics.
+        This clears the results for every process using the file
+        '''
+        with self._lock:
+            self._pending.clear()
+            self._memory.clear()
+            self._connect().execute('DELETE FROM results WHERE name = ?', (self.name,))
+            self._size = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self):
+        '''
+        Writes any pending results and returns the cache's statistics. The hits, misses and
+        evictions are for this process only but the size counts every result in the file
+
+        Returns:
+            CacheInfo: the cache's current statistics
+        '''
+        with self._lock:
+            self._flush()
+            size = self._connect().execute(
+                'SELECT COUNT(*) FROM results WHERE name = ? AND version = ?', (self.name, _results_version)
+            ).fetchone()[0]
+            return CacheInfo(self._hits, self._misses, self._evictions, size, self.maxsize)
+
+    def close(self):
+        '''Writes any pending results and closes the file. It's opened again if the cache is used after this'''
+        atexit.unregister(self.close)
+        with self._lock:
+            if self._connection is None:
+                return
+            if self._pid == os.getpid():
+                self._flush()
+                self._connection.close()
+            self._connection = None
+
+    def __len__(self):
+        return self.info().size
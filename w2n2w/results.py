@@ -0,0 +1,230 @@
+from array import array
+from itertools import islice
+
+from . import MISSING, word_to_num_many
+
+# the range of an array('q')
+_int64_min = -2**63
+_int64_max = 2**63 - 1
+# how many phrases `word_to_num_compact` converts at a time
+_batch_size = 10_000
+
+
+class CompactResults():
+    '''
+    The results of a bulk conversion, stored in typed buffers instead of a list of Python objects.
+    Each result takes 8 bytes (16 once there are any floats) and two bits, rather than the 30-40 bytes
+    a list of ints or floats needs.
+
+    Every buffer has one slot (or bit) per result and supports the buffer protocol, so they can be
+    written straight to a file or wrapped by NumPy without copying:
+
+    ```python
+    ints = numpy.frombuffer(results.ints, dtype=numpy.int64)
+    failed = numpy.unpackbits(numpy.frombuffer(results.failures, dtype=numpy.uint8), bitorder='little')
+    ```
+
+    Results can't be appended while something is using one of the buffers like that.
+
+    Attributes:
+        ints (array.array): the int results (typecode 'q', so int64). Rows that aren't ints are 0
+        floats (array.array or None): the float results (typecode 'd'). Rows that aren't floats are NaN.
+            This is None until the first float is added
+        failures (bytearray): a bitmask of the rows that failed. Row i is bit `i % 8` of byte `i // 8`
+        float_mask (bytearray): a bitmask of the rows that are floats, laid out the same way
+        overflow (dict): ints too big (or small) for int64, keyed by row. Their slot in `ints` is 0,
+            so check here before using `ints` on its own if you're working with huge numbers
+    '''
+    def __init__(self, values=()):
+        self.ints = array('q')
+        self.floats = None
+        self.failures = bytearray()
+        self.float_mask = bytearray()
+        self.overflow = {}
+        self.extend(values)
+
+    def __len__(self):
+        return len(self.ints)
+
+    def __repr__(self):
+        return f'<CompactResults of {len(self)}, {self.failure_count()} failed>'
+
+    def _next_row(self, value):
+        # adds `value` to `ints`, makes room in the bitmasks for the new row and returns its index.
+        # If a buffer can't grow (eg: something has a memoryview of it) then the ones that already have
+        # are shrunk again, so every buffer always has the same number of rows
+        index = len(self.ints)
+        self.ints.append(value)
+        if not index & 7:
+            try:
+                self.failures.append(0)
+                try:
+                    self.float_mask.append(0)
+                except BaseException:
+                    self.failures.pop()
+                    raise
+            except BaseException:
+                self.ints.pop()
+                raise
+        return index
+
+    def _drop_row(self, index):
+        # undoes `_next_row`
+        self.ints.pop()
+        if not index & 7:
+            self.failures.pop()
+            self.float_mask.pop()
+
+    def _next_float(self, index, value):
+        # adds `value` to `floats` for the row `_next_row` just added, or drops the row if it can't
+        try:
+            if self.floats is None:
+                self.floats = array('d', [float('nan')]) * index
+            self.floats.append(value)
+        except BaseException:
+            self._drop_row(index)
+            raise
+
+    def _row(self, index):
+        # turns a row index (which can be negative) into a position in the buffers
+        if isinstance(index, slice):
+            raise TypeError('CompactResults indices must be integers')
+        return range(len(self))[index]
+
+    def append(self, value):
+        '''
+        Adds a result.
+
+        Args:
+            value (int or float): the result
+
+        Raises:
+            TypeError: if `value` isn't an int or float
+        '''
+        t = type(value)
+        if t not in (int, float):
+            raise TypeError('value must be int or float')
+        if t == float:
+            index = self._next_row(0)
+            self._next_float(index, value)
+            self.float_mask[index >> 3] |= 1 << (index & 7)
+            return
+
+        fits = _int64_min <= value <= _int64_max
+        index = self._next_row(value if fits else 0)
+        if self.floats is not None:
+            self._next_float(index, float('nan'))
+        if not fits:
+            self.overflow[index] = value
+
+    def append_failure(self):
+        '''Adds a row for a value that couldn't be converted'''
+        index = self._next_row(0)
+        if self.floats is not None:
+            self._next_float(index, float('nan'))
+        self.failures[index >> 3] |= 1 << (index & 7)
+
+    def extend(self, values):
+        '''
+        Adds lots of results. None is added as a failure.
+
+        Args:
+            values (iterable of int, float or None): the results
+        '''
+        for value in values:
+            if value is None:
+                self.append_failure()
+            else:
+                self.append(value)
+
+    def failed(self, index):
+        '''
+        Args:
+            index (int): the row
+
+        Returns:
+            bool: whether the row failed
+
+        Raises:
+            TypeError: if `index` isn't an int
+        '''
+        index = self._row(index)
+        return bool(self.failures[index >> 3] & 1 << (index & 7))
+
+    def failure_count(self):
+        '''
+        Returns:
+            int: how many rows failed
+        '''
+        return sum(bin(i).count('1') for i in self.failures)
+
+    def __getitem__(self, index):
+        '''
+        Gets the result for a row. Ints that didn't fit in int64 come from `overflow`.
+
+        Args:
+            index (int): the row. Slices aren't supported, use `tolist` instead
+
+        Returns:
+            int, float or None: the result, or None if the row failed
+
+        Raises:
+            TypeError: if `index` isn't an int
+        '''
+        index = self._row(index)
+        byte, bit = index >> 3, 1 << (index & 7)
+        if self.failures[byte] & bit:
+            return None
+        if self.float_mask[byte] & bit:
+            return self.floats[index]
+        if self.overflow and index in self.overflow:
+            return self.overflow[index]
+        return self.ints[index]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def tolist(self):
+        '''
+        Returns:
+            list: the results as Python objects, with None for rows that failed
+        '''
+        return list(self)
+
+    @property
+    def nbytes(self):
+        '''The number of bytes used by the buffers, not counting `overflow`'''
+        size = len(self.ints) * self.ints.itemsize + len(self.failures) + len(self.float_mask)
+        if self.floats is not None:
+            size += len(self.floats) * self.floats.itemsize
+        return size
+
+
+def word_to_num_compact(words, locale=None):
+    '''
+    Converts many phrases into numbers like `word_to_num_many`, but stores the results in a
+    `CompactResults` rather than a list. Phrases that can't be converted are marked as failures.
+    Phrases are converted in batches so the full list of results is never held as Python objects.
+
+    Args:
+        words (iterable of str): the phrases to convert
+        locale (str or Lexicon): the language the phrases are in. See `word_to_num`
+
+    Returns:
+        CompactResults: the results, in the same order as `words`
+
+    Raises:
+        ValueError: if `locale` doesn't exist
+    '''
+    results = CompactResults()
+    words = iter(words)
+    while True:
+        batch = list(islice(words, _batch_size))
+        if not batch:
+            return results
+        for value in word_to_num_many(batch, errors='default', default=MISSING, locale=locale):
+            if value is MISSING:
+                results.append_failure()
+            else:
+                results.append(value)
@@ -0,0 +1,161 @@
+import re
+
+from . import TokenKind, Word2Number, _evaluate, _lexicon, decimal_words
+
+# the classes of word the scanner cares about
+_NUMBER = 'number'  # any number word that isn't in `decimal_words`
+_DECIMAL = 'decimal'  # a word in `decimal_words`. These can come after a decimal point
+_DIGITS = 'digits'
+_POINT = 'point'
+_JOIN = 'join'  # 'and' or 'of'
+_ARTICLE = 'article'  # 'a', as in 'a hundred' or 'half a million'
+_SIGN = 'sign'
+
+_word_classes = {
+    **{
+        word: _DECIMAL if word in decimal_words else _NUMBER
+        for word, (kind, _, _) in _lexicon.items() if kind in TokenKind.numbers
+    },
+    'and': _JOIN,
+    'of': _JOIN,
+    'point': _POINT,
+    '.': _POINT,
+    'a': _ARTICLE,
+    'negative': _SIGN,
+    'minus': _SIGN
+}
+
+# The automaton. Each state maps the class of the next word to the state to move to.
+# Anything not listed ends the current span and the word is looked at again from 'out'.
+# The 'in_...' states are inside a span, 'out_...' states are outside of one, and the
+# words seen since the last 'in' state (eg: the 'and' in 'in_join') only join the span
+# if the automaton makes it back to an 'in' state.
+_in = {_NUMBER: 'in', _DECIMAL: 'in', _DIGITS: 'in_digits', _POINT: 'in_point', _JOIN: 'in_join', _ARTICLE: 'in_a'}
+_transitions = {
+    'out': {_NUMBER: 'in', _DECIMAL: 'in', _DIGITS: 'in_digits', _POINT: 'out_point', _ARTICLE: 'out_a', _SIGN: 'out_sign'},
+    'out_sign': {_NUMBER: 'in', _DECIMAL: 'in', _DIGITS: 'in_digits', _POINT: 'out_point', _ARTICLE: 'out_a'},
+    'out_a': {_NUMBER: 'in', _DECIMAL: 'in'},
+    'out_point': {_DECIMAL: 'decimal', _DIGITS: 'decimal'},
+    'in': _in,
+    # two numbers in a row like '1990 2020' are two separate numbers,
+    # and 'a' only joins word numbers together, as in 'half a million'
+    'in_digits': {k: v for k, v in _in.items() if k not in (_DIGITS, _ARTICLE)},
+    'in_join': {_NUMBER: 'in', _DECIMAL: 'in', _DIGITS: 'in_digits', _ARTICLE: 'in_a'},
+    'in_a': {_NUMBER: 'in', _DECIMAL: 'in'},
+    'in_point': {_DECIMAL: 'decimal', _DIGITS: 'decimal'},
+    'decimal': {_DECIMAL: 'decimal', _DIGITS: 'decimal'}
+}
+# the states where the words seen so far make up a complete number
+_accepting = ('in', 'in_digits', 'decimal')
+
+# words are runs of letters and digits. Other punctuation is kept as a word of its own so
+# that it breaks up spans, apart from hyphens which join words like 'twenty-five'
+_text_pattern = re.compile(r'[^\W_]+|[^\w\s-]')
+
+
+def _classify(text, match):
+    word = match.group().lower()
+    cls = _word_classes.get(word)
+    if cls is None:
+        return _DIGITS if word.isdecimal() else None
+    if word == '.':
+        # only a decimal point if it's in the middle of something, like '1.5'.
+        # Otherwise it's a full stop
+        start, end = match.span()
+        if not (0 < start and end < len(text) and text[start - 1].isalnum() and text[end].isalnum()):
+            return None
+    return cls
+
+
+def _evaluate_span(text):
+    # the same as `word_to_num(text)` but returns None instead of raising ValueError
+    words, minus = Word2Number.normalize(text)
+    try:
+        value = _evaluate(words)
+    except ValueError:
+        return None
+    return -value if minus and value else value
+
+
+def find_numbers(text):
+    '''
+    Finds every number phrase in a piece of text, in a single pass.
+
+    Args:
+        text (str): the text to search
+
+    Yields:
+        tuple: (start, end, value) for each number found, where `text[start:end]` is
+            the phrase and `value` is what `word_to_num` converts it to
+
+    Raises:
+        TypeError: if `text` is not a string
+
+    Example:
+        ```python
+        print(list(find_numbers('I owe you twenty-five pounds and a half, not 1.5')))
+        # [(10, 21, 25), (33, 39, 0.5), (45, 48, 1.5)]
+        ```
+    '''
+    if type(text) != str:
+        raise TypeError('text must be a string')
+    yield from _scan(text)
+
+
+def _scan(text, final=True):
+    # the body of `find_numbers`. If `final` is False then `text` is only the start of something longer,
+    # so the last word might not be complete and the last span might carry on past the end.
+    # Neither is yielded, and the generator returns where the undecided text starts instead.
+    # Everything before that point is independent of what comes after it, so the rest can be
+    # scanned again once there's more of it, starting from there. Spans after that point may
+    # still be yielded, so whoever is reading them needs to ignore those
+    state = 'out'
+    start = None  # where the current span starts
+    end = None  # where the last word we know is part of the span ends
+    pending = None  # where the words since the last accepting state start
+    safe = 0  # where the undecided text starts
+    previous = 0  # where the last word ends
+
+    for match in _text_pattern.finditer(text):
+        if not final:
+            # we can start again from here if no span is open and there's a gap before this word.
+            # Without the gap, a '.' wouldn't be able to see what comes before it
+            if state == 'out' and start is None and match.start() > previous:
+                safe = match.start()
+            if match.end() == len(text):
+                return safe
+            previous = match.end()
+
+        cls = _classify(text, match)
+        next_state = _transitions[state].get(cls)
+        if next_state is None:
+            if start is not None:
+                value = _evaluate_span(text[start: end])
+                if value is not None:
+                    yield start, end, value
+            start = end = pending = None
+            # look at this word again from the top
+            next_state = _transitions['out'].get(cls, 'out')
+
+        if next_state in _accepting:
+            if start is None:
+                start = match.start() if pending is None else pending
+            end = match.end()
+            pending = None
+        elif next_state != 'out' and pending is None:
+            pending = match.start()
+        elif next_state == 'out':
+            pending = None
+        state = next_state
+
+    if not final:
+        if state == 'out' and start is None:
+            # every word was decided and the last one was followed by a gap
+            return len(text)
+        return safe
+
+    if start is not None:
+        value = _evaluate_span(text[start: end])
+        if value is not None:
+            yield start, end, value
+    return len(text)
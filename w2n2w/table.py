@@ -0,0 +1,157 @@
+from . import Word2Number, _chunk_to_word, _num_to_word, _words_backwards, ordinal_words
+
+# the most numbers a table can cover. Everything below this has at most 2 groups of 3 digits
+_max_limit = 1_000_000
+
+
+def _evaluate(words):
+    # `Word2Number.evaluate` without looking in the phrase table, which might be the one being built.
+    # Single words never get as far as the table
+    if ' ' not in words:
+        return Word2Number.evaluate(words)
+    return Word2Number.evaluate_tokens(Word2Number.tokenize(words))
+
+
+def _ordinal(words):
+    # the ordinal of a number's words, eg: 'twenty three' -> 'twenty third'
+    head, _, last = words.rpartition(' ')
+    ordinal = _ordinals.get(last)
+    if ordinal is None:
+        return None
+    return head + ' ' + ordinal if head else ordinal
+
+
+# the ordinal of each cardinal, eg: 'three' -> 'third'. Later ordinals win, so 'forty' -> 'fortieth'
+_ordinals = {_words_backwards[v]: k for k, v in ordinal_words.items() if v in _words_backwards}
+
+
+def _spellings(words):
+    # the ways a group of words is written: as `num_to_word` writes it, without any 'and's,
+    # and the ordinals of both
+    plain = words.replace(' and ', ' ')
+    for spelling in (words, plain, _ordinal(words), _ordinal(plain)):
+        if spelling:
+            yield spelling
+
+
+class PhraseTable():
+    '''
+    Looks up the words for every whole number below `limit` (and every phrase for one) without
+    parsing anything. `enable_phrase_table` turns one on for `word_to_num` and `num_to_word`.
+
+    Rather than storing every phrase, the table is split up by groups of 3 digits. A phrase is
+    the words for its thousands, 'thousand', an optional 'and', and the words for the rest. Each of those
+    parts only has 1000 values, so a table of a million numbers stores around 13,000 short phrases
+    (a couple of MB) rather than millions. The phrases for each part are what `num_to_word` says, the same without 'and',
+    and the ordinals of both, eg: 'one hundred and twenty third'. Phrases are looked up after
+    `Word2Number.normalize`, so hyphens and capitals don't need phrases of their own.
+
+    Every value comes from `Word2Number.evaluate`, so the table always gives the same answers.
+    Phrases that the table can't split up are left for `word_to_num` to parse as usual.
+
+    The tables are built the first time they're used, which takes around 100ms.
+
+    Args:
+        limit (int): the numbers covered are 0 to `limit - 1`. At most 1,000,000
+    '''
+    def __init__(self, limit=_max_limit):
+        if type(limit) != int or not 0 < limit <= _max_limit:
+            raise ValueError(f'limit must be an int between 1 and {_max_limit:,}')
+        self.limit = limit
+        self._tables = None
+
+    def _build(self):
+        # like `columns._word_tables`, only assigned once complete so other threads never see half a table
+        evaluate = _evaluate
+        chunks = [_chunk_to_word(str(i)) for i in range(1000)]
+
+        # phrases below 1000 are stored whole
+        whole = {}
+        for i in range(min(self.limit, 1000)):
+            for spelling in _spellings(_num_to_word(i, False)):
+                whole[spelling] = evaluate(spelling)
+
+        # the words before 'thousand', and after it, with and without an 'and'. Ordinals are only allowed
+        # after it. `Word2Number.evaluate_tokens` adds up the value of each group, so the value is always
+        # thousands * 1000 + the rest, even for ordinals that don't come out as whole numbers, like
+        # 'one hundred and fifth'. Each part is checked against a whole phrase to make sure
+        thousands = {}
+        rest = {}
+        if self.limit > 1000:
+            for i in range(1, 1000):
+                for spelling in (chunks[i], chunks[i].replace(' and ', ' ')):
+                    if evaluate(spelling + ' thousand') == i * 1000:
+                        thousands[spelling] = i
+                for spelling in _spellings(chunks[i]):
+                    for joined in (spelling, 'and ' + spelling):
+                        value = Word2Number.evaluate_chunk(Word2Number.tokenize(joined), True, True, False)
+                        whole_value = evaluate('one thousand ' + joined)
+                        if 1000 + value == whole_value and type(1000 + value) == type(whole_value):
+                            rest[joined] = value
+
+        # the words for each number. `num_to_word` joins the last group on with an 'and' if none of
+        # the groups has one already (see `_num_to_word`)
+        and_free = [' and ' not in words for words in chunks]
+        self._tables = (whole, thousands, rest, chunks, and_free)
+        return self._tables
+
+    def __len__(self):
+        '''The number of phrases stored'''
+        tables = self._tables or self._build()
+        return len(tables[0]) + len(tables[1]) + len(tables[2])
+
+    def word_to_num(self, words):
+        '''
+        Looks up a phrase.
+
+        Args:
+            words (str): a phrase that has been through `Word2Number.normalize`
+
+        Returns:
+            int or float: the value, the same as `Word2Number.evaluate` gives, or None if it's not in the table
+        '''
+        whole, thousands, rest, _, _ = self._tables or self._build()
+        high, sep, low = words.partition(' thousand')
+        if not sep:
+            return whole.get(words)
+
+        value = thousands.get(high)
+        if value is None:
+            return None
+        value *= 1000
+        if low:
+            # ' thousandth' and ' thousands' need parsing
+            if low[0] != ' ':
+                return None
+            low = rest.get(low[1:])
+            if low is None:
+                return None
+            value += low
+        return value if value < self.limit else None
+
+    def num_to_word(self, num):
+        '''
+        Looks up the words for a number.
+
+        Args:
+            num (int): the number
+
+        Returns:
+            str: the words, the same as `num_to_word` gives, or None if `num` isn't in the table
+        '''
+        magnitude = -num if num < 0 else num
+        if magnitude >= self.limit:
+            return None
+        words = _words_backwards.get(magnitude)
+        if words is None:
+            _, _, _, chunks, and_free = self._tables or self._build()
+            high, low = divmod(magnitude, 1000)
+            if not high:
+                words = chunks[low]
+            elif not low:
+                words = chunks[high] + ' thousand'
+            elif and_free[high] and and_free[low]:
+                words = chunks[high] + ' thousand and ' + chunks[low]
+            else:
+                words = chunks[high] + ' thousand ' + chunks[low]
+        return 'negative ' + words if num < 0 else words